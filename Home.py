@@ -1,25 +1,57 @@
+import os
 import sys
-from PyQt5 import QtCore, QtGui, QtWidgets
+import time
+from PyQt5 import QtCore, QtWidgets
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QPushButton, QLabel, QFrame, QSplitter,
                             QToolBar, QAction, QGroupBox, QMenu, QLineEdit,
                             QComboBox, QSizePolicy, QMessageBox, QTextEdit, QScrollArea,
-                            QTabWidget, QStackedWidget)
-from PyQt5.QtGui import QIcon, QFont
-from PyQt5.QtCore import Qt, QSize
-
-# Import all specific Project Details Dialog UIs
-from ProjectDetails_BridgeANDTrafficData_Window import Ui_BridgeTraffic_Dialog
-from ProjectDetails_Foundation_Window import Ui_Foundation_Dialog
-from ProjectDetails_CarbonEmissionData_Window import Ui_CarbonEmission_Dialog
-from ProjectDetails_DemolitionANDRecyclingData_Window import Ui_Demolition_Dialog
-from ProjectDetails_FinancialData_Window import Ui_FinancialData_Dialog
-from ProjectDetails_MaintenanceANDRepairData_Window import Ui_Maintenance_Dialog
-from ProjectDetails_Miscellaneous_Window import Ui_Miscellaneous_Dialog
-from ProjectDetails_SubStructure_Window import Ui_SubStructure_Dialog
-from ProjectDetails_SuperStructure_Window import Ui_SuperStructure_Dialog
+                            QTabWidget, QStackedWidget, QFileDialog, QDialog, QListWidget,
+                            QListWidgetItem, QInputDialog, QProgressDialog)
+from PyQt5.QtGui import QFont, QKeySequence
+from PyQt5.QtCore import Qt, QSize, QTimer
+
+# Project Details dialogs are imported and built on demand
+from dialog_registry import DialogPool
+import autosave
+from dirty_tracking import DirtyTracker
+import field_bindings
+import form_data_storage
+import icon_resources
+import tracing
+from undo_stack import UndoStack
+
+# Stylesheet of the custom window tab bar, applied once to its container. A tab's look
+# follows its "active" dynamic property, so switching tabs only re-polishes the buttons.
+WINDOW_TABS_STYLE = """
+    QWidget {
+        background-color: white;
+        border-bottom: 1px solid #e0e0e0;
+    }
+    QPushButton {
+        background-color: #f0f0f0;
+        border: 1px solid #cccccc;
+        border-bottom: none;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+        padding: 5px 15px;
+        margin: 0px 2px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #e8e8e8;
+    }
+    QPushButton[active="true"] {
+        background-color: white;
+        border-bottom: 1px solid white;
+    }
+    QPushButton[active="true"]:hover {
+        background-color: white;
+    }
+"""
 
 class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
+    @tracing.traced("MainWindow.__init__")
     def __init__(self):
         super().__init__()
         self.setWindowTitle("<untitled draft> - BICCA Studio 1.0.0")
@@ -62,6 +94,13 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
             }
         ]
 
+        # Built Project Details dialogs, kept so reopening one is instant and keeps its values
+        self.dialog_pool = DialogPool(self)
+
+        # Every field edit goes straight into the project model and the autosave journal
+        self.journal = autosave.Journal()
+        self.undo_stack = UndoStack(self.apply_model_value)
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
@@ -92,6 +131,29 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.pushButton.clicked.connect(lambda: self.toggle_sub_buttons_visibility(self.gridLayout_3, self.pushButton))
         self.pushButton_7.clicked.connect(lambda: self.toggle_sub_buttons_visibility(self.gridLayout_4, self.pushButton_7))
 
+        # File menu: project files and their version history
+        self.project_path = None
+        self.dirty = DirtyTracker() # Sections edited since the last save / version
+        self.save_cache = None # project_file.SaveCache, created on the first save
+        self.live_results = None # results.LiveResults, created when results are first shown
+        self.results_refresh_pending = False
+        form_data_storage.subscribe(self.model_changed)
+        self.actionOpen.triggered.connect(self.open_project)
+        self.actionSave.triggered.connect(self.save_project)
+        self.actionSave_As.triggered.connect(self.save_project_as)
+        self.actionCreate_a_Copy.triggered.connect(self.create_project_copy)
+        self.actionVersion_History.triggered.connect(self.show_version_history)
+        self.actionImport_BOQ.triggered.connect(self.import_bill_of_quantities)
+        self.actionUndo.triggered.connect(self.undo_stack.undo)
+        self.actionRedo.triggered.connect(self.undo_stack.redo)
+
+        for widget, path in self.general_info_fields():
+            field_bindings.change_signal(widget).connect(
+                lambda _=None, widget=widget, path=path: self.field_changed(path, field_bindings.widget_value(widget)))
+        self.recover_autosave()
+        self.journal.start()
+        QApplication.instance().aboutToQuit.connect(self.journal.close)
+
         # Initially hide the collapsible sub-sections' content
         self.gridLayout_3_widget.setVisible(False) # Hide the widget holding gridLayout_3
         self.gridLayout_4_widget.setVisible(False) # Hide the widget holding gridLayout_4
@@ -102,61 +164,284 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.toggle_outputs_group_content(self.outputsGroup, self.outputsGroup.isChecked())
 
 
+    def closeEvent(self, event):
+        """Stops listening to the project and writes the rest of the autosave journal."""
+        form_data_storage.unsubscribe(self.model_changed)
+        if self.live_results is not None:
+            self.live_results.close()
+        self.journal.close()
+        super().closeEvent(event)
+
     # Methods to open Project Details sub-windows
-    def openBridgeTrafficWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_BridgeTraffic_Dialog()
-        self.ui.setupUi(self.window)
+    def open_project_dialog(self, name):
+        """Shows the named Project Details dialog, reusing it from the pool if it was opened before."""
+        built = name not in self.dialog_pool
+        with tracing.span(f"open{name}Window", reused=not built):
+            self.window, self.ui = self.dialog_pool.acquire(name)
+            if built:
+                if name in field_bindings.STRUCTURE_LAYOUTS:
+                    import material_grid
+                    material_grid.install(self.ui, name)
+                field_bindings.show(self.ui, name, form_data_storage.project)
+                field_bindings.connect(self.ui, name, self.field_changed)
+                self.window.addActions([self.actionUndo, self.actionRedo])
         self.window.exec_()
 
+    def openBridgeTrafficWindow(self):
+        self.open_project_dialog("BridgeTraffic")
+
     def openFoundationWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_Foundation_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("Foundation")
 
     def openCarbonEmissionWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_CarbonEmission_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("CarbonEmission")
 
     def openDemolitionWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_Demolition_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
-    
+        self.open_project_dialog("Demolition")
+
     def openFinancialWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_FinancialData_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("Financial")
 
     def openMaintenanceWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_Maintenance_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("Maintenance")
 
     def openMiscellaneousWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_Miscellaneous_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("Miscellaneous")
 
-    def openSubStructureWindow(self):   
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_SubStructure_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+    def openSubStructureWindow(self):
+        self.open_project_dialog("SubStructure")
 
     def openSuperStructureWindow(self):
-        self.window = QtWidgets.QDialog(self)
-        self.ui = Ui_SuperStructure_Dialog()
-        self.ui.setupUi(self.window)
-        self.window.exec_()
+        self.open_project_dialog("SuperStructure")
+
+    # Project files (File -> Open / Save / Save As / Create a Copy)
+    def general_info_fields(self):
+        """Pairs of General Information widgets and the project model field each one edits."""
+        return (
+            (self.lineEdit_company_name, "general.company_name"),
+            (self.lineEdit_project_title, "general.project_title"),
+            (self.textEdit_project_description, "general.project_description"),
+            (self.lineEdit_valuer_name, "general.valuer_name"),
+            (self.lineEdit_job_number, "general.job_number"),
+            (self.lineEdit_client, "general.client"),
+            (self.comboBox_country, "general.country"),
+            (self.lineEdit_base_year, "general.base_year"),
+        )
+
+    def show_general_info(self):
+        for widget, path in self.general_info_fields():
+            field_bindings.set_widget_value(widget, form_data_storage.project.get(path))
+
+    def field_changed(self, path, value, field=None):
+        before = form_data_storage.project.get(path)
+        form_data_storage.set_value(path, value)
+        self.undo_stack.push(path, before, form_data_storage.project.get(path), field)
+
+    def model_changed(self, path, value):
+        """Store callback: journals every edit and marks its section dirty."""
+        if path is None:
+            return # A replaced project is journaled and marked by whoever replaced it
+        self.journal.record(path, value)
+        self.dirty.mark(path)
+
+    def apply_model_value(self, path, value):
+        """Puts a value from the undo history back into the model and every widget showing it."""
+        form_data_storage.set_value(path, value)
+        self.show_model_path(path)
+
+    def show_model_path(self, path):
+        """Refreshes every widget showing a model path that was changed outside of it."""
+        value = form_data_storage.project.get(path)
+        for widget, widget_path in self.general_info_fields():
+            if widget_path == path:
+                field_bindings.set_widget_value(widget, value)
+        for name in field_bindings.dialogs_for(path):
+            entry = self.dialog_pool.get(name)
+            if entry is not None:
+                field_bindings.show_path(entry[1], name, form_data_storage.project, path)
+
+    def recover_autosave(self):
+        """Replays the autosave journal of a session that ended without saving."""
+        base, entries = self.journal.read()
+        if base is None and not entries:
+            return
+        if base:
+            import project_file
+            try:
+                form_data_storage.set_project(project_file.load(base))
+                self.set_project_path(base)
+            except (OSError, project_file.ProjectFileError):
+                base = None
+        count = autosave.apply(entries, form_data_storage.project)
+        self.journal.compact(base, [(path, form_data_storage.project.get(path)) for path in dict(entries)])
+        self.show_general_info()
+        if count:
+            self.statusBar.showMessage(f"Recovered {count} unsaved changes", 10000)
+
+    def choose_project_file(self, caption, save):
+        file_filter = "BICCA Projects (*.bicca)"
+        if not save:
+            return QFileDialog.getOpenFileName(self, caption, self.project_path or "", file_filter)[0]
+        path = QFileDialog.getSaveFileName(self, caption, self.project_path or "", file_filter)[0]
+        if path and not path.endswith(".bicca"):
+            path += ".bicca"
+        return path
+
+    def set_project_path(self, path):
+        self.project_path = path
+        self.dirty.mark_all(("versions",)) # The version store is kept per file
+        self.setWindowTitle(f"{os.path.basename(path)} - BICCA Studio 1.0.0")
+
+    def open_project(self):
+        import project_file  # pulls in NumPy, so it is only imported when a file is opened or saved
+        path = self.choose_project_file("Open Project", save=False)
+        if not path:
+            return
+        try:
+            project = project_file.load(path)
+        except (OSError, project_file.ProjectFileError) as error:
+            QMessageBox.critical(self, "Open Project", f"Could not open {path}:\n{error}")
+            return
+        self.replace_project(project)
+        self.set_project_path(path)
+        self.journal.reset(path, form_data_storage.project)
+
+    def replace_project(self, project):
+        form_data_storage.set_project(project)
+        self.dialog_pool.clear() # Pooled dialogs still show the previous project
+        self.show_general_info()
+        self.dirty.mark_all()
+        self.save_cache = None
+        self.undo_stack.clear()
+
+    def write_project(self, path):
+        import project_file
+        if self.save_cache is None:
+            self.save_cache = project_file.SaveCache()
+        try:
+            project_file.save(form_data_storage.project, path, self.save_cache, self.dirty.dirty("save"))
+        except OSError as error:
+            QMessageBox.critical(self, "Save Project", f"Could not save {path}:\n{error}")
+            return False
+        self.statusBar.showMessage(f"Saved {path}", 5000)
+        return True
+
+    def save_project(self):
+        if self.project_path is None:
+            self.save_project_as()
+        elif self.write_project(self.project_path):
+            self.dirty.clear("save")
+            self.journal.reset(self.project_path, form_data_storage.project) # Saved changes no longer need replaying
+
+    def save_project_as(self):
+        path = self.choose_project_file("Save Project As", save=True)
+        if path and self.write_project(path):
+            self.dirty.clear("save")
+            self.set_project_path(path)
+            self.journal.reset(path, form_data_storage.project)
+
+    def version_store(self):
+        import version_store
+        if self.project_path:
+            return version_store.VersionStore.for_project(self.project_path)
+        return version_store.VersionStore(os.path.join(autosave.JOURNAL_DIR, "versions"))
+
+    def show_version_history(self):
+        """Lists the saved versions of the project and saves or restores them."""
+        store = self.version_store()
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Version History")
+        dialog.resize(480, 400)
+        layout = QVBoxLayout(dialog)
+        version_list = QListWidget()
+        layout.addWidget(version_list)
+        label_edit = QLineEdit()
+        label_edit.setPlaceholderText("Describe this version (optional)")
+        layout.addWidget(label_edit)
+        buttons = QHBoxLayout()
+        save_button = QPushButton("Save Version")
+        restore_button = QPushButton("Restore")
+        close_button = QPushButton("Close")
+        for button in (save_button, restore_button, close_button):
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+
+        def fill():
+            version_list.clear()
+            for version in reversed(store.versions()):
+                stamp = time.strftime("%d %b %Y %H:%M:%S", time.localtime(version["time"]))
+                item = QListWidgetItem(f"{version['id']:>4}   {stamp}   {version['label']}")
+                item.setData(Qt.UserRole, version["id"])
+                version_list.addItem(item)
+            restore_button.setEnabled(version_list.count() > 0)
+
+        def save_version():
+            store.commit(form_data_storage.project, label_edit.text(), changed=self.dirty.dirty("versions"))
+            self.dirty.clear("versions")
+            label_edit.clear()
+            fill()
+
+        def restore_version():
+            item = version_list.currentItem() or version_list.item(0)
+            project = store.restore(item.data(Qt.UserRole))
+            self.replace_project(project)
+            for path in project.paths(): # The restored state is unsaved, so journal all of it
+                self.journal.record(path, project.get(path))
+            self.statusBar.showMessage(f"Restored version {item.data(Qt.UserRole)}", 5000)
+            dialog.accept()
+
+        save_button.clicked.connect(save_version)
+        restore_button.clicked.connect(restore_version)
+        close_button.clicked.connect(dialog.reject)
+        fill()
+        dialog.exec_()
+
+    def import_bill_of_quantities(self):
+        """Reads a CSV / Excel bill of quantities into one of the Structure Works parts."""
+        import boq_import
+        parts = {label: path for name, (path, label) in field_bindings.STRUCTURE_LAYOUTS.items()
+                 if path.startswith("structure.")}
+        label, accepted = QInputDialog.getItem(self, "Import Bill of Quantities", "Import into:", list(parts), 0, False)
+        if not accepted:
+            return
+        path = QFileDialog.getOpenFileName(self, "Import Bill of Quantities", os.path.dirname(self.project_path or ""),
+                                           "Bills of Quantities (*.csv *.xlsx);;All Files (*)")[0]
+        if not path:
+            return
 
+        importer = boq_import.BoqImporter(path)
+        progress = QProgressDialog(f"Importing {os.path.basename(path)}...", "Cancel", 0, 1000, self)
+        progress.setWindowTitle("Import Bill of Quantities")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        try:
+            for fraction in importer.chunks():
+                progress.setValue(int(fraction * 1000)) # Also processes events while the dialog is modal
+                progress.setLabelText(f"Importing {os.path.basename(path)}... {importer.rows:,} rows")
+                if progress.wasCanceled():
+                    self.statusBar.showMessage("Import cancelled; the bill of quantities was not changed", 5000)
+                    return
+        except (OSError, UnicodeDecodeError, boq_import.BoqImportError) as error:
+            QMessageBox.critical(self, "Import Bill of Quantities", f"Could not import {path}:\n{error}")
+            return
+        finally:
+            progress.close()
+
+        with self.undo_stack.group(): # One undo step however many rows came in
+            self.field_changed(parts[label], importer.components, "import")
+        self.show_model_path(parts[label])
+        message = f"Imported {importer.rows:,} rows into {label}"
+        if importer.skipped:
+            message += f" ({importer.skipped:,} rows without a material or a numeric quantity skipped)"
+        self.statusBar.showMessage(message, 10000)
+
+    def create_project_copy(self):
+        # The copy is written but the window stays on the current file
+        path = self.choose_project_file("Create a Copy", save=True)
+        if path:
+            self.write_project(path)
+
+    @tracing.traced()
     def create_menu_bar(self):
         menubar = self.menuBar()
         menubar.setStyleSheet("""
@@ -183,90 +468,89 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
 
         # Adding actions to the File menu (as per your original code)
         self.actionNew = QAction("New", self)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Vector.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("Vector.png")
         self.actionNew.setIcon(icon2)
         self.menuFile.addAction(self.actionNew)
 
         self.actionOpen = QAction("Open", self)
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications/Qt/bin/../../../../../../../../../../Downloads/Vector (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon3 = icon_resources.icon("Vector (1).png")
         self.actionOpen.setIcon(icon3)
         self.menuFile.addAction(self.actionOpen)
 
         self.actionSave = QAction("Save", self)
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _save action floppy_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon4 = icon_resources.icon("🦆 icon _save action floppy_.png")
         self.actionSave.setIcon(icon4)
         self.menuFile.addAction(self.actionSave)
 
         self.actionSave_As = QAction("Save As...", self)
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _document save as template_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon5 = icon_resources.icon("🦆 icon _document save as template_.png")
         self.actionSave_As.setIcon(icon5)
         self.menuFile.addAction(self.actionSave_As)
 
         self.actionCreate_a_Copy = QAction("Create a Copy", self)
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _file copy_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon6 = icon_resources.icon("🦆 icon _file copy_.png")
         self.actionCreate_a_Copy.setIcon(icon6)
         self.menuFile.addAction(self.actionCreate_a_Copy)
 
         self.actionPrint = QAction("Print", self)
-        icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Vector (2).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon7 = icon_resources.icon("Vector (2).png")
         self.actionPrint.setIcon(icon7)
         self.menuFile.addAction(self.actionPrint)
 
         self.actionRename = QAction("Rename", self)
-        icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Vector (3).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon8 = icon_resources.icon("Vector (3).png")
         self.actionRename.setIcon(icon8)
         self.menuFile.addAction(self.actionRename)
 
         self.actionExport = QAction("Export", self)
-        icon9 = QtGui.QIcon()
-        icon9.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Export.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon9 = icon_resources.icon("Export.png")
         self.actionExport.setIcon(icon9)
         self.menuFile.addAction(self.actionExport)
 
+        self.actionImport_BOQ = QAction("Import Bill of Quantities...", self)
+        self.menuFile.addAction(self.actionImport_BOQ)
+
         self.actionVersion_History = QAction("Version History", self)
-        icon10 = QtGui.QIcon()
-        icon10.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Vector (4).png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon10 = icon_resources.icon("Vector (4).png")
         self.actionVersion_History.setIcon(icon10)
         self.menuFile.addAction(self.actionVersion_History)
 
         self.actionInfo = QAction("Info", self)
-        icon11 = QtGui.QIcon()
-        icon11.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Alert Circle.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon11 = icon_resources.icon("Alert Circle.png")
         self.actionInfo.setIcon(icon11)
         self.menuFile.addAction(self.actionInfo)
 
         # Adding actions to the Help menu
         self.actionContact_Us = QAction("Contact Us", self)
-        icon12 = QtGui.QIcon()
-        icon12.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Contact.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon12 = icon_resources.icon("Contact.png")
         self.actionContact_Us.setIcon(icon12)
         self.menuHelp.addAction(self.actionContact_Us)
 
         self.actionFeedback = QAction("Feedback", self)
-        icon13 = QtGui.QIcon()
-        icon13.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _Person Feedback_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon13 = icon_resources.icon("🦆 icon _Person Feedback_.png")
         self.actionFeedback.setIcon(icon13)
         self.menuHelp.addAction(self.actionFeedback)
 
         self.actionVideo_Tutorials = QAction("Video Tutorials", self)
-        icon14 = QtGui.QIcon()
-        icon14.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _youtube_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon14 = icon_resources.icon("🦆 icon _youtube_.png")
         self.actionVideo_Tutorials.setIcon(icon14)
         self.menuHelp.addAction(self.actionVideo_Tutorials)
 
         self.actionJoin_our_Community = QAction("Join our Community", self)
-        icon15 = QtGui.QIcon()
-        icon15.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/🦆 icon _People Community_.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon15 = icon_resources.icon("🦆 icon _People Community_.png")
         self.actionJoin_our_Community.setIcon(icon15)
         self.menuHelp.addAction(self.actionJoin_our_Community)
 
+        # Undo / redo of Project Details edits, also added to each Project Details dialog
+        self.actionUndo = QAction("Undo", self)
+        self.actionUndo.setShortcut(QKeySequence.Undo)
+        self.menuHome.addAction(self.actionUndo)
+
+        self.actionRedo = QAction("Redo", self)
+        self.actionRedo.setShortcut(QKeySequence.Redo)
+        self.menuHome.addAction(self.actionRedo)
+
+    @tracing.traced()
     def create_toolbar(self):
         self.toolBar = QToolBar("Main Toolbar") # Assign toolbar to self.toolBar
         self.toolBar.setMovable(False)
@@ -280,9 +564,10 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.toolBar.addAction(self.actionSave)
         self.toolBar.addSeparator()
 
+    @tracing.traced()
     def create_window_tabs(self):
         window_tabs_container = QWidget()
-        window_tabs_container.setStyleSheet("background-color: white; border-bottom: 1px solid #e0e0e0;")
+        window_tabs_container.setStyleSheet(WINDOW_TABS_STYLE)
         container_layout = QHBoxLayout(window_tabs_container)
         container_layout.setContentsMargins(10, 0, 10, 0)
         container_layout.setSpacing(0)
@@ -299,25 +584,6 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
             tab_btn.setAutoExclusive(False)
             tab_btn.clicked.connect(lambda checked, name=tab_name: self.handle_tab_click(name))
 
-            tab_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 1px solid #cccccc;
-                    border-bottom: none;
-                    border-top-left-radius: 5px;
-                    border-top-right-radius: 5px;
-                    padding: 5px 15px;
-                    margin: 0px 2px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #e8e8e8;
-                }
-                QPushButton:checked {
-                    background-color: white;
-                    border-bottom: 1px solid white;
-                }
-            """)
             container_layout.addWidget(tab_btn)
             self.tab_buttons[tab_name] = tab_btn
 
@@ -325,6 +591,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         window_tabs_container.setFixedHeight(40)
         self.main_layout.addWidget(window_tabs_container)
 
+    @tracing.traced()
     def handle_tab_click(self, clicked_tab_name, initial_load=False):
         """
         Handles clicks on custom window tabs.
@@ -384,62 +651,28 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
                         for name, btn in self.tab_buttons.items():
                             if name in ["Project Details", "Results", "Compare"] and name != clicked_tab_name:
                                 btn.setChecked(False)
-                                btn.setStyleSheet("""
-                                    QPushButton {
-                                        background-color: #f0f0f0;
-                                        border: 1px solid #cccccc;
-                                        border-bottom: none;
-                                        border-top-left-radius: 5px;
-                                        border-top-right-radius: 5px;
-                                        padding: 5px 15px;
-                                        margin: 0px 2px;
-                                        min-width: 80px;
-                                    }
-                                    QPushButton:hover {
-                                        background-color: #e8e8e8;
-                                    }
-                                """)
                         clicked_button.setChecked(True)
             else:
                 return # Should not happen if panel_map is correct
 
-        # Update button stylesheets for all buttons
+        # Restyle all buttons through their "active" property
         for name, btn in self.tab_buttons.items():
-            if btn.isChecked():
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: white;
-                        border: 1px solid #cccccc;
-                        border-bottom: 1px solid white;
-                        border-top-left-radius: 5px;
-                        border-top-right-radius: 5px;
-                        padding: 5px 15px;
-                        margin: 0px 2px;
-                        min-width: 80px;
-                    }
-                    QPushButton:hover {
-                        background-color: white;
-                    }
-                """)
-            else:
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f0f0f0;
-                        border: 1px solid #cccccc;
-                        border-bottom: none;
-                        border-top-left-radius: 5px;
-                        border-top-right-radius: 5px;
-                        padding: 5px 15px;
-                        margin: 0px 2px;
-                        min-width: 80px;
-                    }
-                    QPushButton:hover {
-                        background-color: #e8e8e8;
-                    }
-                """)
+            self.set_tab_active(btn, btn.isChecked())
         self.update_splitter_sizes()
+        if clicked_tab_name == "Results" and not initial_load:
+            self.refresh_results()
 
 
+    def set_tab_active(self, button, active):
+        """Checks or unchecks a window tab and re-polishes it only if its look changes."""
+        button.setChecked(active)
+        if button.property("active") != active:
+            button.setProperty("active", active)
+            style = button.style()
+            style.unpolish(button)
+            style.polish(button)
+
+    @tracing.traced()
     def create_content_area(self):
         self.content_splitter = QSplitter(Qt.Horizontal)
         self.content_splitter.setStyleSheet("QSplitter::handle { background-color: #e0e0e0; }")
@@ -613,8 +846,8 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.generalInfoGroup.setStyleSheet("QGroupBox { background-color: rgb(240,230,230); border: 1px solid gray; border-radius: 5px; margin-top: 1ex; }"
                                             "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; background-color: rgb(240,230,230); }"
                                             "QGroupBox::indicator { width: 13px; height: 13px; }"
-                                            "QGroupBox::indicator:checked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled (1).png); }"
-                                            "QGroupBox::indicator:unchecked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png); }")
+                                            "QGroupBox::indicator:checked { image: url(" + icon_resources.url("play_arrow_filled (1).png") + "); }"
+                                            "QGroupBox::indicator:unchecked { image: url(" + icon_resources.url("play_arrow_filled.png") + "); }")
 
         self.gridLayout_2 = QtWidgets.QFormLayout(self.generalInfoGroup)
         self.gridLayout_2.setContentsMargins(10, 20, 10, 10)
@@ -667,10 +900,10 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
                 width: 20px; /* Width of the arrow button area */
             }
             QComboBox::down-arrow {
-                image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/arrow_down.png); /* Path to your down arrow icon if you have one */
+                image: url(%s); /* Path to your down arrow icon if you have one */
                 /* If you don't have a custom arrow, remove this line or replace with a default one */
             }
-        """)
+        """ % icon_resources.url("arrow_down.png"))
         countries = [
             "Afghanistan", "Albania", "Algeria", "Andorra", "Angola", "Antigua and Barbuda", "Argentina", "Armenia", "Australia", "Austria",
             "Azerbaijan", "Bahamas", "Bahrain", "Bangladesh", "Barbados", "Belarus", "Belgium", "Belize", "Benin", "Bhutan",
@@ -710,15 +943,15 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.inputParamsGroup.setStyleSheet("QGroupBox { background-color: rgb(240,230,230); border: 1px solid gray; border-radius: 5px; margin-top: 1ex; }"
                                             "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; background-color: rgb(240,230,230); }"
                                             "QGroupBox::indicator { width: 13px; height: 13px; }"
-                                            "QGroupBox::indicator:checked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled (1).png); }"
-                                            "QGroupBox::indicator:unchecked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png); }")
+                                            "QGroupBox::indicator:checked { image: url(" + icon_resources.url("play_arrow_filled (1).png") + "); }"
+                                            "QGroupBox::indicator:unchecked { image: url(" + icon_resources.url("play_arrow_filled.png") + "); }")
 
         self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.inputParamsGroup)
         self.verticalLayout_3.setContentsMargins(10, 20, 10, 10)
         self.verticalLayout_3.setSpacing(5)
 
         self.pushButton = QtWidgets.QPushButton("Structure Works Data")
-        self.pushButton.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.pushButton.setCheckable(True)
         self.pushButton.setChecked(False)
         self.verticalLayout_3.addWidget(self.pushButton)
@@ -728,19 +961,19 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.gridLayout_3.setContentsMargins(20, 0, 0, 0)
 
         self.pushButton_2 = QtWidgets.QPushButton("Foundation", clicked=self.openFoundationWindow)
-        self.pushButton_2.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_2.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.gridLayout_3.addWidget(self.pushButton_2, 0, 0, 1, 1)
 
         self.pushButton_3 = QtWidgets.QPushButton("Super-Structure", clicked=self.openSuperStructureWindow)
-        self.pushButton_3.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_3.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.gridLayout_3.addWidget(self.pushButton_3, 1, 0, 1, 1)
 
         self.pushButton_4 = QtWidgets.QPushButton("Sub-Structure", clicked=self.openSubStructureWindow)
-        self.pushButton_4.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_4.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.gridLayout_3.addWidget(self.pushButton_4, 2, 0, 1, 1)
 
         self.pushButton_5 = QtWidgets.QPushButton("Miscellaneous", clicked=self.openMiscellaneousWindow)
-        self.pushButton_5.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_5.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.gridLayout_3.addWidget(self.pushButton_5, 3, 0, 1, 1)
         self.verticalLayout_3.addWidget(self.gridLayout_3_widget)
 
@@ -749,7 +982,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.verticalLayout_3.addWidget(self.pushButton_6)
 
         self.pushButton_7 = QtWidgets.QPushButton("Carbon Emission Data")
-        self.pushButton_7.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_7.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.pushButton_7.setCheckable(True)
         self.pushButton_7.setChecked(False)
         self.verticalLayout_3.addWidget(self.pushButton_7)
@@ -759,7 +992,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.gridLayout_4.setContentsMargins(20, 0, 0, 0)
 
         self.pushButton_8 = QtWidgets.QPushButton("Carbon Emission Cost Data", clicked=self.openCarbonEmissionWindow)
-        self.pushButton_8.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+        self.pushButton_8.setIcon(icon_resources.icon("play_arrow_filled.png"))
         self.gridLayout_4.addWidget(self.pushButton_8, 0, 0, 1, 1)
         self.verticalLayout_3.addWidget(self.gridLayout_4_widget)
 
@@ -782,8 +1015,8 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.outputsGroup.setStyleSheet("QGroupBox { background-color: rgb(240,230,230); border: 1px solid gray; border-radius: 5px; margin-top: 1ex; }"
                                         "QGroupBox::title { subcontrol-origin: margin; subcontrol-position: top left; padding: 0 3px; background-color: rgb(240,230,230); }"
                                         "QGroupBox::indicator { width: 13px; height: 13px; }"
-                                        "QGroupBox::indicator:checked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled (1).png); }"
-                                        "QGroupBox::indicator:unchecked { image: url(C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png); }")
+                                        "QGroupBox::indicator:checked { image: url(" + icon_resources.url("play_arrow_filled (1).png") + "); }"
+                                        "QGroupBox::indicator:unchecked { image: url(" + icon_resources.url("play_arrow_filled.png") + "); }")
         
         self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.outputsGroup)
         self.verticalLayout_4.setContentsMargins(10, 20, 10, 10)
@@ -812,11 +1045,14 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         results_header_layout.addWidget(self.results_header_label)
         results_header_layout.addStretch()
         results_layout.addWidget(results_header)
-        results_layout.addWidget(QLabel("<h2>Results content goes here.</h2><p>This panel will display analytical results.</p>", self.results_panel))
+        self.results_label = QLabel("<h2>Results content goes here.</h2><p>This panel will display analytical results.</p>", self.results_panel)
+        self.results_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.results_label.setContentsMargins(10, 10, 10, 10)
+        results_layout.addWidget(self.results_label)
         self.dynamic_content_stack.addWidget(self.results_panel)
 
 
-        # --- Compare Panel (Placeholder) ---
+        # --- Compare Panel ---
         self.compare_panel = QWidget()
         compare_layout = QVBoxLayout(self.compare_panel)
         compare_layout.setContentsMargins(0, 0, 0, 0)
@@ -830,7 +1066,9 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         compare_header_layout.addWidget(self.compare_header_label)
         compare_header_layout.addStretch()
         compare_layout.addWidget(compare_header)
-        compare_layout.addWidget(QLabel("<h2>Compare different scenarios here.</h2><p>This panel will allow side-by-side comparisons.</p>", self.compare_panel))
+        import compare_panel
+        self.compare_view = compare_panel.ComparePanel(self.compare_panel)
+        compare_layout.addWidget(self.compare_view)
         self.dynamic_content_stack.addWidget(self.compare_panel)
 
 
@@ -845,6 +1083,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.content_splitter.setSizes([300, self.width() - 300])
 
 
+    @tracing.traced()
     def create_status_bar(self):
         self.statusBar = self.statusBar() # Assign status_bar to self.statusBar
         self.statusBar.setStyleSheet("background-color: #f0f0f0; border-top: 1px solid #e0e0e0;")
@@ -910,22 +1149,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
     def close_tutorials(self):
         self.tutorials_panel.hide()
         if "Tutorials" in self.tab_buttons:
-            self.tab_buttons["Tutorials"].setChecked(False)
-            self.tab_buttons["Tutorials"].setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 1px solid #cccccc;
-                    border-bottom: none;
-                    border-top-left-radius: 5px;
-                    border-top-right-radius: 5px;
-                    padding: 5px 15px;
-                    margin: 0px 2px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #e8e8e8;
-                }
-            """)
+            self.set_tab_active(self.tab_buttons["Tutorials"], False)
         self.update_splitter_sizes()
 
     def close_project_details(self):
@@ -936,22 +1160,7 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.dynamic_content_stack.hide()
 
         if "Project Details" in self.tab_buttons:
-            self.tab_buttons["Project Details"].setChecked(False)
-            self.tab_buttons["Project Details"].setStyleSheet("""
-                QPushButton {
-                    background-color: #f0f0f0;
-                    border: 1px solid #cccccc;
-                    border-bottom: none;
-                    border-top-left-radius: 5px;
-                    border-top-right-radius: 5px;
-                    padding: 5px 15px;
-                    margin: 0px 2px;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #e8e8e8;
-                }
-            """)
+            self.set_tab_active(self.tab_buttons["Project Details"], False)
         self.update_splitter_sizes()
 
 
@@ -1004,6 +1213,35 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
     def toggle_outputs_group_content(self, group_box, checked):
         self.label_10.setVisible(checked)
         self.update_group_indicator_style(group_box, checked)
+        self.refresh_results()
+
+    def results_shown(self):
+        """True while the Outputs group is open or the Results panel is the visible page."""
+        results_page = (self.dynamic_content_stack.isVisibleTo(self)
+                        and self.dynamic_content_stack.currentWidget() is self.results_panel)
+        return self.outputsGroup.isChecked() or results_page
+
+    def results_changed(self):
+        # Several fields can change in one go (e.g. a whole bill of quantities), so the
+        # refresh waits for the event loop and runs once
+        if not self.results_refresh_pending:
+            self.results_refresh_pending = True
+            QTimer.singleShot(0, self.refresh_results)
+
+    def refresh_results(self):
+        """Shows the cost heads in the Outputs group and the Results panel, recomputing only the stale ones."""
+        self.results_refresh_pending = False
+        if not self.results_shown():
+            return
+        import results  # pulls in NumPy, so it is only imported once results are shown
+        if self.live_results is None:
+            self.live_results = results.LiveResults(self.results_changed)
+        values = self.live_results.values()
+        table = results.format_table(values)
+        self.label_10.setText(table)
+        tornado = results.format_sensitivity(self.live_results.sensitivity(), values)
+        self.results_label.setText("<h3>Life-Cycle Cost (present value, INR)</h3>" + table
+                                   + "<h3>Sensitivity of the Total Life-Cycle Cost (INR)</h3>" + tornado)
 
     def update_group_indicator_style(self, group_box, is_checked):
         style = group_box.styleSheet()
@@ -1018,11 +1256,12 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         layout.parentWidget().setVisible(is_checked) # Hide/show the container widget of the layout
         
         if is_checked:
-            toggle_button.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled (1).png"))
+            toggle_button.setIcon(icon_resources.icon("play_arrow_filled (1).png"))
         else:
-            toggle_button.setIcon(QtGui.QIcon("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/qt5_applications/Qt/bin/../../../../../../../../../../Downloads/play_arrow_filled.png"))
+            toggle_button.setIcon(icon_resources.icon("play_arrow_filled.png"))
 
 
+    @tracing.traced()
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "<untitled draft> - BICCA Studio 1.0.0"))
@@ -1091,12 +1330,15 @@ class MainWindow(QMainWindow): # Renamed to MainWindow, inheriting QMainWindow
         self.actionPrint.setText(_translate("MainWindow", "Print"))
         self.actionRename.setText(_translate("MainWindow", "Rename"))
         self.actionExport.setText(_translate("MainWindow", "Export"))
+        self.actionImport_BOQ.setText(_translate("MainWindow", "Import Bill of Quantities..."))
         self.actionVersion_History.setText(_translate("MainWindow", "Version History"))
         self.actionInfo.setText(_translate("MainWindow", "Info"))
         self.actionContact_Us.setText(_translate("MainWindow", "Contact Us"))
         self.actionFeedback.setText(_translate("MainWindow", "Feedback"))
         self.actionVideo_Tutorials.setText(_translate("MainWindow", "Video Tutorials"))
         self.actionJoin_our_Community.setText(_translate("MainWindow", "Join our Community"))
+        self.actionUndo.setText(_translate("MainWindow", "Undo"))
+        self.actionRedo.setText(_translate("MainWindow", "Redo"))
 
         # Data section retranslate
         self.combo_box_lookup.setItemText(0, _translate("MainWindow", "Carbon Data"))
@@ -9,6 +9,7 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
+import icon_resources
 from PyQt5.QtWidgets import QMessageBox
 
 
@@ -45,9 +46,7 @@ class Ui_BridgeTraffic_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(10)
         self.pushButton_34.setFont(font)
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon = icon_resources.icon("play_arrow_filled.png", on="play_arrow_filled (1).png")
         self.pushButton_34.setIcon(icon)
         self.pushButton_34.setCheckable(True)
         self.pushButton_34.setAutoDefault(True)
@@ -63,8 +62,7 @@ class Ui_BridgeTraffic_Dialog(object):
         font.setBold(False)
         font.setWeight(50)
         self.pushButton_35.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon1 = icon_resources.icon("play_arrow_filled.png")
         self.pushButton_35.setIcon(icon1)
         self.pushButton_35.setObjectName("pushButton_35")
         self.formLayout_3.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_35)
@@ -361,8 +359,7 @@ class Ui_BridgeTraffic_Dialog(object):
         self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
         self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("Dismiss.png")
         self.pushButton.setIcon(icon2)
         self.pushButton.setAutoRepeat(False)
         self.pushButton.setObjectName("pushButton")
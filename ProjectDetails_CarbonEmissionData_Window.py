@@ -9,6 +9,7 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
+import icon_resources
 from PyQt5.QtWidgets import QMessageBox
 
 
@@ -37,8 +38,7 @@ class Ui_CarbonEmission_Dialog(object):
         self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
         self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon = icon_resources.icon("Dismiss.png")
         self.pushButton.setIcon(icon)
         self.pushButton.setAutoRepeat(False)
         self.pushButton.setObjectName("pushButton")
@@ -524,6 +524,20 @@ class Ui_CarbonEmission_Dialog(object):
         self.pushButton_50.setGeometry(QtCore.QRect(310, 670, 190, 23))
         self.pushButton_50.setStyleSheet("background-color: #ffffff")
         self.pushButton_50.setObjectName("pushButton_50")
+        self.label_94 = QtWidgets.QLabel(CarbonEmission_Dialog)
+        self.label_94.setGeometry(QtCore.QRect(840, 37, 201, 21))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_94.setFont(font)
+        self.label_94.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_94.setObjectName("label_94")
+        self.lineEdit_55 = QtWidgets.QLineEdit(CarbonEmission_Dialog)
+        self.lineEdit_55.setGeometry(QtCore.QRect(1047, 37, 81, 20))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lineEdit_55.setFont(font)
+        self.lineEdit_55.setStyleSheet("background-color: #ffffff")
+        self.lineEdit_55.setObjectName("lineEdit_55")
         self.scrollArea = QtWidgets.QScrollArea(CarbonEmission_Dialog)
         self.scrollArea.setGeometry(QtCore.QRect(10, 65, 241, 681))
         self.scrollArea.setAutoFillBackground(False)
@@ -552,9 +566,7 @@ class Ui_CarbonEmission_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(10)
         self.pushButton_51.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon1 = icon_resources.icon("play_arrow_filled.png", on="play_arrow_filled (1).png")
         self.pushButton_51.setIcon(icon1)
         self.pushButton_51.setCheckable(True)
         self.pushButton_51.setAutoDefault(True)
@@ -570,8 +582,7 @@ class Ui_CarbonEmission_Dialog(object):
         font.setBold(False)
         font.setWeight(50)
         self.pushButton_52.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("play_arrow_filled.png")
         self.pushButton_52.setIcon(icon2)
         self.pushButton_52.setObjectName("pushButton_52")
         self.formLayout_4.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_52)
@@ -801,6 +812,7 @@ class Ui_CarbonEmission_Dialog(object):
 "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Recycling Cost</span></p>\n"
 "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:10pt; color:#aa8b8b;\">Total Life-Cycle Cost</span></p></body></html>"))
         self.pushButton_62.setText(_translate("CarbonEmission_Dialog", "Carbon Emission Data       "))
+        self.label_94.setText(_translate("CarbonEmission_Dialog", "Carbon Price (INR/kg CO2e):"))
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
+import icon_resources
 from PyQt5.QtWidgets import QMessageBox
 
 
@@ -27,8 +28,7 @@ class Ui_Demolition_Dialog(object):
         self.pushButton_6.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.pushButton_6.setLayoutDirection(QtCore.Qt.RightToLeft)
         self.pushButton_6.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon = icon_resources.icon("Dismiss.png")
         self.pushButton_6.setIcon(icon)
         self.pushButton_6.setAutoRepeat(False)
         self.pushButton_6.setObjectName("pushButton_6")
@@ -148,9 +148,7 @@ class Ui_Demolition_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(10)
         self.pushButton_15.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon1 = icon_resources.icon("play_arrow_filled.png", on="play_arrow_filled (1).png")
         self.pushButton_15.setIcon(icon1)
         self.pushButton_15.setCheckable(True)
         self.pushButton_15.setAutoDefault(True)
@@ -166,8 +164,7 @@ class Ui_Demolition_Dialog(object):
         font.setBold(False)
         font.setWeight(50)
         self.pushButton_20.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("play_arrow_filled.png")
         self.pushButton_20.setIcon(icon2)
         self.pushButton_20.setObjectName("pushButton_20")
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_20)
@@ -9,6 +9,8 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
+import icon_resources
+from form_data_storage import save_form_data
 from PyQt5.QtWidgets import QMessageBox
 
 
@@ -33,8 +35,7 @@ class Ui_FinancialData_Dialog(object):
         self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
         self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon = icon_resources.icon("Dismiss.png")
         self.pushButton.setIcon(icon)
         self.pushButton.setAutoRepeat(False)
         self.pushButton.setObjectName("pushButton")
@@ -167,9 +168,7 @@ class Ui_FinancialData_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(10)
         self.pushButton_15.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon1 = icon_resources.icon("play_arrow_filled.png", on="play_arrow_filled (1).png")
         self.pushButton_15.setIcon(icon1)
         self.pushButton_15.setCheckable(True)
         self.pushButton_15.setAutoDefault(True)
@@ -185,8 +184,7 @@ class Ui_FinancialData_Dialog(object):
         font.setBold(False)
         font.setWeight(50)
         self.pushButton_20.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("play_arrow_filled.png")
         self.pushButton_20.setIcon(icon2)
         self.pushButton_20.setObjectName("pushButton_20")
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_20)
@@ -303,6 +301,7 @@ class Ui_FinancialData_Dialog(object):
 
         self.retranslateUi(FinancialData_Dialog)
         self.buttonBox_2.accepted.connect(FinancialData_Dialog.accept) # type: ignore
+        self.buttonBox_2.accepted.connect(self.save_data)
         self.buttonBox_2.rejected.connect(self.show_warning) # type: ignore
         self.pushButton_15.toggled['bool'].connect(self.widget_5.setVisible) # type: ignore
         self.pushButton_16.toggled['bool'].connect(self.widget_8.setVisible) # type: ignore
@@ -326,6 +325,19 @@ class Ui_FinancialData_Dialog(object):
         else:
             pass  # Do nothing, return to the dialog
 
+    def save_data(self):
+        """
+        Collect form data and save it to the global dictionary.
+        """
+        data = {
+            "real_discount_rate": self.lineEdit_5.text(),
+            "interest_rate": self.comboBox_3.currentText(),
+            "investment_ratio": self.comboBox_2.currentText(),
+            "duration_of_study": self.lineEdit_6.text(),
+            "construction_time": self.lineEdit_13.text(),
+        }
+        save_form_data("FinancialData_Dialog", data)
+
     def retranslateUi(self, FinancialData_Dialog):
         _translate = QtCore.QCoreApplication.translate
         FinancialData_Dialog.setWindowTitle(_translate("FinancialData_Dialog", "Dialog"))
@@ -9,7 +9,7 @@
 
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from form_data_storage import save_form_data
+import icon_resources
 from PyQt5.QtWidgets import QMessageBox
 
 class Ui_Foundation_Dialog(object):
@@ -34,8 +34,7 @@ class Ui_Foundation_Dialog(object):
         self.pushButton.setFocusPolicy(QtCore.Qt.StrongFocus)
         self.pushButton.setLayoutDirection(QtCore.Qt.RightToLeft)
         self.pushButton.setStyleSheet("background-color: rgb(240,230,230)")
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/Dismiss.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon = icon_resources.icon("Dismiss.png")
         self.pushButton.setIcon(icon)
         self.pushButton.setAutoRepeat(False)
         self.pushButton.setObjectName("pushButton")
@@ -67,9 +66,7 @@ class Ui_Foundation_Dialog(object):
         font = QtGui.QFont()
         font.setPointSize(10)
         self.pushButton_15.setFont(font)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        icon1.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled (1).png"), QtGui.QIcon.Normal, QtGui.QIcon.On)
+        icon1 = icon_resources.icon("play_arrow_filled.png", on="play_arrow_filled (1).png")
         self.pushButton_15.setIcon(icon1)
         self.pushButton_15.setCheckable(True)
         self.pushButton_15.setAutoDefault(True)
@@ -85,8 +82,7 @@ class Ui_Foundation_Dialog(object):
         font.setBold(False)
         font.setWeight(50)
         self.pushButton_20.setFont(font)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap("C:\\Users\\saans\\AppData\\Local\\Programs\\Python\\Python310\\Lib\\site-packages\\qt5_applications\\Qt\\bin\\../../../../../../../../../../Downloads/play_arrow_filled.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon2 = icon_resources.icon("play_arrow_filled.png")
         self.pushButton_20.setIcon(icon2)
         self.pushButton_20.setObjectName("pushButton_20")
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.pushButton_20)
@@ -481,7 +477,6 @@ class Ui_Foundation_Dialog(object):
 
         self.retranslateUi(Foundation_Dialog)
         self.buttonBox.accepted.connect(Foundation_Dialog.accept) # type: ignore
-        self.buttonBox.accepted.connect(self.save_data)
         self.buttonBox.rejected.connect(self.show_warning) # type: ignore
         self.pushButton_15.toggled['bool'].connect(self.widget_5.setVisible) # type: ignore
         self.pushButton_16.toggled['bool'].connect(self.widget_8.setVisible) # type: ignore
@@ -506,20 +501,6 @@ class Ui_Foundation_Dialog(object):
         else:
             pass  # Do nothing, return to the dialog
 
-    def save_data(self):
-        """
-        Collect form data and save it to the global dictionary.
-        """
-        data = {
-            "component": self.comboBox.currentText(),
-            "sub_component": self.comboBox_2.currentText(),
-            "quantity": self.lineEdit.text(),
-            "unit": self.label_10.text(),
-            "rate": self.lineEdit_3.text(),
-            "material_type": self.comboBox_4.currentText(),
-        }
-        save_form_data("Foundation_Dialog", data)
-
     def retranslateUi(self, Foundation_Dialog):
         _translate = QtCore.QCoreApplication.translate
         Foundation_Dialog.setWindowTitle(_translate("Foundation_Dialog", "Dialog"))
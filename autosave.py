@@ -0,0 +1,255 @@
+"""
+Crash-safe autosave journal.
+
+Every field change is appended to a journal file as one JSON line
+{"path": "financial.discount_rate", "value": 6.5}. The UI thread only puts changes on
+a queue; a worker thread writes them in batches and fsyncs the file every
+FLUSH_INTERVAL seconds, so typing never waits for the disk. A saved project file
+becomes the journal's base ({"base": "/path/to/file.bicca"}) and the older entries
+are dropped. On the next launch the journal is replayed on top of its base; a line
+cut short by a crash is ignored.
+
+A batch writes only the latest value of each field. Bills of quantities are lists
+of thousands of rows, and the material grid edits them copy-on-write, so a new list
+shares every unchanged row object with the previous one. Once a list has been
+written (or is known from the base file), later versions are written as a patch of
+the rows that are not the same objects as before:
+{"path": "structure.foundation", "patch": [components, [[c, name, sub-components,
+[[s, name, rows, [[m, row], ...]], ...]], ...]]}.
+"""
+import json
+import os
+import queue
+import threading
+from dataclasses import asdict, is_dataclass
+
+from project_model import BOQ_PATHS, Component, MaterialRow, SubComponent, components_from_list
+
+JOURNAL_DIR = os.environ.get("BICCA_AUTOSAVE_DIR", os.path.join(os.path.expanduser("~"), ".bicca"))
+JOURNAL_NAME = "autosave.journal"
+FLUSH_INTERVAL = 2.0  # seconds
+
+_RESET = object()  # queue marker: truncate the journal and start from a new base
+
+
+def default_path():
+    return os.path.join(JOURNAL_DIR, JOURNAL_NAME)
+
+
+def _encode(value):
+    if isinstance(value, list):
+        return [asdict(item) if is_dataclass(item) else item for item in value]
+    return value
+
+
+def _diff(old, new):
+    # Patch turning component list old into new, comparing by identity
+    changed = []
+    for c, component in enumerate(new):
+        previous = old[c] if c < len(old) else None
+        if component is previous:
+            continue
+        old_subs = previous.sub_components if previous is not None else []
+        subs = []
+        for s, sub_component in enumerate(component.sub_components):
+            old_sub = old_subs[s] if s < len(old_subs) else None
+            if sub_component is old_sub:
+                continue
+            old_rows = old_sub.materials if old_sub is not None else []
+            rows = [[m, asdict(row)] for m, row in enumerate(sub_component.materials)
+                    if m >= len(old_rows) or row is not old_rows[m]]
+            subs.append([s, sub_component.name, len(sub_component.materials), rows])
+        changed.append([c, component.name, len(component.sub_components), subs])
+    return [len(new), changed]
+
+
+def _patch(components, patch):
+    # New component list: components with a patch from _diff applied
+    count, changed = patch
+    components = list(components[:count]) + [Component() for _ in range(count - len(components))]
+    for c, name, sub_count, subs in changed:
+        sub_components = list(components[c].sub_components[:sub_count])
+        sub_components += [SubComponent() for _ in range(sub_count - len(sub_components))]
+        for s, sub_name, row_count, rows in subs:
+            materials = list(sub_components[s].materials[:row_count])
+            materials += [MaterialRow() for _ in range(row_count - len(materials))]
+            for m, row in rows:
+                materials[m] = MaterialRow(**row)
+            sub_components[s] = SubComponent(sub_name, materials)
+        components[c] = Component(name, sub_components)
+    return components
+
+
+def apply(entries, project):
+    """
+    Replay journal entries into a project.
+
+    Args:
+        entries (list): (path, value) pairs from Journal.read.
+        project (Project): Project to update.
+
+    Returns:
+        int: Number of entries applied.
+    """
+    for path, value in entries:
+        if isinstance(value, list):
+            value = components_from_list(value)
+        elif isinstance(value, dict):
+            value = _patch(project.get(path), value["patch"])
+        project.set(path, value)
+    return len(entries)
+
+
+class Journal:
+    """
+    Append-only journal of field changes written by a background thread.
+
+    Args:
+        path (str): Journal file; defaults to default_path().
+        flush_interval (float): Seconds between batched writes.
+    """
+
+    def __init__(self, path=None, flush_interval=FLUSH_INTERVAL):
+        self.path = path or default_path()
+        self.flush_interval = flush_interval
+        self._queue = queue.SimpleQueue()
+        self._wake = threading.Event()
+        self._closing = False
+        self._thread = None
+        self._pending = []  # changes a failed write still has to retry
+        self._written = {}  # BOQ path -> component list the journal holds, for patches
+
+    def read(self):
+        """
+        Read the journal left by an earlier session.
+
+        Returns:
+            tuple: (base project file or None, list of (path, value) pairs). The value of
+                a bill of quantities patch is {"patch": ...}; apply() resolves it.
+        """
+        base, entries = None, []
+        try:
+            with open(self.path, "rb") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # torn write at the end of the file
+                    if "base" in record:
+                        base, entries = record["base"], []
+                    elif "patch" in record:
+                        entries.append((record["path"], {"patch": record["patch"]}))
+                    else:
+                        entries.append((record["path"], record["value"]))
+        except FileNotFoundError:
+            pass
+        return base, entries
+
+    def start(self):
+        """
+        Start the writer thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def record(self, path, value):
+        """
+        Queue a field change. Never blocks; the value must not be mutated afterwards.
+
+        Args:
+            path (str): Model path of the field.
+            value: New value (float, str or component list).
+        """
+        self._queue.put((path, value))
+
+    def reset(self, base=None, project=None):
+        """
+        Drop every queued and written entry, e.g. after the project was saved.
+
+        Args:
+            base (str): Project file the following entries apply to, if any.
+            project (Project): The project as the base file holds it. Later edits of its
+                bills of quantities are journaled as patches against its lists.
+        """
+        written = {path: project.get(path) for path in BOQ_PATHS} if base and project is not None else {}
+        self._queue.put((_RESET, (base, written)))
+        self._wake.set()
+
+    def compact(self, base, entries):
+        """
+        Rewrite the journal as its base plus the latest value of every field, e.g. after
+        replaying it, so a line torn by a crash is not followed by new entries.
+
+        Args:
+            base (str): Project file the entries apply to, if any.
+            entries (list): (path, value) pairs of full values, not patches.
+        """
+        self.reset(base)
+        for path, value in dict(entries).items():
+            self.record(path, value)
+
+    def flush(self):
+        """
+        Ask the writer to write and fsync queued changes now instead of at the next interval.
+        """
+        self._wake.set()
+
+    def close(self):
+        """
+        Write the remaining changes and stop the writer thread.
+        """
+        if self._thread is None:
+            return
+        self._closing = True
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _drain(self):
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _write(self, items):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lines, mode, latest, written = [], "ab", {}, dict(self._written)
+        for path, value in items:
+            if path is _RESET:
+                base, written = value
+                lines, mode, latest = [], "wb", {}
+                if base is not None:
+                    lines.append({"base": base})
+            else:
+                latest.pop(path, None)  # only the last value of a field in a batch is written
+                latest[path] = value
+        for path, value in latest.items():
+            if isinstance(value, list) and path in written:
+                lines.append({"path": path, "patch": _diff(written[path], value)})
+            else:
+                lines.append({"path": path, "value": _encode(value)})
+            if isinstance(value, list):
+                written[path] = value
+        data = b"".join(json.dumps(line, separators=(",", ":")).encode("utf-8") + b"\n" for line in lines)
+        with open(self.path, mode) as journal_file:
+            journal_file.write(data)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        self._written = written
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            items = self._pending + self._drain()
+            if items:
+                try:
+                    self._write(items)
+                    self._pending = []
+                except OSError:
+                    self._pending = items  # e.g. disk full; try again with the next batch
+            if self._closing:
+                return
@@ -0,0 +1,193 @@
+"""
+Import of a bill of quantities from a CSV or Excel (.xlsx) sheet into a Structure Works part.
+
+The sheet has a header row naming its columns, in any order:
+
+    Component, Sub-Component, Material, Quantity, Unit, Rate, Rate Data Source
+
+Only Material and Quantity are required; rows lacking either, or whose quantity is not
+a number, are skipped. Rows are read one at a time, never the whole
+file at once, and turned into project_model rows in chunks so a 20,000-line bill can be
+imported behind a progress bar that stays responsive and can be cancelled. The rows are
+grouped into components and sub-components by name, in order of first appearance.
+Excel files need the optional openpyxl package.
+"""
+import csv
+import os
+import re
+import zipfile
+
+from project_model import Component, SubComponent, material_row, parse_number
+
+# Rows turned into material rows between two progress reports
+CHUNK_ROWS = 1000
+
+# Header text (lower case, letters and digits only) -> column
+HEADER_ALIASES = {
+    "component": "component",
+    "subcomponent": "sub_component",
+    "material": "material",
+    "materialtype": "material",
+    "materialtypeandgrade": "material",
+    "grade": "material",
+    "quantity": "quantity",
+    "qty": "quantity",
+    "unit": "unit",
+    "units": "unit",
+    "rate": "rate",
+    "rateinr": "rate",
+    "ratedatasource": "rate_source",
+    "ratesource": "rate_source",
+    "source": "rate_source",
+}
+REQUIRED_COLUMNS = ("material", "quantity")
+
+
+class BoqImportError(ValueError):
+    """Raised when a sheet cannot be read as a bill of quantities."""
+
+
+def _csv_rows(path):
+    size = os.path.getsize(path) or 1
+    with open(path, newline="", encoding="utf-8-sig") as sheet:
+        sample = sheet.read(4096)
+        sheet.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        consumed = 0
+
+        def lines():
+            nonlocal consumed
+            for line in sheet:
+                consumed += len(line)
+                yield line
+
+        reader = csv.reader(lines(), dialect)
+        try:
+            for row in reader:
+                yield row, min(consumed / size, 1.0)
+        except csv.Error as error:
+            raise BoqImportError(f"{os.path.basename(path)} line {reader.line_num} cannot be read "
+                                 f"as CSV ({error})") from error
+
+
+def _xlsx_rows(path):
+    try:
+        from openpyxl import load_workbook
+        from openpyxl.utils.exceptions import InvalidFileException
+    except ImportError:
+        raise BoqImportError("Reading .xlsx files needs the openpyxl package; "
+                             "install it or save the sheet as CSV") from None
+    # What openpyxl raises for a damaged workbook; SyntaxError covers XML parse errors
+    damaged = (InvalidFileException, zipfile.BadZipFile, KeyError, ValueError, TypeError, SyntaxError)
+    try:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+    except damaged as error:
+        raise BoqImportError(f"{os.path.basename(path)} is not a readable .xlsx workbook ({error})") from error
+    try:
+        sheet = workbook.active
+        total = sheet.max_row or 0
+        for index, row in enumerate(sheet.iter_rows(values_only=True), 1):
+            yield ["" if cell is None else str(cell) for cell in row], min(index / total, 1.0) if total else 0.0
+    except damaged as error:
+        raise BoqImportError(f"{os.path.basename(path)} is not a readable .xlsx workbook ({error})") from error
+    finally:
+        workbook.close()
+
+
+def read_rows(path):
+    """
+    Rows of a CSV or .xlsx sheet, one at a time.
+
+    Args:
+        path (str): Sheet to read; .xlsx files are read as Excel, anything else as CSV.
+
+    Returns:
+        iterator: (list of cell texts, fraction of the file read so far) per row. A sheet
+            that turns out to be damaged while reading raises BoqImportError.
+    """
+    if path.lower().endswith(".xlsx"):
+        return _xlsx_rows(path)
+    return _csv_rows(path)
+
+
+def _header_columns(header):
+    columns = {}
+    for index, text in enumerate(header):
+        column = HEADER_ALIASES.get(re.sub(r"[^a-z0-9]", "", text.lower()))
+        if column is not None and column not in columns:
+            columns[column] = index
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise BoqImportError(f"The header row has no {' or '.join(missing)} column")
+    return columns
+
+
+class BoqImporter:
+    """
+    Reads a sheet into a component list chunk by chunk.
+
+    Args:
+        path (str): CSV or .xlsx sheet.
+        chunk_rows (int): Rows read between two progress reports.
+    """
+
+    def __init__(self, path, chunk_rows=CHUNK_ROWS):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.components = []
+        self.rows = 0  # material rows imported
+        self.skipped = 0  # non-empty rows missing a material or a numeric quantity
+
+    def chunks(self):
+        """
+        Read the sheet, reporting progress after every chunk of rows. Stop iterating to
+        cancel; the rows read so far stay in components.
+
+        Yields:
+            float: Fraction of the file read so far.
+
+        Raises:
+            BoqImportError: If the sheet is empty, damaged or its header lacks a required column.
+        """
+        rows = read_rows(self.path)
+        try:
+            header = next(rows, None)
+            if header is None:
+                raise BoqImportError(f"{os.path.basename(self.path)} is empty")
+            columns = _header_columns(header[0])
+            components, sub_components = {}, {}
+
+            def cell(row, column):
+                index = columns.get(column)
+                return row[index].strip() if index is not None and index < len(row) else ""
+
+            in_chunk = 0
+            for row, fraction in rows:
+                material, quantity = cell(row, "material"), cell(row, "quantity")
+                if not material or parse_number(quantity, None) is None:
+                    if any(text.strip() for text in row):
+                        self.skipped += 1
+                    continue
+                component_name, sub_component_name = cell(row, "component"), cell(row, "sub_component")
+                component = components.get(component_name)
+                if component is None:
+                    component = components[component_name] = Component(component_name)
+                    self.components.append(component)
+                sub_component = sub_components.get((component_name, sub_component_name))
+                if sub_component is None:
+                    sub_component = SubComponent(sub_component_name)
+                    sub_components[component_name, sub_component_name] = sub_component
+                    component.sub_components.append(sub_component)
+                sub_component.materials.append(material_row(material, quantity, cell(row, "unit"),
+                                                            cell(row, "rate"), cell(row, "rate_source")))
+                self.rows += 1
+                in_chunk += 1
+                if in_chunk == self.chunk_rows:
+                    in_chunk = 0
+                    yield fraction
+            yield 1.0
+        finally:
+            rows.close()  # closes the file when the import is cancelled
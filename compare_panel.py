@@ -0,0 +1,168 @@
+"""
+Compare panel: variants of a bridge side by side.
+
+Variants are snapshots of the engine inputs of the project being edited or of a
+project file. The panel shows the present value of every cost head per variant and,
+for the variant picked, its difference from the first variant (the baseline) year by
+year. Evaluation is done by scenarios; NumPy is only imported once a variant is added.
+"""
+import os
+
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import Qt
+
+import form_data_storage
+
+
+def _item(value):
+    item = QtWidgets.QTableWidgetItem(f"{value:,.0f}")
+    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+    return item
+
+
+class ComparePanel(QtWidgets.QWidget):
+    """
+    Variant list, present value table and year-by-year difference table.
+
+    Args:
+        parent (QWidget): Owner of the panel.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.comparison = None  # scenarios.Comparison, created with the first variant
+
+        add_current = QtWidgets.QPushButton("Add Current Project")
+        add_current.clicked.connect(self.add_current_project)
+        add_file = QtWidgets.QPushButton("Add Project File...")
+        add_file.clicked.connect(self.add_project_file)
+        self.remove_button = QtWidgets.QPushButton("Remove")
+        self.remove_button.clicked.connect(self.remove_variant)
+        clear = QtWidgets.QPushButton("Clear")
+        clear.clicked.connect(self.clear)
+        buttons = QtWidgets.QHBoxLayout()
+        for button in (add_current, add_file, self.remove_button, clear):
+            button.setStyleSheet("background-color: #ffffff")
+            buttons.addWidget(button)
+        buttons.addStretch(1)
+
+        self.summary = QtWidgets.QTableWidget()
+        self.summary.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.summary.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectColumns)
+        self.summary.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.summary.itemSelectionChanged.connect(self.show_difference)
+
+        self.difference_label = QtWidgets.QLabel()
+        self.yearly = QtWidgets.QTableWidget()
+        self.yearly.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.addLayout(buttons)
+        layout.addWidget(QtWidgets.QLabel("<b>Life-Cycle Cost (present value, INR)</b>"))
+        layout.addWidget(self.summary, 1)
+        layout.addWidget(self.difference_label)
+        layout.addWidget(self.yearly, 2)
+        self.refresh()
+
+    def add_variant(self, name, inputs):
+        """
+        Add a variant and show it.
+
+        Args:
+            name (str): Column header of the variant.
+            inputs (dict): Engine inputs, e.g. Project.engine_inputs().
+        """
+        if self.comparison is None:
+            import scenarios
+            self.comparison = scenarios.Comparison()
+        self.comparison.add(name, inputs)
+        self.refresh()
+        self.summary.selectColumn(len(self.comparison.variants) - 1)
+
+    def add_current_project(self):
+        project = form_data_storage.project
+        count = len(self.comparison.variants) if self.comparison else 0
+        name = project.general.project_title or "Current Project"
+        self.add_variant(f"{count + 1}. {name}", project.engine_inputs())
+
+    def add_project_file(self):
+        path = QtWidgets.QFileDialog.getOpenFileName(self, "Add Project File", "", "BICCA Projects (*.bicca)")[0]
+        if not path:
+            return
+        import project_file
+        try:
+            inputs = project_file.load(path).engine_inputs()
+        except (OSError, project_file.ProjectFileError) as error:
+            QtWidgets.QMessageBox.critical(self, "Compare", f"Could not open {path}:\n{error}")
+            return
+        count = len(self.comparison.variants) if self.comparison else 0
+        self.add_variant(f"{count + 1}. {os.path.splitext(os.path.basename(path))[0]}", inputs)
+
+    def remove_variant(self):
+        column = self.summary.currentColumn()
+        if self.comparison is None or not 0 <= column < len(self.comparison.variants):
+            return
+        self.comparison.remove(column)
+        self.refresh()
+
+    def clear(self):
+        if self.comparison is not None:
+            self.comparison.clear()
+        self.refresh()
+
+    def refresh(self):
+        """Show the present values of every variant."""
+        result = self.comparison.evaluate() if self.comparison else None
+        self.remove_button.setEnabled(result is not None)
+        if result is None:
+            self.summary.clear()
+            self.summary.setRowCount(0)
+            self.summary.setColumnCount(0)
+            self.show_difference()
+            return
+
+        import lcc_engine
+        import scenarios
+        present_values = result.present_values
+        self.summary.blockSignals(True)
+        self.summary.clear()
+        self.summary.setRowCount(len(scenarios.HEADS))
+        self.summary.setColumnCount(len(result.names))
+        self.summary.setHorizontalHeaderLabels(result.names)
+        self.summary.setVerticalHeaderLabels([lcc_engine.COST_HEAD_LABELS[head] for head in scenarios.HEADS])
+        for column, values in enumerate(present_values):
+            for row, value in enumerate(values):
+                self.summary.setItem(row, column, _item(value))
+        self.summary.resizeColumnsToContents()
+        self.summary.blockSignals(False)
+        self.show_difference()
+
+    def show_difference(self):
+        """Show the selected variant minus the baseline, year by year."""
+        result = self.comparison.evaluate() if self.comparison else None
+        column = self.summary.currentColumn()
+        if result is None or not 0 < column < len(result.names):
+            self.difference_label.setText("<b>Select a variant other than the first to see its difference "
+                                          "from the first, year by year.</b>" if result else "")
+            self.yearly.clear()
+            self.yearly.setRowCount(0)
+            self.yearly.setColumnCount(0)
+            return
+
+        import lcc_engine
+        import scenarios
+        self.difference_label.setText(f"<b>{result.names[column]} minus {result.names[0]} "
+                                      "(discounted, INR)</b>")
+        difference = result.difference(column)
+        # Only the years in which something differs
+        years = [index for index in range(len(result.years)) if difference[:, index].any()]
+        self.yearly.clear()
+        self.yearly.setRowCount(len(years))
+        self.yearly.setColumnCount(len(scenarios.HEADS))
+        self.yearly.setHorizontalHeaderLabels([lcc_engine.COST_HEAD_LABELS[head] for head in scenarios.HEADS])
+        self.yearly.setVerticalHeaderLabels([f"Year {result.years[index]:g}" for index in years])
+        for row, index in enumerate(years):
+            for column_index, value in enumerate(difference[:, index]):
+                self.yearly.setItem(row, column_index, _item(value))
+        self.yearly.resizeColumnsToContents()
@@ -0,0 +1,99 @@
+"""
+Incremental evaluation of the cost heads over the lcc_engine calculation graph.
+
+CostGraph keeps the value of every node of lcc_engine.NODES - intermediate results such
+as the closure days and the repair years, the cash flow of each cost head - and the
+present value of each head. When the inputs change, only the nodes downstream of the
+inputs that actually changed are dropped and recomputed. Editing the "Interest Rate"
+recomputes the Time Cost and the total; the carbon and traffic nodes keep their values.
+"""
+import numpy as np
+
+import lcc_engine
+
+
+def _present_value(cash_flow, factors):
+    return cash_flow @ factors
+
+
+def _total(*present_values):
+    return sum(present_values)
+
+
+# Present value of each cost head and the total, on top of the engine's cash-flow nodes
+PRESENT_VALUE_NODES = {
+    f"{head}.present_value": (_present_value, (head, "discount_factors")) for head in lcc_engine.COST_HEADS
+}
+PRESENT_VALUE_NODES[lcc_engine.TOTAL_HEAD] = (
+    _total, tuple(f"{head}.present_value" for head in lcc_engine.COST_HEADS))
+
+
+class CostGraph:
+    """
+    Cached values of the calculation graph of one project.
+    """
+
+    def __init__(self):
+        self.nodes = dict(lcc_engine.NODES, **PRESENT_VALUE_NODES)
+        self._dependents = {}
+        for name, (_, dependencies) in self.nodes.items():
+            for dependency in dependencies:
+                self._dependents.setdefault(dependency, []).append(name)
+        self._inputs = {}
+        self._values = {}
+        self.recomputed = []  # nodes computed by the latest results() call, for profiling
+
+    @property
+    def inputs(self):
+        """Engine inputs of the latest set_inputs() call, defaults filled in."""
+        return self._inputs
+
+    def set_inputs(self, inputs):
+        """
+        Take new engine inputs, invalidating the nodes downstream of the ones that changed.
+
+        Args:
+            inputs (dict): Mapping of input name to number (see lcc_engine.DEFAULT_INPUTS).
+
+        Returns:
+            list: Names of the inputs that changed.
+        """
+        inputs = lcc_engine.resolve_inputs(inputs)
+        changed = [name for name, value in inputs.items()
+                   if name not in self._inputs or not np.array_equal(value, self._inputs[name])]
+        self._inputs = inputs
+        self.invalidate(changed)
+        return changed
+
+    def invalidate(self, names):
+        """
+        Drop the cached values of nodes and of everything downstream of them.
+
+        Args:
+            names (iterable): Input or node names.
+        """
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if self._values.pop(name, None) is not None or name not in self.nodes:
+                pending.extend(self._dependents.get(name, ()))
+
+    def cached(self, name):
+        """True if a node's value is known without recomputing it."""
+        return name in self._values
+
+    def results(self):
+        """
+        Present value of every cost head and the Total Life-Cycle Cost, recomputing only
+        the nodes invalidated since the previous call.
+
+        Returns:
+            dict: Cost head name to present value, as lcc_engine.evaluate() returns it.
+        """
+        known = set(self._values)
+        names = [f"{head}.present_value" for head in lcc_engine.COST_HEADS] + [lcc_engine.TOTAL_HEAD]
+        lcc_engine.compute_nodes(self._inputs, names, self._values, self.nodes)
+        self.recomputed = [name for name in self._values if name not in known and name in self.nodes]
+        results = {head: self._values[f"{head}.present_value"] for head in lcc_engine.COST_HEADS}
+        results[lcc_engine.TOTAL_HEAD] = self._values[lcc_engine.TOTAL_HEAD]
+        return {head: float(np.squeeze(value)) for head, value in results.items()}
@@ -0,0 +1,122 @@
+"""
+Registry of the Project Details dialogs.
+
+The dialog modules are only imported, and their widget trees only built, when a
+dialog is first opened, so starting the main window does not pay for all nine.
+Built dialogs are kept in a DialogPool and shown again on the next open.
+"""
+import importlib
+from collections import OrderedDict
+
+from PyQt5 import QtWidgets
+
+# Dialog name -> (module, Ui class) for every Project Details window
+PROJECT_DIALOGS = {
+    "BridgeTraffic": ("ProjectDetails_BridgeANDTrafficData_Window", "Ui_BridgeTraffic_Dialog"),
+    "Foundation": ("ProjectDetails_Foundation_Window", "Ui_Foundation_Dialog"),
+    "CarbonEmission": ("ProjectDetails_CarbonEmissionData_Window", "Ui_CarbonEmission_Dialog"),
+    "Demolition": ("ProjectDetails_DemolitionANDRecyclingData_Window", "Ui_Demolition_Dialog"),
+    "Financial": ("ProjectDetails_FinancialData_Window", "Ui_FinancialData_Dialog"),
+    "Maintenance": ("ProjectDetails_MaintenanceANDRepairData_Window", "Ui_Maintenance_Dialog"),
+    "Miscellaneous": ("ProjectDetails_Miscellaneous_Window", "Ui_Miscellaneous_Dialog"),
+    "SubStructure": ("ProjectDetails_SubStructure_Window", "Ui_SubStructure_Dialog"),
+    "SuperStructure": ("ProjectDetails_SuperStructure_Window", "Ui_SuperStructure_Dialog"),
+}
+
+# Each dialog is a full 1440x1000 widget tree, so only this many are kept alive at once
+DEFAULT_POOL_SIZE = 5
+
+
+def load_ui_class(name):
+    """
+    Import the module of a Project Details dialog on first use and return its Ui class.
+
+    Args:
+        name (str): Key of PROJECT_DIALOGS.
+
+    Returns:
+        type: The generated Ui_*_Dialog class.
+    """
+    module_name, class_name = PROJECT_DIALOGS[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def build_dialog(name, parent=None):
+    """
+    Construct a Project Details dialog and run its setupUi.
+
+    Args:
+        name (str): Key of PROJECT_DIALOGS.
+        parent (QWidget): Parent widget of the dialog.
+
+    Returns:
+        tuple: (QDialog, Ui object)
+    """
+    dialog = QtWidgets.QDialog(parent)
+    ui = load_ui_class(name)()
+    ui.setupUi(dialog)
+    return dialog, ui
+
+
+class DialogPool:
+    """
+    Built Project Details dialogs of one project, reused on every open.
+
+    The pool holds at most max_dialogs dialogs; opening another one destroys the
+    least recently used dialog, which is rebuilt empty the next time it is opened.
+    """
+
+    def __init__(self, parent=None, max_dialogs=DEFAULT_POOL_SIZE):
+        self.parent = parent
+        self.max_dialogs = max(1, max_dialogs)
+        self._dialogs = OrderedDict()
+
+    def acquire(self, name):
+        """
+        Return the dialog for a name, building it only if it is not pooled.
+
+        Args:
+            name (str): Key of PROJECT_DIALOGS.
+
+        Returns:
+            tuple: (QDialog, Ui object)
+        """
+        if name in self._dialogs:
+            self._dialogs.move_to_end(name)
+            return self._dialogs[name]
+        entry = build_dialog(name, self.parent)
+        self._dialogs[name] = entry
+        self._evict()
+        return entry
+
+    def get(self, name):
+        """
+        Return a pooled dialog without building or reordering it.
+
+        Args:
+            name (str): Key of PROJECT_DIALOGS.
+
+        Returns:
+            tuple: (QDialog, Ui object), or None if the dialog is not pooled.
+        """
+        return self._dialogs.get(name)
+
+    def _evict(self):
+        while len(self._dialogs) > self.max_dialogs:
+            _, (dialog, _) = self._dialogs.popitem(last=False)
+            dialog.deleteLater()
+
+    def clear(self):
+        """
+        Destroy every pooled dialog, e.g. when a different project is loaded.
+        """
+        for dialog, _ in self._dialogs.values():
+            dialog.deleteLater()
+        self._dialogs.clear()
+
+    def __contains__(self, name):
+        return name in self._dialogs
+
+    def __len__(self):
+        return len(self._dialogs)
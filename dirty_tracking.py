@@ -0,0 +1,73 @@
+"""
+Per-section dirty tracking of the project model.
+
+Field edits (reported by the widgets' textChanged / currentTextChanged signals through
+field_bindings) mark the section they belong to, or the bill of quantities for
+material rows (see project_model.section_key). Every consumer - saving the project
+file, saving a version - keeps its own dirty set, so each one only reworks the
+sections changed since it last ran. Results are kept up to date by cost_graph, which
+tracks the changed engine inputs itself.
+"""
+from project_model import section_key
+
+# Consumers that keep their own dirty set
+CONSUMERS = ("save", "versions")
+
+
+class DirtyTracker:
+    """
+    Dirty section keys of one project, per consumer.
+
+    A consumer's set is None while everything must be treated as changed, e.g. right
+    after a project was opened or restored and before the consumer first ran.
+
+    Args:
+        consumers (tuple): Names of the consumers.
+    """
+
+    def __init__(self, consumers=CONSUMERS):
+        self._dirty = dict.fromkeys(consumers)
+
+    def mark(self, path):
+        """
+        Record an edit of a model path.
+
+        Args:
+            path (str): Dotted model path, e.g. "financial.discount_rate".
+        """
+        key = section_key(path)
+        for dirty in self._dirty.values():
+            if dirty is not None:
+                dirty.add(key)
+
+    def mark_all(self, consumers=None):
+        """
+        Treat every section as changed.
+
+        Args:
+            consumers (tuple): Consumers to reset; all of them by default.
+        """
+        for consumer in consumers or tuple(self._dirty):
+            self._dirty[consumer] = None
+
+    def dirty(self, consumer):
+        """
+        Section keys changed since the consumer last ran.
+
+        Args:
+            consumer (str): Consumer name.
+
+        Returns:
+            set: Section keys, or None if everything must be treated as changed.
+        """
+        dirty = self._dirty[consumer]
+        return None if dirty is None else set(dirty)
+
+    def clear(self, consumer):
+        """
+        Mark the consumer as up to date, e.g. after the project was saved.
+
+        Args:
+            consumer (str): Consumer name.
+        """
+        self._dirty[consumer] = set()
@@ -0,0 +1,138 @@
+"""
+Shared cache of discounting factor tables.
+
+Every life-cycle cost calculation multiplies its yearly cash flows by the same
+present-worth vector for a given "Real Discount Rate" and "Duration of Study".
+The tables below are computed once per (rate, horizon) pair, kept in a
+least-recently-used cache and handed out as read-only arrays so that cost heads,
+sweeps and scenario comparisons can share them safely.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# Number of (rate, horizon) pairs kept in memory
+CACHE_SIZE = 256
+# More distinct rates than this in one present_worth_table call (e.g. Monte Carlo draws)
+# are computed directly rather than pushing every useful table out of the cache
+DIRECT_RATES = CACHE_SIZE // 4
+
+
+def _key(rate, horizon):
+    # Round so that 7.0 and 7.000000000001 coming from different widgets share an entry
+    return round(float(rate), 10), int(horizon)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _tables(rate, horizon):
+    """
+    Compute the factor tables for one discount rate.
+
+    Args:
+        rate (float): Real discount rate in percent.
+        horizon (int): Last year of the study.
+
+    Returns:
+        tuple: (present_worth, annuity, capital_recovery) read-only arrays of length horizon + 1.
+    """
+    i = rate / 100.0
+    n = np.arange(max(horizon, -1) + 1, dtype=float)  # empty tables for a negative horizon
+    present_worth = (1.0 + i) ** -n
+    if i == 0.0:
+        annuity = n.copy()
+    else:
+        annuity = (1.0 - present_worth) / i
+    with np.errstate(divide="ignore"):
+        capital_recovery = 1.0 / annuity
+    if horizon >= 0:
+        capital_recovery[0] = np.nan  # A zero-year recovery period has no meaning
+    for table in (present_worth, annuity, capital_recovery):
+        table.setflags(write=False)
+    return present_worth, annuity, capital_recovery
+
+
+def present_worth_factors(rate, horizon):
+    """
+    Single-payment present-worth factors (P/F) for years 0..horizon.
+
+    Args:
+        rate (float): Real discount rate in percent.
+        horizon (int): Last year of the study.
+
+    Returns:
+        numpy.ndarray: Read-only array of (1 + i)^-n.
+    """
+    return _tables(*_key(rate, horizon))[0]
+
+
+def annuity_factors(rate, horizon):
+    """
+    Uniform-series present-worth factors (P/A) for periods of 0..horizon years.
+
+    Args:
+        rate (float): Real discount rate in percent.
+        horizon (int): Longest period in years.
+
+    Returns:
+        numpy.ndarray: Read-only array of (1 - (1 + i)^-n) / i.
+    """
+    return _tables(*_key(rate, horizon))[1]
+
+
+def capital_recovery_factors(rate, horizon):
+    """
+    Capital-recovery factors (A/P) for periods of 0..horizon years.
+
+    Args:
+        rate (float): Real discount rate in percent.
+        horizon (int): Longest period in years.
+
+    Returns:
+        numpy.ndarray: Read-only array of i / (1 - (1 + i)^-n); the entry for n = 0 is NaN.
+    """
+    return _tables(*_key(rate, horizon))[2]
+
+
+def present_worth_table(rates, horizon):
+    """
+    Present-worth factors for one or many discount rates.
+    Each distinct rate is looked up in the cache once, however often it repeats. When
+    there are more than DIRECT_RATES distinct rates they are computed in one array
+    operation and not cached.
+
+    Args:
+        rates (float or numpy.ndarray): Real discount rate(s) in percent.
+        horizon (int): Last year of the study.
+
+    Returns:
+        numpy.ndarray: Factors with shape rates.shape + (horizon + 1,).
+    """
+    rates = np.asarray(rates, dtype=float)
+    if rates.ndim == 0:
+        return present_worth_factors(rates, horizon)
+    unique, inverse = np.unique(rates, return_inverse=True)
+    if unique.size == 0:  # an empty batch
+        return np.empty(rates.shape + (max(int(horizon), -1) + 1,))
+    if len(unique) > DIRECT_RATES:
+        n = np.arange(max(int(horizon), -1) + 1, dtype=float)
+        rows = (1.0 + np.round(unique, 10) / 100.0)[:, np.newaxis] ** -n
+    else:
+        rows = np.stack([present_worth_factors(rate, horizon) for rate in unique])
+    return rows[inverse.reshape(rates.shape)]
+
+
+def cache_info():
+    """
+    Hit/miss statistics of the shared factor cache.
+
+    Returns:
+        functools._CacheInfo: Named tuple of hits, misses, maxsize and currsize.
+    """
+    return _tables.cache_info()
+
+
+def cache_clear():
+    """
+    Drop every cached factor table.
+    """
+    _tables.cache_clear()
@@ -0,0 +1,196 @@
+"""
+Which widget of which Project Details dialog edits which field of the project model.
+
+Dialogs made of plain fields map widget names to dotted model paths. The Structure
+Works and Carbon Emission dialogs are bills of quantities: material_grid replaces their
+fixed material rows with a grid (ui.material_model) when they are built, the bill is
+shown and edited through it, and any edit replaces the whole component list of its
+part of the project (e.g. "structure.foundation").
+"""
+from PyQt5 import QtGui, QtWidgets
+
+from project_model import ROAD_TYPES
+
+# Dialog name (see dialog_registry.PROJECT_DIALOGS) -> {widget name: model path}
+FIELDS = {
+    "Financial": {
+        "lineEdit_5": "financial.discount_rate",
+        "comboBox_3": "financial.interest_rate",
+        "comboBox_2": "financial.investment_ratio",
+        "lineEdit_6": "financial.study_duration",
+        "lineEdit_13": "financial.construction_time",
+    },
+    "BridgeTraffic": {
+        "comboBox_7": "traffic.number_of_lanes",
+        "lineEdit_9": "traffic.reroute_distance",
+        "comboBox_6": "traffic.road_roughness",
+        "lineEdit_10": "traffic.rise_and_fall",
+        "comboBox_8": "traffic.road_type",
+        "comboBox_9": "traffic.traffic_growth",
+        "lineEdit_11": "traffic.cars",
+        "lineEdit_12": "traffic.buses",
+        "lineEdit_15": "traffic.hcv",
+        "lineEdit_16": "traffic.mcv",
+        "lineEdit_17": "traffic.lcv",
+    },
+    "Maintenance": {
+        "lineEdit_5": "maintenance.periodic_maintenance_rate",
+        "lineEdit_7": "maintenance.routine_inspection_rate",
+        "lineEdit_8": "maintenance.repair_rate",
+        "lineEdit_9": "maintenance.periodic_maintenance_interval",
+        "lineEdit_10": "maintenance.routine_inspection_interval",
+    },
+    "Demolition": {
+        "lineEdit_5": "demolition.demolition_rate",
+        "lineEdit_6": "demolition.scrap_value_steel",
+        "lineEdit_13": "demolition.steel_scrap_fraction",
+    },
+    "CarbonEmission": {
+        "lineEdit_55": "carbon.carbon_price",
+    },
+}
+
+# Dialog name -> {combo box name: items}, for combo boxes that list fixed choices
+CHOICES = {
+    "BridgeTraffic": {"comboBox_8": ("",) + tuple(ROAD_TYPES)},
+}
+
+# Dialog name -> {combo box name: decimals}, for combo boxes that take a typed number.
+# The dialogs ship them empty and not editable, so they are made editable and validated.
+NUMBER_COMBOS = {
+    "Financial": {"comboBox_3": 2, "comboBox_2": 2},
+    "BridgeTraffic": {"comboBox_7": 0, "comboBox_6": 0, "comboBox_9": 2},
+}
+
+# Bill of quantities dialogs: (model path, component name)
+STRUCTURE_LAYOUTS = {
+    "Foundation": ("structure.foundation", "Foundation"),
+    "SuperStructure": ("structure.super_structure", "Super-Structure"),
+    "SubStructure": ("structure.sub_structure", "Sub-Structure"),
+    "Miscellaneous": ("structure.miscellaneous", "Miscellaneous"),
+    "CarbonEmission": ("carbon.components", "Carbon Emission"),
+}
+
+
+def widget_value(widget):
+    """
+    Text currently shown by a line edit, text edit, combo box or label.
+    """
+    if isinstance(widget, QtWidgets.QComboBox):
+        return widget.currentText()
+    if isinstance(widget, QtWidgets.QTextEdit):
+        return widget.toPlainText()
+    return widget.text()
+
+
+def set_widget_value(widget, value):
+    """
+    Show a model value in a widget without emitting its change signals.
+
+    Args:
+        widget (QWidget): Line edit, text edit or combo box.
+        value (str or float): Value from the model; zero floats are shown as blank.
+    """
+    if isinstance(value, float):
+        value = f"{value:g}" if value else ""
+    blocked = widget.blockSignals(True)
+    try:
+        if isinstance(widget, QtWidgets.QComboBox):
+            if value and widget.findText(value) < 0 and not widget.isEditable():
+                widget.addItem(value)
+            widget.setCurrentText(value)
+        elif isinstance(widget, QtWidgets.QTextEdit):
+            widget.setPlainText(value)
+        else:
+            widget.setText(value)
+    finally:
+        widget.blockSignals(blocked)
+
+
+def change_signal(widget):
+    """
+    The signal a widget emits when the user edits it, or None for read-only widgets.
+    """
+    if isinstance(widget, QtWidgets.QComboBox):
+        return widget.currentTextChanged
+    if isinstance(widget, QtWidgets.QTextEdit):
+        return widget.textChanged
+    if isinstance(widget, QtWidgets.QLineEdit):
+        return widget.textChanged
+    return None
+
+
+def show(ui, name, project):
+    """
+    Fill a dialog's widgets from the project model.
+
+    Args:
+        ui: The dialog's Ui_* object.
+        name (str): Dialog name.
+        project (Project): Project to show.
+    """
+    for widget_name, items in CHOICES.get(name, {}).items():
+        combo = getattr(ui, widget_name)
+        if combo.count() == 0:
+            blocked = combo.blockSignals(True)
+            combo.addItems(items)
+            combo.blockSignals(blocked)
+    for widget_name, decimals in NUMBER_COMBOS.get(name, {}).items():
+        combo = getattr(ui, widget_name)
+        if not combo.isEditable():
+            combo.setEditable(True)
+            validator = QtGui.QDoubleValidator(combo)
+            validator.setDecimals(decimals)
+            validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+            combo.setValidator(validator)
+    for widget_name, path in FIELDS.get(name, {}).items():
+        set_widget_value(getattr(ui, widget_name), project.get(path))
+    if name in STRUCTURE_LAYOUTS:
+        ui.material_model.set_components(project.get(STRUCTURE_LAYOUTS[name][0]))
+
+
+def dialogs_for(path):
+    """
+    Names of the dialogs that show a model path.
+    """
+    names = [name for name, fields in FIELDS.items() if path in fields.values()]
+    names += [name for name, layout in STRUCTURE_LAYOUTS.items() if layout[0] == path]
+    return names
+
+
+def show_path(ui, name, project, path):
+    """
+    Refresh the widgets of one model path in a dialog, e.g. after an undo.
+
+    Args:
+        ui: The dialog's Ui_* object.
+        name (str): Dialog name.
+        project (Project): Project to show.
+        path (str): Model path that changed.
+    """
+    for widget_name, widget_path in FIELDS.get(name, {}).items():
+        if widget_path == path:
+            set_widget_value(getattr(ui, widget_name), project.get(path))
+    if name in STRUCTURE_LAYOUTS and STRUCTURE_LAYOUTS[name][0] == path:
+        ui.material_model.set_components(project.get(path))
+
+
+def connect(ui, name, on_change):
+    """
+    Report every edit in a dialog as a change of a model field.
+
+    Args:
+        ui: The dialog's Ui_* object.
+        name (str): Dialog name.
+        on_change (callable): Called with (model path, new value, widget name). For bill
+            of quantities dialogs the value is a freshly built component list.
+    """
+    for widget_name, path in FIELDS.get(name, {}).items():
+        widget = getattr(ui, widget_name)
+        change_signal(widget).connect(
+            lambda _=None, widget=widget, path=path, widget_name=widget_name:
+                on_change(path, widget_value(widget), widget_name))
+
+    if name in STRUCTURE_LAYOUTS:
+        path = STRUCTURE_LAYOUTS[name][0]
+        ui.material_model.on_change = lambda components, cell: on_change(path, components, cell)
@@ -1,24 +1,110 @@
-# Global dictionary to store form data
-form_data = {}
+"""
+The project being edited, and change notifications for it.
+
+Every edit made through set_value or save_form_data is published to the callbacks
+subscribed to its model path, e.g. "financial.discount_rate", or to a prefix of it
+such as "financial". Replacing the whole project (set_project) is published with
+the path None.
+"""
+from project_model import Project
+
+# The project being edited; every Project Details dialog saves into it
+project = Project()
+
+# (path prefix, callback) in the order they subscribed
+_subscribers = []
+
+# Form keys of the dialogs made of plain fields, and the model field each is stored in
+DIALOG_FIELDS = {
+    "FinancialData_Dialog": {
+        "real_discount_rate": "financial.discount_rate",
+        "interest_rate": "financial.interest_rate",
+        "investment_ratio": "financial.investment_ratio",
+        "duration_of_study": "financial.study_duration",
+        "construction_time": "financial.construction_time",
+    },
+}
+
 
 def save_form_data(window_name, data):
     """
-    Save form data to the global dictionary.
+    Save the fields of a dialog into the project model.
 
     Args:
         window_name (str): The name of the window/dialog.
-        data (dict): The data to save.
+        data (dict): Form key to the text or value of the widget.
+    """
+    paths = DIALOG_FIELDS[window_name]
+    for key, value in data.items():
+        set_value(paths[key], value)
+
+
+def subscribe(callback, prefix=""):
+    """
+    Call back on every change of the model paths under a prefix.
+
+    Args:
+        callback (callable): Called with (path, new value) after each change, and with
+            (None, None) when the whole project was replaced.
+        prefix (str): A model path, a section name such as "traffic", or "" for every path.
+    """
+    _subscribers.append((prefix, callback))
+
+
+def unsubscribe(callback):
+    """Stop calling back a subscribed callback."""
+    _subscribers[:] = [entry for entry in _subscribers if entry[1] != callback]
+
+
+def _matches(prefix, path):
+    return path is None or not prefix or path == prefix or path.startswith(prefix + ".")
+
+
+def publish(path):
     """
-    form_data[window_name] = data
+    Notify the subscribers of a model path that it changed.
+
+    Args:
+        path (str): Model path that changed, or None if the whole project did.
+    """
+    value = None if path is None else project.get(path)
+    for prefix, callback in list(_subscribers):
+        if _matches(prefix, path):
+            callback(path, value)
+
+
+def set_value(path, value):
+    """
+    Change one field of the project model and publish the change.
+
+    Args:
+        path (str): Dotted model path, e.g. "financial.discount_rate".
+        value: New value; text is parsed as in Project.set.
+    """
+    project.set(path, value)
+    publish(path)
+
+
+def set_project(new_project):
+    """
+    Make another project the one being edited, e.g. after File -> Open.
+
+    Args:
+        new_project (Project): The project to edit.
+    """
+    global project
+    project = new_project
+    publish(None)
+
 
 def get_form_data(window_name):
     """
-    Retrieve form data for a specific window.
+    Retrieve the fields of a dialog from the project model.
 
     Args:
         window_name (str): The name of the window/dialog.
 
     Returns:
-        dict: The saved data for the window, or an empty dictionary if not found.
+        dict: Form key to the stored value, or an empty dictionary for an unknown dialog.
     """
-    return form_data.get(window_name, {})
\ No newline at end of file
+    return {key: project.get(path) for key, path in DIALOG_FIELDS.get(window_name, {}).items()}
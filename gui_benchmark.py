@@ -0,0 +1,282 @@
+"""
+Offscreen GUI latency benchmarks for BICCA Studio.
+
+Usage:
+    python gui_benchmark.py [--repeats N] [--cold-starts N] [--only NAME ...]
+                            [--save-baseline FILE] [--baseline FILE] [--threshold 0.25]
+
+Runs without a display (QT_QPA_PLATFORM=offscreen). Cold-start runs use a fresh
+interpreter so module imports are paid every time, like a user launching the
+application; every other benchmark runs in this process. Each benchmark reports
+p50/p90/p99/max in milliseconds. With --baseline, the exit code is 1 if any
+benchmark's p50 or p90 is slower than the baseline by more than the threshold.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Keep benchmark windows away from the user's autosave journal
+os.environ.setdefault("BICCA_AUTOSAVE_DIR", tempfile.mkdtemp(prefix="bicca-benchmark-"))
+
+# Executed in a fresh interpreter; prints "<import Home> <MainWindow()>" in seconds
+COLD_START_SNIPPET = """
+import time
+from PyQt5 import QtWidgets
+app = QtWidgets.QApplication([])
+start = time.perf_counter()
+import Home
+imported = time.perf_counter()
+window = Home.MainWindow()
+built = time.perf_counter()
+print(imported - start, built - imported)
+"""
+
+PERCENTILES = (50, 90, 99)
+
+
+def offscreen_environment():
+    """
+    Environment for child processes that forces the offscreen Qt platform.
+
+    Returns:
+        dict: Copy of os.environ with QT_QPA_PLATFORM set.
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def measure_cold_start(runs=5):
+    """
+    Time importing Home and constructing MainWindow in fresh interpreters.
+
+    Args:
+        runs (int): Number of interpreter launches.
+
+    Returns:
+        list: One (import_seconds, construct_seconds) tuple per run.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", COLD_START_SNIPPET], cwd=here,
+                                env=offscreen_environment(), capture_output=True,
+                                text=True, check=True).stdout
+        import_time, construct_time = map(float, output.split()[-2:])
+        samples.append((import_time, construct_time))
+    return samples
+
+
+def _application():
+    from PyQt5 import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _timed(action, repeats, app=None):
+    samples = []
+    for index in range(repeats):
+        start = time.perf_counter()
+        action(index)
+        if app is not None:
+            app.processEvents()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _main_window():
+    import Home
+    app = _application()
+    window = Home.MainWindow()
+    window.show()
+    app.processEvents()
+    return app, window
+
+
+def bench_main_window(repeats):
+    """Time MainWindow() construction in a warm interpreter."""
+    import Home
+    app = _application()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        window = Home.MainWindow()
+        samples.append(time.perf_counter() - start)
+        # Untimed teardown, so later samples do not pay for the store subscriptions
+        # and journal threads of earlier windows
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return samples
+
+
+def bench_dialog(name):
+    """Time setupUi of one Project Details dialog on a fresh QDialog."""
+    def bench(repeats):
+        from PyQt5 import QtWidgets
+        import dialog_registry
+        app = _application()
+        ui_class = dialog_registry.load_ui_class(name)
+        dialogs = []
+
+        def build(_):
+            dialog = QtWidgets.QDialog()
+            ui_class().setupUi(dialog)
+            dialogs.append(dialog)
+
+        samples = _timed(build, repeats)
+        for dialog in dialogs:
+            dialog.deleteLater()
+        app.processEvents()
+        return samples
+    return bench
+
+
+def bench_tab_switch(repeats):
+    """Time MainWindow.handle_tab_click while cycling through the window tabs."""
+    app, window = _main_window()
+    tabs = ["Results", "Compare", "Project Details", "Tutorials"]
+    samples = _timed(lambda index: window.handle_tab_click(tabs[index % len(tabs)]), repeats, app)
+    window.close()
+    return samples
+
+
+def bench_group_toggle(group_name, toggle_name):
+    """Time one of the collapsible Project Details group boxes opening and closing."""
+    def bench(repeats):
+        app, window = _main_window()
+        group = getattr(window, group_name)
+        toggle = getattr(window, toggle_name)
+
+        def toggle_once(index):
+            # The slot reads the group's state (e.g. the Outputs group only refreshes
+            # results while checked), so check it the way a click would first
+            checked = index % 2 == 0
+            blocked = group.blockSignals(True)
+            group.setChecked(checked)
+            group.blockSignals(blocked)
+            toggle(group, checked)
+
+        samples = _timed(toggle_once, repeats, app)
+        window.close()
+        return samples
+    return bench
+
+
+BENCHMARKS = {
+    "main_window": bench_main_window,
+    "tab_switch": bench_tab_switch,
+    "toggle_general_info": bench_group_toggle("generalInfoGroup", "toggle_general_info_group_content"),
+    "toggle_input_params": bench_group_toggle("inputParamsGroup", "toggle_input_params_group_content"),
+    "toggle_outputs": bench_group_toggle("outputsGroup", "toggle_outputs_group_content"),
+}
+for _dialog in ("BridgeTraffic", "Foundation", "CarbonEmission", "Demolition", "Financial",
+                "Maintenance", "Miscellaneous", "SubStructure", "SuperStructure"):
+    BENCHMARKS[f"setupUi_{_dialog}"] = bench_dialog(_dialog)
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples (list): Measured values.
+        pct (float): Percentile between 0 and 100.
+
+    Returns:
+        float: The percentile value.
+    """
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples):
+    """
+    Percentiles of a benchmark in milliseconds.
+
+    Args:
+        samples (list): Durations in seconds.
+
+    Returns:
+        dict: p50, p90, p99, max and mean in milliseconds.
+    """
+    millis = [sample * 1000 for sample in samples]
+    summary = {f"p{pct}": percentile(millis, pct) for pct in PERCENTILES}
+    summary["max"] = max(millis)
+    summary["mean"] = statistics.fmean(millis)
+    return summary
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Compare results against a saved baseline.
+
+    Args:
+        results (dict): Benchmark name to summary.
+        baseline (dict): Benchmark name to summary from an earlier run.
+        threshold (float): Allowed slowdown as a fraction, e.g. 0.25 for 25 %.
+
+    Returns:
+        list: Human-readable description of every regression.
+    """
+    regressions = []
+    for name, summary in results.items():
+        if name not in baseline:
+            continue
+        for key in ("p50", "p90"):
+            before, after = baseline[name][key], summary[key]
+            if before > 0 and after > before * (1.0 + threshold):
+                regressions.append(f"{name} {key}: {before:.3f} ms -> {after:.3f} ms "
+                                   f"(+{(after / before - 1.0) * 100:.0f} %)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offscreen GUI latency benchmarks")
+    parser.add_argument("--repeats", type=int, default=50, help="samples per in-process benchmark")
+    parser.add_argument("--cold-starts", type=int, default=5, help="number of fresh-interpreter launches")
+    parser.add_argument("--only", nargs="*", help="run only these benchmarks (cold_start is one of them)")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default 0.25 = 25 %%)")
+    args = parser.parse_args(argv)
+
+    selected = args.only or ["cold_start"] + list(BENCHMARKS)
+    results = {}
+    if "cold_start" in selected and args.cold_starts > 0:
+        samples = measure_cold_start(args.cold_starts)
+        results["cold_start_import"] = summarize([sample[0] for sample in samples])
+        results["cold_start_main_window"] = summarize([sample[1] for sample in samples])
+        results["cold_start_total"] = summarize([sum(sample) for sample in samples])
+    for name in selected:
+        if name in BENCHMARKS:
+            results[name] = summarize(BENCHMARKS[name](args.repeats))
+
+    print(f"{'benchmark':28} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}  (ms)")
+    for name, summary in results.items():
+        print(f"{name:28} {summary['p50']:9.3f} {summary['p90']:9.3f} {summary['p99']:9.3f} {summary['max']:9.3f}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
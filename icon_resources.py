@@ -0,0 +1,143 @@
+"""
+Shared icon and pixmap cache for the main window and the Project Details dialogs.
+
+Icons are bundled in the "icons" folder next to this file (or a folder named by the
+BICCA_ICON_DIR environment variable). An icon that is not bundled there is loaded from
+FALLBACK_ICON_DIR, the folder the dialogs were designed against and loaded every icon
+from before. The folder is listed once, every image is
+decoded at most once, and the same QIcon objects are handed to every widget that
+asks for them. HiDPI variants ("name@2x.png", or a smooth rescale when no such file
+exists) are only produced when a screen with a device pixel ratio above 1 needs them.
+"""
+import os
+
+from PyQt5 import QtCore, QtGui
+
+ICON_DIR = os.environ.get("BICCA_ICON_DIR",
+                          os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons"))
+
+# Where the dialogs originally loaded their icons from
+FALLBACK_ICON_DIR = ("C:/Users/saans/AppData/Local/Programs/Python/Python310/Lib/site-packages/"
+                     "qt5_applications/Qt/bin/../../../../../../../../../../Downloads")
+
+_index = None    # file name -> absolute path ("" if missing), filled by one directory listing
+_pixmaps = {}    # (name, device pixel ratio) -> QPixmap
+_icons = {}      # (name, on name) -> QIcon
+
+
+def _files():
+    global _index
+    if _index is None:
+        try:
+            with os.scandir(ICON_DIR) as entries:
+                _index = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            _index = {}
+    return _index
+
+
+def path(name):
+    """
+    Absolute path of an icon file.
+
+    Args:
+        name (str): File name of the icon, e.g. "Dismiss.png".
+
+    Returns:
+        str: Path inside ICON_DIR, else inside FALLBACK_ICON_DIR, or an empty string if
+            the icon is in neither.
+    """
+    files = _files()
+    found = files.get(name)
+    if found is None:  # looked up once, then remembered like the bundled files
+        fallback = os.path.join(FALLBACK_ICON_DIR, name)
+        found = files[name] = fallback if os.path.isfile(fallback) else ""
+    return found
+
+
+def url(name):
+    """
+    Path of a bundled icon in the form expected by a stylesheet url().
+
+    Args:
+        name (str): File name of the icon.
+
+    Returns:
+        str: Path with forward slashes.
+    """
+    return (path(name) or os.path.join(FALLBACK_ICON_DIR, name)).replace("\\", "/")
+
+
+def _device_pixel_ratio():
+    app = QtGui.QGuiApplication.instance()
+    screen = app.primaryScreen() if app is not None else None
+    return screen.devicePixelRatio() if screen is not None else 1.0
+
+
+def pixmap(name, ratio=1.0):
+    """
+    Decoded pixmap of a bundled icon, shared between all callers.
+
+    Args:
+        name (str): File name of the icon.
+        ratio (float): Device pixel ratio the pixmap is drawn at.
+
+    Returns:
+        QPixmap: The pixmap, or a null pixmap if the icon is not bundled.
+    """
+    key = (name, ratio)
+    if key in _pixmaps:
+        return _pixmaps[key]
+
+    if ratio == 1.0:
+        file_path = path(name)
+        result = QtGui.QPixmap(file_path) if file_path else QtGui.QPixmap()
+    else:
+        stem, extension = os.path.splitext(name)
+        hidpi_path = path(f"{stem}@{ratio:g}x{extension}")
+        if hidpi_path:
+            result = QtGui.QPixmap(hidpi_path)
+        else:
+            base = pixmap(name)
+            result = base if base.isNull() else base.scaled(
+                base.size() * ratio, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        result.setDevicePixelRatio(ratio)
+    _pixmaps[key] = result
+    return result
+
+
+def icon(name, on=None):
+    """
+    Shared QIcon for a bundled icon.
+
+    Args:
+        name (str): File name of the icon, used for the normal (and "off") state.
+        on (str): File name of the icon shown in the checked ("on") state, if any.
+
+    Returns:
+        QIcon: The cached icon.
+    """
+    key = (name, on)
+    if key in _icons:
+        return _icons[key]
+
+    ratio = _device_pixel_ratio()
+    result = QtGui.QIcon()
+    for state, state_name in ((QtGui.QIcon.Off, name), (QtGui.QIcon.On, on)):
+        if state_name is None:
+            continue
+        result.addPixmap(pixmap(state_name), QtGui.QIcon.Normal, state)
+        if ratio > 1.0:
+            result.addPixmap(pixmap(state_name, ratio), QtGui.QIcon.Normal, state)
+    _icons[key] = result
+    return result
+
+
+def clear():
+    """
+    Forget the directory listing and every decoded pixmap and icon.
+    """
+    global _index
+    _index = None
+    _pixmaps.clear()
+    _icons.clear()
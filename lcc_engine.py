@@ -0,0 +1,506 @@
+"""
+Life-cycle cost engine behind the "Output" cost heads of the Project Details dialogs.
+
+Every cost head is turned into a year-by-year cash-flow row over the "Duration of Study"
+and all rows are discounted together in a single NumPy pass.  Inputs may be plain numbers
+or 1-D arrays of equal length, in which case a whole batch of bridge options is evaluated
+at once (one row of results per option).
+
+The cash flows are built from a graph of nodes (NODES) in which results shared by
+several heads, such as the years the bridge is closed, are computed once; see
+cost_graph for recomputing only the part of the graph an edit reaches.
+"""
+import numpy as np
+
+from discount_tables import present_worth_table
+import form_data_storage
+from project_model import engine_inputs_for
+import road_user_cost
+import voc_grids
+
+# Cost heads in the order they are listed in the Output text browser
+COST_HEADS = (
+    "initial_construction_cost",
+    "initial_carbon_emission_cost",
+    "time_cost",
+    "road_user_cost",
+    "rerouting_carbon_emission_cost",
+    "periodic_maintenance_cost",
+    "maintenance_emission_cost",
+    "routine_inspection_cost",
+    "repair_rehabilitation_cost",
+    "reconstruction_cost",
+    "demolition_disposal_cost",
+    "recycling_cost",
+)
+TOTAL_HEAD = "total_life_cycle_cost"
+
+COST_HEAD_LABELS = {
+    "initial_construction_cost": "Initial Construction Cost",
+    "initial_carbon_emission_cost": "Initial Carbon emission Cost",
+    "time_cost": "Time Cost",
+    "road_user_cost": "Road User Cost",
+    "rerouting_carbon_emission_cost": "Carbon Emission due to Re-Routing",
+    "periodic_maintenance_cost": "Periodic Maintenance Costs",
+    "maintenance_emission_cost": "Maintenance Emission Costs",
+    "routine_inspection_cost": "Routine Inspectection Costs",
+    "repair_rehabilitation_cost": "Repair & Rehabilitation Costs",
+    "reconstruction_cost": "Reconstruction Costs",
+    "demolition_disposal_cost": "Demolition & Disposal Cost",
+    "recycling_cost": "Recycling Cost",
+    TOTAL_HEAD: "Total Life-Cycle Cost",
+}
+
+# Values used for any input that has not been entered yet. Rates are in percent,
+# intervals and durations in years, money in INR.
+DEFAULT_INPUTS = {
+    # Financial Data
+    "discount_rate": 7.0,
+    "interest_rate": 8.0,
+    "investment_ratio": 50.0,
+    "study_duration": 75.0,
+    "construction_time": 2.0,
+    # Structure Works Data (totals of the bill of quantities)
+    "construction_cost": 0.0,
+    "embodied_carbon": 0.0,  # kg CO2e
+    "steel_quantity": 0.0,  # MT
+    # Carbon Emission Cost Data
+    "carbon_price": 7.0,  # INR per kg CO2e
+    # Bridge and Traffic Data
+    "number_of_lanes": 2.0,
+    "road_roughness": 2000.0,  # mm/km
+    "rise_and_fall": 0.0,  # m/km
+    "road_speed_factor": 1.0,  # from the type of road, see project_model.ROAD_TYPES
+    "reroute_distance": 0.0,  # km
+    "traffic_growth": 5.0,  # % per year
+    "lcv": 0.0,  # PCU/D
+    "cars": 0.0,
+    "buses": 0.0,
+    "hcv": 0.0,
+    "mcv": 0.0,
+    "road_user_cost_per_day": 0.0,  # on top of the re-routed traffic's, per day of closure
+    "rerouting_emission_per_day": 0.0,  # kg CO2e per day of closure
+    "construction_closure_days": 0.0,
+    "repair_closure_days": 30.0,
+    "reconstruction_closure_days": 180.0,
+    # Maintenance and Repair
+    "periodic_maintenance_rate": 0.55,  # % of construction cost
+    "periodic_maintenance_interval": 5.0,
+    "routine_inspection_rate": 0.1,  # % of construction cost
+    "routine_inspection_interval": 1.0,
+    "repair_rate": 10.0,  # % of construction cost
+    "repair_interval": 25.0,
+    "design_life": 100.0,
+    # Demolition and Recycling
+    "demolition_rate": 10.0,  # % of construction cost
+    "scrap_value_steel": 30000.0,  # INR/MT
+    "steel_scrap_fraction": 90.0,  # %
+}
+
+
+# Inputs resolve_inputs keeps within bounds: name -> (lowest, highest) value. Values
+# typed into the dialogs can be anything, and a negative study would leave no years.
+INPUT_LIMITS = {
+    "study_duration": (0.0, 1000.0),  # years
+    "discount_rate": (-50.0, np.inf),  # % - (1 + r)^-t needs r > -100 % and stays finite over 1000 years
+}
+# Recurring events; 0 (or less) means never, anything else at least once a year
+INTERVAL_INPUTS = ("periodic_maintenance_interval", "routine_inspection_interval", "repair_interval",
+                   "design_life")
+
+
+# Nodes of the calculation graph: name -> (function, names of its dependencies). The
+# function is called with the values of its dependencies in order. Inputs (the keys
+# of DEFAULT_INPUTS) are the leaves; their value has a trailing axis of length one so
+# it broadcasts over the years. Every cost head is a node returning its cash flow with
+# shape (..., years), and intermediate results several heads share, such as the days
+# the bridge is closed, are nodes of their own so they are computed once.
+NODES = {}
+
+
+def _node(name, *dependencies):
+    def register(function):
+        NODES[name] = (function, dependencies)
+        return function
+    return register
+
+
+def _input(value):
+    return np.asarray(value, dtype=float)[..., None]
+
+
+def _every(interval, years, duration):
+    """
+    Mask of the years strictly inside the study period on which a recurring event falls.
+    Non-positive intervals never fire.
+    """
+    interval = np.where(interval > 0, interval, np.inf)
+    return (years % interval == 0) & (years > 0) & (years < duration)
+
+
+def _at_year(year, years):
+    return years == np.round(year)
+
+
+@_node("years", "study_duration")
+def _years(study_duration):
+    horizon = int(np.ceil(np.max(study_duration)))
+    return np.arange(horizon + 1, dtype=float)
+
+
+@_node("start_year", "years")
+def _start_year(years):
+    return _at_year(0, years)
+
+
+@_node("end_of_study", "study_duration", "years")
+def _end_of_study(study_duration, years):
+    return _at_year(study_duration, years)
+
+
+@_node("discount_factors", "discount_rate", "years")
+def _discount_factors(discount_rate, years):
+    return discount_factors(discount_rate[..., 0], years)
+
+
+@_node("carbon_cost", "embodied_carbon", "carbon_price")
+def _carbon_cost(embodied_carbon, carbon_price):
+    return embodied_carbon * carbon_price
+
+
+@_node("reconstruction_years", "design_life", "study_duration", "years")
+def _reconstruction_years(design_life, study_duration, years):
+    return _every(design_life, years, study_duration)
+
+
+@_node("repair_years", "repair_interval", "study_duration", "years", "reconstruction_years")
+def _repair_years(repair_interval, study_duration, years, reconstruction_years):
+    return _every(repair_interval, years, study_duration) & ~reconstruction_years
+
+
+@_node("closure_days", "construction_closure_days", "repair_closure_days", "reconstruction_closure_days",
+       "start_year", "repair_years", "reconstruction_years")
+def _closure_days(construction_days, repair_days, reconstruction_days, start_year, repair_years,
+                  reconstruction_years):
+    return (construction_days * start_year + repair_days * repair_years
+            + reconstruction_days * reconstruction_years)
+
+
+@_node("periodic_maintenance_years", "periodic_maintenance_interval", "study_duration", "years")
+def _periodic_maintenance_years(interval, study_duration, years):
+    return _every(interval, years, study_duration)
+
+
+@_node("routine_inspection_years", "routine_inspection_interval", "study_duration", "years")
+def _routine_inspection_years(interval, study_duration, years):
+    return _every(interval, years, study_duration)
+
+
+@_node("initial_construction_cost", "construction_cost", "start_year")
+def _initial_construction(construction_cost, start_year):
+    return construction_cost * start_year
+
+
+@_node("initial_carbon_emission_cost", "carbon_cost", "start_year")
+def _initial_carbon(carbon_cost, start_year):
+    return carbon_cost * start_year
+
+
+@_node("time_cost", "construction_cost", "investment_ratio", "interest_rate", "construction_time", "start_year")
+def _time_cost(construction_cost, investment_ratio, interest_rate, construction_time, start_year):
+    # Interest on the invested share of the capital while the bridge is being built
+    locked = construction_cost * investment_ratio / 100.0
+    interest = locked * interest_rate / 100.0 * construction_time
+    return interest * start_year
+
+
+@_node("traffic_volumes", *road_user_cost.VEHICLE_CLASSES, "traffic_growth", "years")
+def _traffic_volumes(lcv, cars, buses, hcv, mcv, traffic_growth, years):
+    volumes = np.stack(np.broadcast_arrays(lcv, cars, buses, hcv, mcv), axis=-2)
+    return road_user_cost.traffic_volumes(volumes, traffic_growth, years)
+
+
+# Looked up on the precomputed roughness x rise and fall grids rather than evaluated
+@_node("vehicle_operating_cost", "road_roughness", "rise_and_fall")
+def _vehicle_operating_cost(roughness, rise_and_fall):
+    return voc_grids.interpolate("vehicle_operating_cost", roughness, rise_and_fall)
+
+
+@_node("free_speed", "road_roughness", "rise_and_fall")
+def _free_speed(roughness, rise_and_fall):
+    return voc_grids.interpolate("free_speed", roughness, rise_and_fall)
+
+
+@_node("rerouted_traffic_cost", "traffic_volumes", "number_of_lanes", "road_speed_factor", "reroute_distance",
+       "vehicle_operating_cost", "free_speed")
+def _rerouted_traffic_cost(volumes, number_of_lanes, road_speed_factor, reroute_distance, voc, speed):
+    # Road user cost of one closure day in each year
+    return road_user_cost.cost_per_day(volumes, number_of_lanes, road_speed_factor, reroute_distance, voc, speed)
+
+
+@_node("road_user_cost", "road_user_cost_per_day", "rerouted_traffic_cost", "closure_days")
+def _road_user(cost_per_day, rerouted_traffic_cost, closure_days):
+    return (cost_per_day + rerouted_traffic_cost) * closure_days
+
+
+@_node("rerouting_carbon_emission_cost", "rerouting_emission_per_day", "carbon_price", "closure_days")
+def _rerouting_carbon(emission_per_day, carbon_price, closure_days):
+    return emission_per_day * carbon_price * closure_days
+
+
+@_node("periodic_maintenance_cost", "construction_cost", "periodic_maintenance_rate", "periodic_maintenance_years")
+def _periodic_maintenance(construction_cost, rate, maintenance_years):
+    return construction_cost * rate / 100.0 * maintenance_years
+
+
+@_node("maintenance_emission_cost", "carbon_cost", "periodic_maintenance_rate", "periodic_maintenance_years")
+def _maintenance_emission(carbon_cost, rate, maintenance_years):
+    return carbon_cost * rate / 100.0 * maintenance_years
+
+
+@_node("routine_inspection_cost", "construction_cost", "routine_inspection_rate", "routine_inspection_years")
+def _routine_inspection(construction_cost, rate, inspection_years):
+    return construction_cost * rate / 100.0 * inspection_years
+
+
+@_node("repair_rehabilitation_cost", "construction_cost", "repair_rate", "repair_years")
+def _repair_rehabilitation(construction_cost, rate, repair_years):
+    return construction_cost * rate / 100.0 * repair_years
+
+
+@_node("reconstruction_cost", "construction_cost", "reconstruction_years")
+def _reconstruction(construction_cost, reconstruction_years):
+    return construction_cost * reconstruction_years
+
+
+@_node("demolition_disposal_cost", "construction_cost", "demolition_rate", "end_of_study")
+def _demolition_disposal(construction_cost, rate, end_of_study):
+    return construction_cost * rate / 100.0 * end_of_study
+
+
+@_node("recycling_cost", "steel_quantity", "steel_scrap_fraction", "scrap_value_steel", "end_of_study")
+def _recycling(steel_quantity, scrap_fraction, scrap_value, end_of_study):
+    # Scrap steel is sold at the end of the study, so this head is a credit (negative cost)
+    return -steel_quantity * scrap_fraction / 100.0 * scrap_value * end_of_study
+
+
+def compute_nodes(inputs, names, values=None, nodes=NODES):
+    """
+    Compute graph nodes and everything they depend on.
+
+    Args:
+        inputs (dict): Complete input mapping (see resolve_inputs).
+        names (iterable): Nodes to compute, e.g. cost heads.
+        values (dict): Node values already known; missing ones are computed and added.
+        nodes (dict): The graph, NODES or an extension of it.
+
+    Returns:
+        dict: Node name to value, holding at least the requested nodes.
+    """
+    values = {} if values is None else values
+
+    def value(name):
+        if name not in values:
+            if name in nodes:
+                function, dependencies = nodes[name]
+                values[name] = function(*(value(dependency) for dependency in dependencies))
+            else:
+                values[name] = _input(inputs[name])
+        return values[name]
+
+    for name in names:
+        value(name)
+    return values
+
+
+def node_inputs(name):
+    """
+    Inputs a graph node depends on, directly or through other nodes.
+
+    Args:
+        name (str): Node or input name.
+
+    Returns:
+        frozenset: Input names.
+    """
+    if name not in NODES:
+        return frozenset((name,))
+    return frozenset().union(*(node_inputs(dependency) for dependency in NODES[name][1]))
+
+
+# Inputs each cost head's cash flow is built from. Every head's present value also
+# depends on "discount_rate".
+HEAD_INPUTS = {head: tuple(sorted(node_inputs(head))) for head in COST_HEADS}
+
+
+def heads_affected_by(names):
+    """
+    Cost heads whose present value may change when some inputs change.
+
+    Args:
+        names (iterable): Input names (see DEFAULT_INPUTS).
+
+    Returns:
+        tuple: Affected cost heads in COST_HEADS order.
+    """
+    names = set(names)
+    if "discount_rate" in names:
+        return COST_HEADS
+    return tuple(head for head in COST_HEADS if names.intersection(HEAD_INPUTS[head]))
+
+
+def resolve_inputs(inputs=None):
+    """
+    Fill in defaults for every input that was not supplied or is NaN or infinite, and
+    bring out-of-range values within INPUT_LIMITS and whole-year INTERVAL_INPUTS.
+
+    Args:
+        inputs (dict): Partial mapping of input name to number or 1-D array.
+
+    Returns:
+        dict: A mapping containing every key of DEFAULT_INPUTS.
+    """
+    resolved = dict(DEFAULT_INPUTS)
+    if inputs:
+        unknown = set(inputs) - set(DEFAULT_INPUTS)
+        if unknown:
+            raise KeyError(f"Unknown LCC inputs: {', '.join(sorted(unknown))}")
+        resolved.update(inputs)
+        for name in inputs:
+            value = resolved[name]
+            finite = np.isfinite(value)
+            if not np.all(finite):
+                resolved[name] = np.where(finite, value, DEFAULT_INPUTS[name])
+    for name, (low, high) in INPUT_LIMITS.items():
+        value = resolved[name]
+        if np.any((value < low) | (value > high)):
+            resolved[name] = np.clip(value, low, high)
+    for name in INTERVAL_INPUTS:
+        value = resolved[name]
+        if np.any((value > 0) & (value < 1)):
+            resolved[name] = np.where(value > 0, np.maximum(value, 1.0), 0.0)
+    return resolved
+
+
+def study_years(inputs):
+    """
+    Year axis 0..N covering the longest "Duration of Study" in the inputs.
+
+    Args:
+        inputs (dict): Complete input mapping.
+
+    Returns:
+        numpy.ndarray: Float array of years.
+    """
+    return _years(_input(inputs["study_duration"]))
+
+
+def build_cash_flows(inputs=None, heads=COST_HEADS):
+    """
+    Build the undiscounted cash flow of every cost head for every year of the study.
+
+    Args:
+        inputs (dict): Mapping of input name to number or 1-D array (see DEFAULT_INPUTS).
+        heads (tuple): Cost heads to build, all of them by default.
+
+    Returns:
+        tuple: (years, cash_flows) where cash_flows has shape (..., len(heads), len(years)).
+    """
+    inputs = resolve_inputs(inputs)
+    values = compute_nodes(inputs, ("years",) + tuple(heads))
+    years = values["years"]
+    batch_shape = np.broadcast_shapes(*(np.shape(value) for value in inputs.values()))
+    cash_flows = np.zeros(batch_shape + (len(heads), len(years)))
+    for index, head in enumerate(heads):
+        cash_flows[..., index, :] = values[head]
+    return years, cash_flows
+
+
+def discount_factors(rate, years):
+    """
+    Present-worth factors (1 + r)^-t for a real discount rate given in percent.
+    The factors come from the shared cache in discount_tables.
+
+    Args:
+        rate (float or numpy.ndarray): Real discount rate(s) in percent.
+        years (numpy.ndarray): Year axis starting at 0.
+
+    Returns:
+        numpy.ndarray: Factors with shape (..., len(years)).
+    """
+    return present_worth_table(rate, len(years) - 1)
+
+
+def present_values(years, cash_flows, rate):
+    """
+    Discount every cost head in one pass.
+
+    Args:
+        years (numpy.ndarray): Year axis returned by build_cash_flows.
+        cash_flows (numpy.ndarray): Cash flows returned by build_cash_flows.
+        rate (float or numpy.ndarray): Real discount rate(s) in percent.
+
+    Returns:
+        numpy.ndarray: Present value per cost head with shape (..., cost heads).
+    """
+    factors = discount_factors(rate, years)
+    return np.einsum("...hy,...y->...h", cash_flows, factors)
+
+
+def evaluate(inputs=None, heads=COST_HEADS):
+    """
+    Compute the present value of every Output cost head and the Total Life-Cycle Cost.
+
+    Args:
+        inputs (dict): Mapping of input name to number or 1-D array (see DEFAULT_INPUTS).
+        heads (tuple): Cost heads to compute. The total is only included when all of
+            them are, e.g. a subset returned by heads_affected_by.
+
+    Returns:
+        dict: Cost head name to present value (float, or array for batched inputs).
+    """
+    inputs = resolve_inputs(inputs)
+    years, cash_flows = build_cash_flows(inputs, heads)
+    values = present_values(years, cash_flows, inputs["discount_rate"])
+    results = {head: values[..., index] for index, head in enumerate(heads)}
+    if set(heads) == set(COST_HEADS):
+        results[TOTAL_HEAD] = values.sum(axis=-1)
+    if values.ndim == 1:
+        results = {head: float(value) for head, value in results.items()}
+    return results
+
+
+def inputs_from_project(project=None):
+    """
+    Collect engine inputs from the project the Project Details dialogs save into.
+
+    Args:
+        project (Project): Project model; defaults to the one being edited.
+
+    Returns:
+        dict: Input mapping suitable for evaluate().
+    """
+    if project is None:
+        project = form_data_storage.project
+    return project.engine_inputs()
+
+
+def input_name(name):
+    """
+    Engine input named either as in DEFAULT_INPUTS or by the project model path it is
+    entered in, e.g. "discount_rate" or "financial.discount_rate".
+
+    Args:
+        name (str): Input name or dotted model path.
+
+    Returns:
+        str: The engine input name, or None if the name is not an engine input.
+    """
+    name = name.strip()
+    if name in DEFAULT_INPUTS:
+        return name
+    if "." in name:
+        names = engine_inputs_for(name)
+        if len(names) == 1 and name.endswith("." + names[0]):
+            return names[0]
+    return None
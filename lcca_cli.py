@@ -0,0 +1,111 @@
+"""
+Headless life-cycle cost runner for BICCA project files.
+
+Usage:
+    python lcca_cli.py PROJECT.bicca [PROJECT.bicca ...] [--output FILE] [--format csv|json]
+
+Loads each project file, evaluates every Output cost head (construction, carbon,
+road user, maintenance, end of life) and writes one row of results per project to
+FILE, or to standard output. The format follows the extension of FILE unless given.
+Projects that cannot be read are reported on standard error and skipped; the exit
+code is then 1.
+
+Only the model, the file format and the NumPy engine are imported - never PyQt5 - so
+this runs on servers without a display and starts in the time it takes to import NumPy.
+"""
+import argparse
+import csv
+import json
+import sys
+
+import lcc_engine
+import project_file
+
+# Quantities reported next to the cost heads
+QUANTITY_COLUMNS = ("construction_cost", "steel_quantity", "embodied_carbon")
+COLUMNS = ("project",) + QUANTITY_COLUMNS + lcc_engine.COST_HEADS + (lcc_engine.TOTAL_HEAD,)
+
+
+def evaluate_file(path):
+    """
+    Evaluate one project file.
+
+    Args:
+        path (str): Project file (.bicca).
+
+    Returns:
+        dict: Result row keyed by COLUMNS.
+
+    Raises:
+        OSError, project_file.ProjectFileError: If the file cannot be read.
+    """
+    inputs = project_file.load(path).engine_inputs()
+    row = {"project": path}
+    row.update((name, inputs[name]) for name in QUANTITY_COLUMNS)
+    row.update(lcc_engine.evaluate(inputs))
+    return row
+
+
+def evaluate_files(paths, errors=sys.stderr):
+    """
+    Evaluate project files one after the other.
+
+    Args:
+        paths (iterable): Project files.
+        errors (file): Where unreadable files are reported.
+
+    Yields:
+        dict: Result row per readable file, as evaluate_file returns it.
+    """
+    for path in paths:
+        try:
+            yield evaluate_file(path)
+        except (OSError, project_file.ProjectFileError) as error:
+            print(f"{path}: {error}", file=errors)
+
+
+def write_csv(rows, output):
+    """Write result rows as CSV as they come, returning how many were written."""
+    writer = csv.DictWriter(output, COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_json(rows, output):
+    """Write result rows as a JSON list, returning how many were written."""
+    rows = list(rows)
+    json.dump(rows, output, indent=2)
+    output.write("\n")
+    return len(rows)
+
+
+WRITERS = {"csv": write_csv, "json": write_json}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate BICCA project files without the GUI")
+    parser.add_argument("projects", nargs="+", help="project files (.bicca)")
+    parser.add_argument("-o", "--output", help="results file (default: standard output)")
+    parser.add_argument("-f", "--format", choices=sorted(WRITERS),
+                        help="output format (default: from the output file's extension, else csv)")
+    args = parser.parse_args(argv)
+
+    output_format = args.format
+    if output_format is None:
+        output_format = "json" if args.output and args.output.lower().endswith(".json") else "csv"
+
+    requested = len(args.projects)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            written = WRITERS[output_format](evaluate_files(args.projects), output)
+    else:
+        written = WRITERS[output_format](evaluate_files(args.projects), sys.stdout)
+    return 0 if written == requested else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+"""
+Material grid of the bill of quantities dialogs (Structure Works and Carbon Emission).
+
+The dialogs were designed with two fixed blocks of two material rows each, placed with
+setGeometry. install() hides those blocks and puts a QTableView over a
+MaterialTableModel in their place, with the dialog's "+ Add Sub-Component" and
+"+ Add Material" buttons above it. The view only paints the rows that are on screen
+and creates an editor for the one cell being edited, so a bill of 20,000 rows opens
+and scrolls like a bill of ten.
+
+The model never changes the component list it shows: every edit builds a new list
+that shares everything but the changed sub-component with the old one, and reports
+it through on_change, so the undo history can keep both lists.
+"""
+from dataclasses import replace
+
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtCore import Qt
+
+import field_bindings
+from project_model import Component, SubComponent, MaterialRow, parse_number
+
+# (header, MaterialRow field) per column; None marks the component and sub-component names
+STRUCTURE_COLUMNS = (
+    ("Component", None),
+    ("Sub-Component", None),
+    ("Material Type and Grade", "material"),
+    ("Quantity", "quantity"),
+    ("Unit", "unit"),
+    ("Rate", "rate"),
+    ("Rate Data Source", "rate_source"),
+)
+CARBON_COLUMNS = (
+    ("Component", None),
+    ("Sub-Component", None),
+    ("Material Type and Grade", "material"),
+    ("Quantity", "quantity"),
+    ("Unit", "unit"),
+    ("Embodied Energy", "embodied_energy"),
+    ("Carbon Factor", "carbon_factor"),
+)
+
+# Dialog name -> ("+ Add Sub-Component" buttons, "+ Add Material" buttons) in the Ui object
+ADD_BUTTONS = {
+    "Foundation": (("pushButton_2", "pushButton_5"), ("pushButton_3", "pushButton_4")),
+    "SuperStructure": (("pushButton_7", "pushButton_11"), ("pushButton_8", "pushButton_9")),
+    "SubStructure": (("pushButton_10", "pushButton_15"), ("pushButton_13", "pushButton_14")),
+    "Miscellaneous": (("pushButton_10", "pushButton_15"), ("pushButton_13", "pushButton_14")),
+    "CarbonEmission": ((), ("pushButton_13", "pushButton_49", "pushButton_50")),
+}
+
+ROW_HEIGHT = 24
+
+
+class MaterialTableModel(QtCore.QAbstractTableModel):
+    """
+    Table of every material row of a component list, one row per material.
+
+    Args:
+        columns (tuple): STRUCTURE_COLUMNS or CARBON_COLUMNS.
+        component_name (str): Name given to the component created when rows are added
+            to an empty bill.
+        parent (QObject): Owner of the model.
+    """
+
+    def __init__(self, columns=STRUCTURE_COLUMNS, component_name="", parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.component_name = component_name
+        # Called with (new component list, key) after each edit. Edits of one cell share a
+        # key so the undo history can merge keystrokes; inserted rows get keys of their own
+        self.on_change = None
+        self._components = []
+        self._index = []  # (component, sub-component, material) indices per table row
+
+    @property
+    def components(self):
+        return self._components
+
+    def set_components(self, components):
+        """
+        Show another component list, e.g. the project's after an undo.
+
+        Args:
+            components (list): Component objects; not modified by the model.
+        """
+        self.beginResetModel()
+        self._components = components
+        self._index = [(c, s, m) for c, component in enumerate(components)
+                       for s, sub_component in enumerate(component.sub_components)
+                       for m in range(len(sub_component.materials))]
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._index)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return section + 1
+
+    def flags(self, index):
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def _cell(self, row, column):
+        c, s, m = self._index[row]
+        component = self._components[c]
+        if column == 0:
+            return component.name
+        sub_component = component.sub_components[s]
+        if column == 1:
+            return sub_component.name
+        return getattr(sub_component.materials[m], self.columns[column][1])
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        value = self._cell(index.row(), index.column())
+        if isinstance(value, float):
+            return f"{value:g}" if value or role == Qt.EditRole else ""
+        return value
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        c, s, m = self._index[row]
+        components = list(self._components)
+        component = components[c]
+        if column == 0:
+            components[c] = replace(component, name=str(value))
+            first, last = self._span(row, 1)
+        else:
+            sub_components = list(component.sub_components)
+            sub_component = sub_components[s]
+            if column == 1:
+                sub_components[s] = replace(sub_component, name=str(value))
+                first, last = self._span(row, 2)
+            else:
+                name = self.columns[column][1]
+                old = getattr(sub_component.materials[m], name)
+                new = parse_number(value, old) if isinstance(old, float) else str(value)
+                if new == old:
+                    return False
+                materials = list(sub_component.materials)
+                materials[m] = replace(materials[m], **{name: new})
+                sub_components[s] = replace(sub_component, materials=materials)
+                first = last = row
+            components[c] = replace(component, sub_components=sub_components)
+        self._commit(components, f"{row}:{column}")
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.columns) - 1))
+        return True
+
+    def _span(self, row, level):
+        # First and last table row of the component (level 1) or sub-component (level 2)
+        # of a row. A sub-component's rows are contiguous and in material order, so its
+        # first row is the row minus the row's material index
+        c, s, m = self._index[row]
+        sub_components = self._components[c].sub_components
+        first = row - m
+        if level == 1:
+            first -= sum(len(sub_component.materials) for sub_component in sub_components[:s])
+            count = sum(len(sub_component.materials) for sub_component in sub_components)
+        else:
+            count = len(sub_components[s].materials)
+        return first, first + count - 1
+
+    def _commit(self, components, key):
+        self._components = components
+        if self.on_change is not None:
+            self.on_change(components, key)
+
+    def add_material(self, row=None):
+        """
+        Add an empty material row at the end of the sub-component of a table row.
+
+        Args:
+            row (int): Table row whose sub-component gets the material; the last one by default.
+
+        Returns:
+            int: Table row of the new material.
+        """
+        if not self._index:
+            return self.add_sub_component()
+        row = len(self._index) - 1 if row is None else row
+        c, s, _ = self._index[row]
+        position = self._span(row, 2)[1] + 1
+        components = list(self._components)
+        sub_components = list(components[c].sub_components)
+        materials = sub_components[s].materials + [MaterialRow()]
+        sub_components[s] = replace(sub_components[s], materials=materials)
+        components[c] = replace(components[c], sub_components=sub_components)
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self._index.insert(position, (c, s, len(materials) - 1))
+        self._components = components
+        self.endInsertRows()
+        self._commit(components, f"insert {position}")
+        return position
+
+    def add_sub_component(self, row=None):
+        """
+        Add a sub-component with one empty material row to the component of a table row.
+
+        Args:
+            row (int): Table row whose component gets the sub-component; the last one by default.
+
+        Returns:
+            int: Table row of the new sub-component's material.
+        """
+        components = list(self._components)
+        if self._index:
+            row = len(self._index) - 1 if row is None else row
+            c = self._index[row][0]
+            position = self._span(row, 1)[1] + 1
+        else:
+            # Components without any rows are not shown; add to a new one after them
+            components.append(Component(self.component_name))
+            c, position = len(components) - 1, 0
+        sub_components = components[c].sub_components + [SubComponent("", [MaterialRow()])]
+        components[c] = replace(components[c], sub_components=sub_components)
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self._index.insert(position, (c, len(sub_components) - 1, 0))
+        self._components = components
+        self.endInsertRows()
+        self._commit(components, f"insert {position}")
+        return position
+
+
+def install(ui, name):
+    """
+    Replace the fixed material rows of a bill of quantities dialog with a grid.
+
+    Adds ui.material_model and ui.material_view, which field_bindings shows and
+    connects the bill through.
+
+    Args:
+        ui: The dialog's Ui_* object, after setupUi.
+        name (str): Dialog name, a key of field_bindings.STRUCTURE_LAYOUTS.
+    """
+    area = ui.widget_2
+    button_boxes = [child for child in area.findChildren(QtWidgets.QDialogButtonBox)
+                    if child.parent() is area]
+    for child in area.children():
+        if isinstance(child, QtWidgets.QWidget) and child not in button_boxes:
+            child.hide()
+
+    _, component_name = field_bindings.STRUCTURE_LAYOUTS[name]
+    columns = CARBON_COLUMNS if name == "CarbonEmission" else STRUCTURE_COLUMNS
+    model = MaterialTableModel(columns, component_name, area)
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setStyleSheet("background-color: #ffffff")
+    view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+    view.setEditTriggers(QtWidgets.QAbstractItemView.DoubleClicked | QtWidgets.QAbstractItemView.EditKeyPressed
+                         | QtWidgets.QAbstractItemView.AnyKeyPressed)
+    # Fixed row heights let the view find the rows on screen without measuring the rest
+    view.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+    view.verticalHeader().setDefaultSectionSize(ROW_HEIGHT)
+    view.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+    view.horizontalHeader().setStretchLastSection(True)
+    for column, width in enumerate((110, 130, 190, 80, 50, 70)):
+        view.setColumnWidth(column, width)
+
+    sub_component_buttons, material_buttons = (
+        [getattr(ui, button) for button in names] for names in ADD_BUTTONS[name])
+    if not sub_component_buttons:
+        sub_component_buttons = [QtWidgets.QPushButton("+ Add Sub-Component")]
+        sub_component_buttons[0].setStyleSheet("background-color: #ffffff")
+
+    def current_row():
+        index = view.currentIndex()
+        return index.row() if index.isValid() else None
+
+    def added(row):
+        view.scrollTo(model.index(row, 2))
+        view.setCurrentIndex(model.index(row, 2))
+        view.edit(model.index(row, 2))
+
+    for button in sub_component_buttons:
+        button.clicked.connect(lambda: added(model.add_sub_component(current_row())))
+    for button in material_buttons:
+        button.clicked.connect(lambda: added(model.add_material(current_row())))
+
+    bottom = min((box.y() for box in button_boxes), default=area.height())
+    container = QtWidgets.QWidget(area)
+    container.setGeometry(QtCore.QRect(10, 10, area.width() - 20, bottom - 20))
+    layout = QtWidgets.QVBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+    buttons = QtWidgets.QHBoxLayout()
+    for button in (sub_component_buttons[0], material_buttons[0]):
+        button.setParent(container)
+        button.setFixedWidth(190)
+        button.show()
+        buttons.addWidget(button)
+    buttons.addStretch(1)
+    layout.addLayout(buttons)
+    layout.addWidget(view)
+    container.show()
+
+    ui.material_model = model
+    ui.material_view = view
@@ -0,0 +1,197 @@
+"""
+Network-level evaluation of a table of bridges.
+
+Usage:
+    python portfolio.py BRIDGES.csv [--output RESULTS.csv] [--workers N] [--chunk-size N]
+
+BRIDGES.csv has one row per bridge. A column named "bridge" (or "id") identifies it;
+every other column is an lcc_engine input, named either as the engine names it
+("discount_rate", "construction_cost") or by its project model path
+("financial.discount_rate"). "road_type" (or "traffic.road_type") is the type of road
+as named in the Bridge and Traffic Data dialog, e.g. "State Highway". A column with any
+other name is an error, so a misspelt input is not silently left at its default. Blank
+cells and missing columns take the defaults of the Project Details dialogs. Bills of quantities are given as their totals
+(construction_cost, steel_quantity, embodied_carbon).
+
+The table is read as a stream and cut into chunks. Each chunk is evaluated as one
+NumPy batch in a process pool, and its rows are appended to the results file as soon
+as it finishes, so results come out in the order chunks complete, not input order.
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from itertools import chain, islice
+from multiprocessing import Pool
+
+import numpy as np
+
+import lcc_engine
+from project_model import ROAD_TYPES, parse_number, road_speed_factor
+
+# Bridges per task; large enough that one batch amortises the cost of a task
+CHUNK_SIZE = 500
+
+ID_COLUMNS = ("bridge", "id")
+ROAD_TYPE_COLUMNS = ("road_type", "traffic.road_type")
+CARBON_HEADS = ("initial_carbon_emission_cost", "rerouting_carbon_emission_cost", "maintenance_emission_cost")
+RESULT_COLUMNS = (("bridge", "embodied_carbon", "carbon_cost") + lcc_engine.COST_HEADS
+                  + (lcc_engine.TOTAL_HEAD,))
+
+
+class PortfolioError(ValueError):
+    """Raised when a portfolio table cannot be read."""
+
+
+def _columns(path, header):
+    # (index, engine input name) of every input column; unknown headers are an error
+    lowered = [text.strip().lower() for text in header]
+    id_index = next((lowered.index(name) for name in ID_COLUMNS if name in lowered), None)
+    columns, unknown = [], []
+    for index, text in enumerate(header):
+        if index == id_index or not text.strip():
+            continue
+        name = "road_speed_factor" if lowered[index] in ROAD_TYPE_COLUMNS else lcc_engine.input_name(text)
+        if name is None:
+            unknown.append(text.strip())
+        else:
+            columns.append((index, name))
+    if unknown:
+        raise PortfolioError(f"{path}: unknown column{'s' if len(unknown) > 1 else ''} "
+                             f"{', '.join(repr(text) for text in unknown)}")
+    return id_index, columns
+
+
+def _road_speed_factor(path, number, text):
+    if text.strip().lower() not in (name.lower() for name in ROAD_TYPES):
+        raise PortfolioError(f"{path} row {number}: unknown type of road {text.strip()!r}; "
+                             f"use one of {', '.join(ROAD_TYPES)}")
+    return road_speed_factor(text)
+
+
+def read_bridges(path):
+    """
+    Bridges of a portfolio table, one at a time.
+
+    Args:
+        path (str): CSV table (see the module docstring).
+
+    Yields:
+        tuple: (bridge id, {input name: float}) with only the inputs given in the table.
+
+    Raises:
+        PortfolioError: If a column or a type of road is not recognised.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as table:
+        reader = csv.reader(table)
+        id_index, columns = _columns(path, next(reader, []))
+        for number, row in enumerate(reader, 1):
+            if not any(cell.strip() for cell in row):
+                continue
+            bridge = row[id_index].strip() if id_index is not None and id_index < len(row) else str(number)
+            inputs = {}
+            for index, name in columns:
+                if index >= len(row) or not row[index].strip():
+                    continue
+                if name == "road_speed_factor":
+                    inputs[name] = _road_speed_factor(path, number, row[index])
+                else:
+                    inputs[name] = parse_number(row[index], lcc_engine.DEFAULT_INPUTS[name])
+            yield bridge, inputs
+
+
+def evaluate_chunk(bridges):
+    """
+    Evaluate a chunk of bridges as one batch.
+
+    Args:
+        bridges (list): (bridge id, inputs) pairs as read_bridges yields them.
+
+    Returns:
+        list: Result rows, tuples in RESULT_COLUMNS order.
+    """
+    inputs = {name: np.array([bridge_inputs.get(name, default) for _, bridge_inputs in bridges])
+              for name, default in lcc_engine.DEFAULT_INPUTS.items()}
+    results = lcc_engine.evaluate(inputs)
+    carbon_cost = sum(results[head] for head in CARBON_HEADS)
+    columns = ([inputs["embodied_carbon"], carbon_cost] + [results[head] for head in lcc_engine.COST_HEADS]
+               + [results[lcc_engine.TOTAL_HEAD]])
+    values = np.column_stack(columns).tolist()
+    return [(bridge,) + tuple(row) for (bridge, _), row in zip(bridges, values)]
+
+
+def _chunks(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(table_path, output_path, workers=None, chunk_size=CHUNK_SIZE, progress=None):
+    """
+    Evaluate every bridge of a table and write the results to a CSV file.
+
+    Args:
+        table_path (str): Portfolio table.
+        output_path (str): Results file, rewritten from the start.
+        workers (int): Worker processes; all CPUs by default, 1 evaluates in this process.
+        chunk_size (int): Bridges per task.
+        progress (callable): Called with the number of bridges done after each chunk.
+
+    Returns:
+        int: Number of bridges evaluated.
+
+    Raises:
+        PortfolioError: If the table has an unknown column or type of road.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(read_bridges(table_path), chunk_size)
+    # Read the first chunk before the results file is opened, so a table with unknown
+    # columns fails without leaving an empty results file behind
+    chunks = chain([first] if (first := next(chunks, None)) else [], chunks)
+    done = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as output:
+        writer = csv.writer(output, lineterminator="\n")
+        writer.writerow(RESULT_COLUMNS)
+
+        def write(rows):
+            nonlocal done
+            writer.writerows(rows)
+            output.flush()  # results on disk as each chunk finishes
+            done += len(rows)
+            if progress is not None:
+                progress(done)
+
+        if workers == 1:
+            for chunk in chunks:
+                write(evaluate_chunk(chunk))
+        else:
+            with Pool(workers) as pool:
+                for rows in pool.imap_unordered(evaluate_chunk, chunks):
+                    write(rows)
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate the life-cycle cost of a portfolio of bridges")
+    parser.add_argument("table", help="CSV table with one row per bridge")
+    parser.add_argument("-o", "--output", default="portfolio_results.csv", help="results file (CSV)")
+    parser.add_argument("-w", "--workers", type=int, help="worker processes (default: all CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="bridges per task")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        count = run(args.table, args.output, args.workers, max(1, args.chunk_size))
+    except (OSError, PortfolioError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    print(f"{count} bridges evaluated in {time.perf_counter() - start:.2f} s -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
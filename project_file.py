@@ -0,0 +1,284 @@
+"""
+Binary project file (.bicca) used by File -> Open / Save / Save As / Create a Copy.
+
+Layout, all little-endian:
+
+    preamble   8-byte magic b"BICCAPRJ", uint16 format version, uint16 flags (0),
+               uint32 length of the header
+    header     UTF-8 JSON: scalar fields of every section, the string table and a
+               directory of the blocks (offset from the start of the file, dtype, shape)
+    blocks     contiguous NumPy arrays, each aligned to 8 bytes
+
+The bill of quantities is stored column-wise: material rows as one float64 block of
+numbers and one int32 block of string-table indices, with the component and
+sub-component hierarchy in two small index blocks. The cash flow of every cost head
+at the time of saving is stored as a (cost heads x years) float64 block so it can be
+read without evaluating the project. Files are read through a memory map.
+"""
+import json
+import mmap
+import os
+import struct
+from dataclasses import fields
+
+import numpy as np
+
+import lcc_engine
+from project_model import (Project, Component, SubComponent, MaterialRow, SECTIONS, BOQ_PATHS, boq_totals,
+                           parse_number)
+
+MAGIC = b"BICCAPRJ"
+FORMAT_VERSION = 1
+FILE_SUFFIX = ".bicca"
+ALIGNMENT = 8
+
+_PREAMBLE = struct.Struct("<8sHHI")
+
+# Lists of components in the project, in the order of the "part" column of the components block
+PARTS = BOQ_PATHS
+
+# Columns of the two material row blocks
+TEXT_COLUMNS = ("material", "unit", "rate_source")
+VALUE_COLUMNS = ("quantity", "rate", "embodied_energy", "carbon_factor")
+
+
+class ProjectFileError(ValueError):
+    """Raised when a file is not a project file this version can read."""
+
+
+def _scalars(project):
+    scalars = {}
+    for name in SECTIONS:
+        section = getattr(project, name)
+        values = {f.name: getattr(section, f.name) for f in fields(section)
+                  if not isinstance(getattr(section, f.name), list)}
+        if values:
+            scalars[name] = values
+    return scalars
+
+
+class SaveCache:
+    """
+    Blocks and totals of every bill of quantities from the previous save, so the next
+    save only rebuilds the parts that changed. Keep one per open project.
+    """
+
+    def __init__(self):
+        self.parts = {}   # part path -> blocks of that part alone, indices local to it
+        self.totals = {}  # part path -> project_model.boq_totals()
+
+
+def _part_blocks(components, part_index):
+    strings, string_index = [], {}
+
+    def intern(text):
+        if text not in string_index:
+            string_index[text] = len(strings)
+            strings.append(text)
+        return string_index[text]
+
+    component_rows, sub_components, owners, texts, values = [], [], [], [], []
+    for component in components:
+        component_rows.append((part_index, intern(component.name)))
+        for sub_component in component.sub_components:
+            sub_components.append((len(component_rows) - 1, intern(sub_component.name)))
+            for row in sub_component.materials:
+                owners.append(len(sub_components) - 1)
+                texts.append([intern(getattr(row, column)) for column in TEXT_COLUMNS])
+                values.append([getattr(row, column) for column in VALUE_COLUMNS])
+    return {
+        "strings": strings,
+        "components": np.array(component_rows, dtype="<i4").reshape(-1, 2),
+        "sub_components": np.array(sub_components, dtype="<i4").reshape(-1, 2),
+        "row_owners": np.array(owners, dtype="<i4"),
+        "row_texts": np.array(texts, dtype="<i4").reshape(-1, len(TEXT_COLUMNS)),
+        "row_values": np.array(values, dtype="<f8").reshape(-1, len(VALUE_COLUMNS)),
+    }
+
+
+def _blocks(project, cache=None, changed=None):
+    parts = []
+    for part_index, part in enumerate(PARTS):
+        reuse = cache is not None and changed is not None and part not in changed and part in cache.parts
+        if not reuse:
+            part_blocks = _part_blocks(project.get(part), part_index)
+            if cache is not None:
+                cache.parts[part] = part_blocks
+                cache.totals[part] = boq_totals(project.get(part))
+        parts.append(cache.parts[part] if cache is not None else part_blocks)
+
+    # Join the parts, shifting each part's indices past those of the parts before it
+    strings = []
+    components, sub_components, owners, texts = [], [], [], []
+    component_offset = sub_component_offset = 0
+    for part_blocks in parts:
+        string_offset = len(strings)
+        strings.extend(part_blocks["strings"])
+        components.append(part_blocks["components"] + (0, string_offset))
+        sub_components.append(part_blocks["sub_components"] + (component_offset, string_offset))
+        owners.append(part_blocks["row_owners"] + sub_component_offset)
+        texts.append(part_blocks["row_texts"] + string_offset)
+        component_offset += len(part_blocks["components"])
+        sub_component_offset += len(part_blocks["sub_components"])
+
+    inputs = project.engine_inputs(cache.totals if cache is not None else None)
+    years, cash_flows = lcc_engine.build_cash_flows(inputs)
+    blocks = {
+        "components": np.concatenate(components).astype("<i4"),
+        "sub_components": np.concatenate(sub_components).astype("<i4"),
+        "row_owners": np.concatenate(owners).astype("<i4"),
+        "row_texts": np.concatenate(texts).astype("<i4"),
+        "row_values": np.concatenate([part_blocks["row_values"] for part_blocks in parts]),
+        "cash_flow_years": years.astype("<f8"),
+        "cash_flows": cash_flows.astype("<f8"),
+    }
+    return strings, blocks
+
+
+def _padding(offset):
+    return -offset % ALIGNMENT
+
+
+def save(project, path, cache=None, changed=None):
+    """
+    Write a project file. The file is written next to the target and renamed over it,
+    so an interrupted save never leaves a half-written project behind.
+
+    Args:
+        project (Project): Project to save.
+        path (str): Destination file.
+        cache (SaveCache): Blocks from the previous save of this project, updated in place.
+        changed (set): Section keys changed since that save (see dirty_tracking); None
+            rebuilds every bill of quantities.
+    """
+    strings, blocks = _blocks(project, cache, changed)
+
+    # Block offsets depend on the header length, which depends on the offsets; lay the
+    # blocks out after a header of a guessed length and grow the guess until it fits
+    header_room = 1024
+    while True:
+        offset = _PREAMBLE.size + header_room
+        directory = {}
+        for name, array in blocks.items():
+            offset += _padding(offset)
+            directory[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            offset += array.nbytes
+        header = json.dumps({"scalars": _scalars(project), "strings": strings, "blocks": directory},
+                            separators=(",", ":")).encode("utf-8")
+        if len(header) <= header_room:
+            break
+        header_room = len(header) + _padding(len(header)) + 256
+
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as project_file:
+        project_file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, header_room))
+        project_file.write(header.ljust(header_room, b" "))
+        for name, array in blocks.items():
+            project_file.write(b"\0" * (directory[name]["offset"] - project_file.tell()))
+            project_file.write(np.ascontiguousarray(array).tobytes())
+        project_file.flush()
+        os.fsync(project_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def _read(path, reader):
+    try:
+        with open(path, "rb") as project_file, \
+                mmap.mmap(project_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) < _PREAMBLE.size:
+                raise ProjectFileError(f"{path} is not a BICCA project file")
+            magic, version, _, header_length = _PREAMBLE.unpack_from(mapped)
+            if magic != MAGIC:
+                raise ProjectFileError(f"{path} is not a BICCA project file")
+            if version > FORMAT_VERSION:
+                raise ProjectFileError(f"{path} was saved by a newer version of BICCA Studio "
+                                       f"(format {version})")
+            header = json.loads(bytes(mapped[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+
+            def block(name):
+                entry = header["blocks"][name]
+                count = int(np.prod(entry["shape"]))
+                return np.frombuffer(mapped, dtype=entry["dtype"], count=count,
+                                     offset=entry["offset"]).reshape(entry["shape"])
+
+            return reader(header, block)
+    except ProjectFileError:
+        raise
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError, struct.error) as error:
+        # An empty file (mmap), a damaged header (JSON) or blocks that do not match it
+        raise ProjectFileError(f"{path} is damaged or not a BICCA project file ({error})") from error
+
+
+def _scalar(section, path, value):
+    # A header value converted to the type of the field it is read into
+    default = getattr(section, path.split(".")[1])
+    if isinstance(default, float) and not isinstance(value, bool):
+        number = parse_number(value, None) if isinstance(value, (int, float, str)) else None
+        if number is not None:
+            return number
+    elif isinstance(default, str) and isinstance(value, str):
+        return value
+    raise ProjectFileError(f"The project header has {value!r} for {path}, which takes "
+                           f"{'a number' if isinstance(default, float) else 'text'}")
+
+
+def _build_project(header, block):
+    project = Project()
+    for name, values in header["scalars"].items():
+        section = getattr(project, name) if name in SECTIONS else None
+        known = {f.name for f in fields(section) if not isinstance(getattr(section, f.name), list)} if section else ()
+        for key, value in values.items():
+            if key not in known:
+                raise ProjectFileError(f"The project header has an unknown field {name}.{key}")
+            setattr(section, key, _scalar(section, f"{name}.{key}", value))
+
+    strings = header["strings"]
+    parts = [[] for _ in PARTS]
+    components = []
+    for part_index, name in block("components").tolist():
+        component = Component(strings[name])
+        parts[part_index].append(component)
+        components.append(component)
+    sub_components = []
+    for component_index, name in block("sub_components").tolist():
+        sub_component = SubComponent(strings[name])
+        components[component_index].sub_components.append(sub_component)
+        sub_components.append(sub_component)
+    for owner, (material, unit, rate_source), (quantity, rate, energy, factor) in zip(
+            block("row_owners").tolist(), block("row_texts").tolist(), block("row_values").tolist()):
+        sub_components[owner].materials.append(MaterialRow(
+            strings[material], quantity, strings[unit], rate, strings[rate_source], energy, factor))
+
+    for part, part_components in zip(PARTS, parts):
+        section, name = part.split(".")
+        setattr(getattr(project, section), name, part_components)
+    return project
+
+
+def load(path):
+    """
+    Read a project file.
+
+    Args:
+        path (str): Project file to read.
+
+    Returns:
+        Project: The saved project.
+
+    Raises:
+        ProjectFileError: If the file is not a readable project file.
+    """
+    return _read(path, _build_project)
+
+
+def load_cash_flows(path):
+    """
+    Read the cash flows stored when a project file was saved, without building the project.
+
+    Args:
+        path (str): Project file to read.
+
+    Returns:
+        tuple: (years, cash_flows) as in lcc_engine.build_cash_flows.
+    """
+    return _read(path, lambda header, block: (block("cash_flow_years").copy(), block("cash_flows").copy()))
@@ -0,0 +1,419 @@
+"""
+Typed data model of a BICCA Studio project.
+
+Each Project Details dialog fills one section of a Project. Sections are slotted
+dataclasses, so a bill of quantities with thousands of material rows stays compact,
+and numeric fields hold floats so the life-cycle cost engine never parses text.
+Fields can be addressed by dotted paths such as "financial.discount_rate".
+"""
+import math
+import re
+from dataclasses import dataclass, field, fields, asdict
+
+
+def parse_number(value, default=0.0):
+    """
+    Convert text typed into a line edit to a float.
+
+    Args:
+        value (str or float): Text such as "1,250.5"; numbers are passed through.
+        default (float): Returned for blank or non-numeric text, and for "nan" or "inf".
+
+    Returns:
+        float: The parsed number.
+    """
+    try:
+        if isinstance(value, (int, float)):
+            number = float(value)
+        else:
+            number = float(str(value).replace(",", "").strip())
+    except ValueError:
+        return default
+    return number if math.isfinite(number) else default
+
+
+def plain_text(value):
+    """
+    Strip the rich-text markup Qt labels carry, e.g. the m<sup>3</sup> unit label.
+
+    Args:
+        value (str): Label text, possibly HTML.
+
+    Returns:
+        str: The visible text.
+    """
+    return re.sub(r"<[^>]*>", "", str(value)).strip()
+
+
+@dataclass(slots=True)
+class GeneralInfo:
+    company_name: str = ""
+    project_title: str = ""
+    project_description: str = ""
+    valuer_name: str = ""
+    job_number: str = ""
+    client: str = ""
+    country: str = ""
+    base_year: float = 0.0
+
+
+@dataclass(slots=True)
+class MaterialRow:
+    """One line of a bill of quantities."""
+    material: str = ""
+    quantity: float = 0.0
+    unit: str = ""
+    rate: float = 0.0  # INR per unit
+    rate_source: str = ""
+    embodied_energy: float = 0.0  # MJ/kg
+    carbon_factor: float = 0.0  # kg CO2e per unit of quantity
+
+
+def material_row(material, quantity, unit, rate, rate_source=""):
+    """
+    Build a material row from the text of a dialog's row of widgets.
+
+    Args:
+        material (str): Material type and grade.
+        quantity (str): Quantity as typed.
+        unit (str): Unit label text, possibly HTML.
+        rate (str): Rate as typed.
+        rate_source (str): Rate data source.
+
+    Returns:
+        MaterialRow: The row with numbers parsed once.
+    """
+    return MaterialRow(material, parse_number(quantity), plain_text(unit), parse_number(rate), rate_source)
+
+
+@dataclass(slots=True)
+class SubComponent:
+    name: str = ""
+    materials: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Component:
+    name: str = ""
+    sub_components: list = field(default_factory=list)
+
+
+def _iter_rows(components):
+    for component in components:
+        for sub_component in component.sub_components:
+            yield from sub_component.materials
+
+
+# Units of steel quantities and their size in metric tonnes
+_TONNES_PER_UNIT = {"kg": 0.001, "t": 1.0, "mt": 1.0, "tonne": 1.0, "tonnes": 1.0}
+
+# Model paths of the bills of quantities. Each one is saved, versioned and tracked for
+# changes on its own, apart from the scalar fields of its section.
+BOQ_PATHS = ("structure.foundation", "structure.super_structure", "structure.sub_structure",
+             "structure.miscellaneous", "carbon.components")
+
+
+def section_key(path):
+    """
+    Key under which a change to a model path is tracked.
+
+    Args:
+        path (str): Dotted model path, e.g. "financial.discount_rate".
+
+    Returns:
+        str: The path itself for a bill of quantities, otherwise its section name.
+    """
+    return path if path in BOQ_PATHS else path.split(".", 1)[0]
+
+
+# Bridge and Traffic fields that are engine inputs of the same name
+TRAFFIC_ENGINE_INPUTS = (
+    "number_of_lanes", "road_roughness", "rise_and_fall", "reroute_distance", "traffic_growth",
+    "lcv", "cars", "buses", "hcv", "mcv",
+    "construction_closure_days", "repair_closure_days", "reconstruction_closure_days",
+)
+
+# "Type of Road" -> factor on the free speed of every vehicle class on the re-route
+# (engine input "road_speed_factor"); other texts count as a national highway
+ROAD_TYPES = {
+    "Expressway": 1.2,
+    "National Highway": 1.0,
+    "State Highway": 0.9,
+    "Major District Road": 0.8,
+    "Other District Road": 0.7,
+    "Village Road": 0.6,
+    "Urban Road": 0.6,
+}
+
+
+def road_speed_factor(road_type):
+    """Free speed factor of a "Type of Road" text (see ROAD_TYPES)."""
+    lowered = road_type.strip().lower()
+    return next((factor for name, factor in ROAD_TYPES.items() if name.lower() == lowered), 1.0)
+
+
+def engine_inputs_for(path):
+    """
+    Names of the lcc_engine inputs a model path feeds (see Project.engine_inputs).
+
+    Args:
+        path (str): Dotted model path, e.g. "structure.foundation".
+
+    Returns:
+        tuple: Input names; empty for fields the engine does not use, e.g. the client.
+    """
+    if path == "carbon.components":
+        return ("embodied_carbon",)
+    if path in BOQ_PATHS:
+        return ("construction_cost", "steel_quantity")
+    section, name = path.split(".", 1)
+    if section in ("financial", "maintenance", "demolition") or path == "carbon.carbon_price":
+        return (name,)
+    if section == "traffic" and name in TRAFFIC_ENGINE_INPUTS:
+        return (name,)
+    if path == "traffic.road_type":
+        return ("road_speed_factor",)
+    return ()
+
+
+def boq_totals(components):
+    """
+    Totals of one bill of quantities in a single pass over its rows.
+
+    Args:
+        components (list): Component objects.
+
+    Returns:
+        tuple: (cost in INR, steel in metric tonnes, embodied carbon in kg CO2e).
+    """
+    cost = steel = carbon = 0.0
+    for row in _iter_rows(components):
+        cost += row.quantity * row.rate
+        carbon += row.quantity * row.carbon_factor
+        if row.material.lower().startswith("steel"):
+            steel += row.quantity * _TONNES_PER_UNIT.get(row.unit.lower(), 0.0)
+    return cost, steel, carbon
+
+
+@dataclass(slots=True)
+class StructureWorks:
+    """Bills of quantities of the four Structure Works dialogs."""
+    foundation: list = field(default_factory=list)
+    super_structure: list = field(default_factory=list)
+    sub_structure: list = field(default_factory=list)
+    miscellaneous: list = field(default_factory=list)
+
+    def rows(self):
+        """
+        Iterate over every material row of every part of the structure.
+        """
+        for part in (self.foundation, self.super_structure, self.sub_structure, self.miscellaneous):
+            yield from _iter_rows(part)
+
+    def construction_cost(self):
+        return sum(row.quantity * row.rate for row in self.rows())
+
+    def steel_quantity(self):
+        """
+        Total structural steel in metric tonnes, converted from each row's unit.
+        """
+        return sum(row.quantity * _TONNES_PER_UNIT.get(row.unit.lower(), 0.0)
+                   for row in self.rows() if row.material.lower().startswith("steel"))
+
+
+@dataclass(slots=True)
+class FinancialData:
+    discount_rate: float = 7.0  # Real Discount Rate (%)
+    interest_rate: float = 8.0  # %
+    investment_ratio: float = 50.0  # %
+    study_duration: float = 75.0  # years
+    construction_time: float = 2.0  # Time for construction of Base Project (years)
+
+
+@dataclass(slots=True)
+class CarbonData:
+    """Carbon Emission Cost Data: material rows carry embodied energy and emission factors."""
+    carbon_price: float = 7.0  # INR per kg CO2e
+    components: list = field(default_factory=list)
+
+    def embodied_carbon(self):
+        return sum(row.quantity * row.carbon_factor for row in _iter_rows(self.components))
+
+
+@dataclass(slots=True)
+class TrafficData:
+    number_of_lanes: float = 2.0
+    road_roughness: float = 2000.0  # mm/km
+    rise_and_fall: float = 0.0  # m/km
+    road_type: str = ""
+    reroute_distance: float = 0.0  # Additional Re-Route Distance (km)
+    traffic_growth: float = 5.0  # % per year
+    lcv: float = 0.0  # PCU/D
+    cars: float = 0.0
+    buses: float = 0.0
+    hcv: float = 0.0
+    mcv: float = 0.0
+    construction_closure_days: float = 0.0
+    repair_closure_days: float = 30.0
+    reconstruction_closure_days: float = 180.0
+
+
+@dataclass(slots=True)
+class MaintenanceData:
+    periodic_maintenance_rate: float = 0.55  # % of construction cost
+    routine_inspection_rate: float = 0.1  # % of construction cost
+    repair_rate: float = 10.0  # % of construction cost
+    periodic_maintenance_interval: float = 5.0  # years
+    routine_inspection_interval: float = 1.0  # years
+    repair_interval: float = 25.0  # years
+    design_life: float = 100.0  # years
+
+
+@dataclass(slots=True)
+class DemolitionData:
+    demolition_rate: float = 10.0  # % of construction cost
+    scrap_value_steel: float = 30000.0  # INR/MT
+    steel_scrap_fraction: float = 90.0  # %
+
+
+# Section name -> section class, in the order the sections are stored
+SECTIONS = {
+    "general": GeneralInfo,
+    "structure": StructureWorks,
+    "financial": FinancialData,
+    "carbon": CarbonData,
+    "traffic": TrafficData,
+    "maintenance": MaintenanceData,
+    "demolition": DemolitionData,
+}
+
+
+@dataclass(slots=True)
+class Project:
+    general: GeneralInfo = field(default_factory=GeneralInfo)
+    structure: StructureWorks = field(default_factory=StructureWorks)
+    financial: FinancialData = field(default_factory=FinancialData)
+    carbon: CarbonData = field(default_factory=CarbonData)
+    traffic: TrafficData = field(default_factory=TrafficData)
+    maintenance: MaintenanceData = field(default_factory=MaintenanceData)
+    demolition: DemolitionData = field(default_factory=DemolitionData)
+
+    def get(self, path):
+        """
+        Read a field by dotted path.
+
+        Args:
+            path (str): "section.field", e.g. "financial.discount_rate".
+
+        Returns:
+            The field value.
+        """
+        section, name = path.split(".", 1)
+        return getattr(getattr(self, section), name)
+
+    def set(self, path, value):
+        """
+        Write a field by dotted path, converting text to a float for numeric fields.
+
+        Args:
+            path (str): "section.field", e.g. "financial.discount_rate".
+            value: New value; text is parsed for numeric fields.
+        """
+        section, name = path.split(".", 1)
+        target = getattr(self, section)
+        if isinstance(getattr(target, name), float):
+            value = parse_number(value, getattr(target, name))
+        setattr(target, name, value)
+
+    def paths(self):
+        """
+        Dotted path of every field of every section, bills of quantities included.
+        """
+        for name in SECTIONS:
+            for f in fields(getattr(self, name)):
+                yield f"{name}.{f.name}"
+
+    def engine_inputs(self, totals=None):
+        """
+        Inputs for lcc_engine.evaluate taken from every section of the project.
+
+        Args:
+            totals (dict): BOQ path -> boq_totals() result for bills of quantities whose
+                totals are already known; the others are computed.
+
+        Returns:
+            dict: Input name to float.
+        """
+        totals = totals or {}
+        part_totals = [totals[path] if path in totals else boq_totals(self.get(path)) for path in BOQ_PATHS]
+        structure = part_totals[:-1]
+        inputs = {
+            "construction_cost": sum(total[0] for total in structure),
+            "steel_quantity": sum(total[1] for total in structure),
+            "embodied_carbon": part_totals[-1][2],
+            "carbon_price": self.carbon.carbon_price,
+        }
+        for section in (self.financial, self.maintenance, self.demolition):
+            inputs.update((f.name, getattr(section, f.name)) for f in fields(section))
+        for name in TRAFFIC_ENGINE_INPUTS:
+            inputs[name] = getattr(self.traffic, name)
+        inputs["road_speed_factor"] = road_speed_factor(self.traffic.road_type)
+        return inputs
+
+    def to_dict(self):
+        """
+        Plain nested dicts and lists of the whole project.
+
+        Returns:
+            dict: Section name to section contents.
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a project from the output of to_dict. Missing keys keep their defaults.
+
+        Args:
+            data (dict): Section name to section contents.
+
+        Returns:
+            Project: The rebuilt project.
+        """
+        project = cls()
+        for name, section_class in SECTIONS.items():
+            if name in data:
+                setattr(project, name, section_from_dict(section_class, data[name]))
+        return project
+
+
+def components_from_list(items):
+    """
+    Rebuild Component objects from the plain lists produced by to_dict.
+    """
+    return [Component(item.get("name", ""),
+                      [SubComponent(sub.get("name", ""), [MaterialRow(**row) for row in sub.get("materials", [])])
+                       for sub in item.get("sub_components", [])])
+            for item in items]
+
+
+def section_from_dict(section_class, data):
+    """
+    Build one section from plain dicts, rebuilding nested component lists.
+
+    Args:
+        section_class (type): One of the classes in SECTIONS.
+        data (dict): Field name to value.
+
+    Returns:
+        The section instance.
+    """
+    values = {}
+    for f in fields(section_class):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if isinstance(value, list):
+            value = components_from_list(value)
+        values[f.name] = value
+    return section_class(**values)
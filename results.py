@@ -0,0 +1,101 @@
+"""
+Cost heads of the project being edited, kept up to date as it changes.
+
+LiveResults subscribes to form_data_storage and keeps a cost_graph.CostGraph of the
+project. A published change of a field the engine uses (project_model.engine_inputs_for)
+schedules a refresh; the refresh hands the graph the current inputs and it recomputes
+only the nodes downstream of those that changed. The totals of each bill of quantities
+are cached too and only summed again for the bill that was edited. The sensitivity
+ranking (see sensitivity) is kept until an input changes.
+"""
+import form_data_storage
+import lcc_engine
+import sensitivity
+from cost_graph import CostGraph
+from project_model import BOQ_PATHS, boq_totals, engine_inputs_for
+
+
+class LiveResults:
+    """
+    Present value of every cost head of form_data_storage.project.
+
+    Args:
+        on_change (callable): Called with no arguments after a change that may move some
+            cost heads, e.g. to schedule a refresh of the widgets showing them.
+    """
+
+    def __init__(self, on_change=None):
+        self.on_change = on_change
+        self.graph = CostGraph()
+        self._totals = {}  # BOQ path -> project_model.boq_totals()
+        self._ranking = None  # sensitivity.rank() of the current inputs
+        form_data_storage.subscribe(self.changed)
+
+    def close(self):
+        form_data_storage.unsubscribe(self.changed)
+
+    def changed(self, path, value):
+        """Store callback: forgets the totals of an edited bill of quantities."""
+        if path is None:
+            self._totals.clear()
+        elif path in BOQ_PATHS:
+            self._totals.pop(path, None)
+        if (path is None or engine_inputs_for(path)) and self.on_change is not None:
+            self.on_change()
+
+    def values(self):
+        """
+        Present value of every cost head and the Total Life-Cycle Cost, recomputing only
+        what the changes since the previous call reach.
+
+        Returns:
+            dict: Cost head name to present value, in lcc_engine.COST_HEADS order.
+        """
+        project = form_data_storage.project
+        for path in BOQ_PATHS:
+            if path not in self._totals:
+                self._totals[path] = boq_totals(project.get(path))
+        if self.graph.set_inputs(project.engine_inputs(self._totals)):
+            self._ranking = None
+        return self.graph.results()
+
+    def sensitivity(self):
+        """
+        Inputs ranked by their effect on every cost head, as of the last values() call.
+
+        Returns:
+            dict: Output of sensitivity.rank().
+        """
+        if self._ranking is None:
+            self._ranking = sensitivity.rank(self.graph.inputs)
+        return self._ranking
+
+
+def format_table(results):
+    """
+    Rich-text table of cost heads for the Outputs group and the Results panel.
+
+    Args:
+        results (dict): Output of LiveResults.values().
+
+    Returns:
+        str: HTML table with one row per cost head, amounts in INR.
+    """
+    rows = "".join(
+        f"<tr><td>{lcc_engine.COST_HEAD_LABELS[head]}</td><td align='right'>{value:,.0f}</td></tr>"
+        for head, value in results.items())
+    return f"<table cellspacing='4'>{rows}</table>"
+
+
+def format_sensitivity(ranking, results):
+    """
+    Rich-text tornado table of the inputs that move the Total Life-Cycle Cost most.
+
+    Args:
+        ranking (dict): Output of LiveResults.sensitivity().
+        results (dict): Output of LiveResults.values(), the base case.
+
+    Returns:
+        str: HTML table of the change of the total with each input low and high.
+    """
+    return sensitivity.format_tornado(ranking, base=results[lcc_engine.TOTAL_HEAD])
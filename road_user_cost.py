@@ -0,0 +1,134 @@
+"""
+Road user cost of the traffic re-routed while the bridge is closed.
+
+Each vehicle class of the Bridge and Traffic Data dialog (LCV, cars, buses, HCV, MCV)
+drives the additional re-route distance on every closure day. Its cost per vehicle-km
+is the vehicle operating cost (VOC) plus the value of the occupants' and cargo's time
+at the class's travel speed. Both follow the road roughness (mm/km) and rise and fall
+(m/km) of the re-route; the speed also follows the type of road and, through the
+volume/capacity ratio, the number of lanes.
+
+The relations have the shape of the IRC SP:30 road user cost relations, simplified to
+a quadratic in roughness and a linear term in rise and fall, with the per-class
+coefficients below. Everything is an array operation with the vehicle classes on
+axis -2 and the years on axis -1: traffic growth is one broadcast of the base volumes
+against the growth factors of every year, so a 100-year horizon with five classes is
+a single (5, 101) computation per bridge. lcc_engine does not call
+vehicle_operating_cost and free_speed itself but looks them up on the grids of voc_grids.
+"""
+import numpy as np
+
+VEHICLE_CLASSES = ("lcv", "cars", "buses", "hcv", "mcv")
+
+# Passenger car units per vehicle (IRC:64), to turn the PCU/D inputs into vehicles
+PCU_FACTORS = np.array([1.5, 1.0, 3.0, 3.0, 4.5])
+
+# Per class: (VOC on a smooth level road in INR/vehicle-km, roughness term per m/km,
+# roughness term per (m/km)^2, rise and fall term per m/km)
+VOC_COEFFICIENTS = np.array([
+    [9.0, 0.060, 0.008, 0.0025],  # LCV
+    [7.0, 0.050, 0.006, 0.0020],  # Car
+    [18.0, 0.070, 0.010, 0.0040],  # Bus
+    [22.0, 0.080, 0.012, 0.0050],  # HCV
+    [30.0, 0.090, 0.014, 0.0060],  # MCV (multi-axle)
+])
+
+# Per class: (free speed on a smooth level national highway in km/h, value of time in
+# INR per vehicle-hour)
+SPEED_AND_TIME_VALUES = np.array([
+    [60.0, 150.0],
+    [80.0, 250.0],
+    [55.0, 1400.0],  # about 40 passengers
+    [50.0, 200.0],
+    [45.0, 250.0],
+])
+
+# Roughness of a smooth road (m/km); relations grow with the roughness above it
+SMOOTH_ROUGHNESS = 2.0
+# Speed lost per m/km of roughness above SMOOTH_ROUGHNESS and per m/km of rise and fall
+SPEED_ROUGHNESS_LOSS = 0.04
+SPEED_RISE_AND_FALL_LOSS = 0.003
+# Daily capacity of one lane in PCU (IRC:64 gives 15,000 PCU/D for a two-lane road)
+LANE_CAPACITY = 7500.0
+# Share of the speed lost at capacity
+CONGESTION_LOSS = 0.5
+MINIMUM_SPEED = 10.0  # km/h
+
+
+def _classes(value):
+    # Per-class column (classes, 1) that broadcasts against inputs shaped (..., 1, years)
+    return value[:, np.newaxis]
+
+
+def vehicle_operating_cost(roughness, rise_and_fall):
+    """
+    VOC of every vehicle class.
+
+    Args:
+        roughness (numpy.ndarray): Road roughness in mm/km, shape (..., 1).
+        rise_and_fall (numpy.ndarray): Rise and fall in m/km, shape (..., 1).
+
+    Returns:
+        numpy.ndarray: INR per vehicle-km with shape (..., classes, 1).
+    """
+    excess = np.maximum(roughness[..., np.newaxis, :] / 1000.0 - SMOOTH_ROUGHNESS, 0.0)
+    rise_and_fall = rise_and_fall[..., np.newaxis, :]
+    base, linear, quadratic, hills = (_classes(column) for column in VOC_COEFFICIENTS.T)
+    return base * (1 + linear * excess + quadratic * excess ** 2) * (1 + hills * rise_and_fall)
+
+
+def free_speed(roughness, rise_and_fall):
+    """
+    Speed of every vehicle class on an uncongested national highway.
+
+    Args:
+        roughness (numpy.ndarray): Road roughness in mm/km, shape (..., 1).
+        rise_and_fall (numpy.ndarray): Rise and fall in m/km, shape (..., 1).
+
+    Returns:
+        numpy.ndarray: km/h with shape (..., classes, 1).
+    """
+    excess = np.maximum(roughness[..., np.newaxis, :] / 1000.0 - SMOOTH_ROUGHNESS, 0.0)
+    rise_and_fall = rise_and_fall[..., np.newaxis, :]
+    speed = _classes(SPEED_AND_TIME_VALUES[:, 0])
+    return speed / (1 + SPEED_ROUGHNESS_LOSS * excess + SPEED_RISE_AND_FALL_LOSS * rise_and_fall)
+
+
+def traffic_volumes(volumes, traffic_growth, years):
+    """
+    Traffic of every class in every year.
+
+    Args:
+        volumes (numpy.ndarray): Base-year PCU/D per class, shape (..., classes, 1).
+        traffic_growth (numpy.ndarray): Growth in percent per year, shape (..., 1).
+        years (numpy.ndarray): Year axis.
+
+    Returns:
+        numpy.ndarray: PCU/D with shape (..., classes, years).
+    """
+    growth = (1 + traffic_growth / 100.0) ** years
+    return volumes * growth[..., np.newaxis, :]
+
+
+def cost_per_day(volumes, number_of_lanes, road_speed_factor, reroute_distance, voc, speed):
+    """
+    Road user cost of one closure day in every year.
+
+    Args:
+        volumes (numpy.ndarray): PCU/D from traffic_volumes, shape (..., classes, years).
+        number_of_lanes (numpy.ndarray): Lanes of the re-route, shape (..., 1).
+        road_speed_factor (numpy.ndarray): Free speed factor of the road type, shape (..., 1).
+        reroute_distance (numpy.ndarray): Additional re-route distance in km, shape (..., 1).
+        voc (numpy.ndarray): vehicle_operating_cost(), shape (..., classes, 1).
+        speed (numpy.ndarray): free_speed(), shape (..., classes, 1).
+
+    Returns:
+        numpy.ndarray: INR with shape (..., years).
+    """
+    capacity = np.maximum(number_of_lanes, 1.0) * LANE_CAPACITY
+    congestion = np.minimum(volumes.sum(axis=-2) / capacity, 1.0)
+    speed = speed * road_speed_factor[..., np.newaxis, :] * (1 - CONGESTION_LOSS * congestion[..., np.newaxis, :] ** 2)
+    speed = np.maximum(speed, MINIMUM_SPEED)
+    vehicle_km = volumes / _classes(PCU_FACTORS) * reroute_distance[..., np.newaxis, :]
+    time_cost = _classes(SPEED_AND_TIME_VALUES[:, 1]) / speed
+    return (vehicle_km * (voc + time_cost)).sum(axis=-2)
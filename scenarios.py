@@ -0,0 +1,125 @@
+"""
+Side-by-side comparison of variants of a bridge, for the Compare panel.
+
+All variants are evaluated together as one lcc_engine batch, one row per variant.
+An input every variant has the same value for enters the batch as a single number
+rather than a row per variant, so every node of the calculation graph that depends
+only on such inputs (discount factors, closure years, ...) is computed once and
+broadcast to all variants. Design alternatives that only differ in their bills of
+quantities therefore cost little more to compare than one of them costs to evaluate.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+import lcc_engine
+
+HEADS = lcc_engine.COST_HEADS + (lcc_engine.TOTAL_HEAD,)
+
+
+def batch_inputs(variants):
+    """
+    Stack the inputs of several variants into one batch.
+
+    Args:
+        variants (list): Input mappings (see lcc_engine.DEFAULT_INPUTS), one per variant.
+
+    Returns:
+        dict: Input name to a float when all variants agree on it, else an array with
+            one value per variant.
+    """
+    resolved = [lcc_engine.resolve_inputs(inputs) for inputs in variants]
+    batch = {}
+    for name in lcc_engine.DEFAULT_INPUTS:
+        values = np.array([float(inputs[name]) for inputs in resolved])
+        batch[name] = float(values[0]) if (values == values[0]).all() else values
+    return batch
+
+
+@dataclass(slots=True)
+class ComparisonResult:
+    names: list  # variant names
+    years: np.ndarray  # year axis
+    yearly: np.ndarray  # discounted cash flows, (variants, cost heads, years); total last
+    shared: list  # graph nodes computed once for all variants
+
+    @property
+    def present_values(self):
+        """Present value per variant and cost head, (variants, cost heads); total last."""
+        return self.yearly.sum(axis=-1)
+
+    def difference(self, variant, baseline=0):
+        """
+        Discounted cash flow of one variant minus that of the baseline, year by year.
+
+        Args:
+            variant (int): Index of the variant.
+            baseline (int): Index of the variant compared against.
+
+        Returns:
+            numpy.ndarray: Differences with shape (cost heads, years), total last.
+        """
+        return self.yearly[variant] - self.yearly[baseline]
+
+
+class Comparison:
+    """
+    Named variants of a bridge and the result of evaluating them together.
+    """
+
+    def __init__(self):
+        self.variants = []  # (name, inputs) pairs; the first is the baseline
+        self._result = None
+
+    def add(self, name, inputs):
+        """
+        Add a variant.
+
+        Args:
+            name (str): Shown in the Compare panel.
+            inputs (dict): Engine inputs, e.g. Project.engine_inputs().
+        """
+        self.variants.append((name, dict(inputs)))
+        self._result = None
+
+    def remove(self, index):
+        del self.variants[index]
+        self._result = None
+
+    def clear(self):
+        self.variants.clear()
+        self._result = None
+
+    def evaluate(self):
+        """
+        Evaluate every variant, or return the result of the previous call if no variant
+        was added or removed since.
+
+        Returns:
+            ComparisonResult: None when there are no variants.
+        """
+        if self._result is None and self.variants:
+            self._result = compare([name for name, _ in self.variants], [inputs for _, inputs in self.variants])
+        return self._result
+
+
+def compare(names, variants):
+    """
+    Evaluate variants as one batch.
+
+    Args:
+        names (list): Variant names.
+        variants (list): Input mappings, one per variant.
+
+    Returns:
+        ComparisonResult: Discounted cash flows of every variant.
+    """
+    inputs = batch_inputs(variants)
+    values = lcc_engine.compute_nodes(inputs, ("years", "discount_factors") + lcc_engine.COST_HEADS)
+    years = values["years"]
+    flows = np.stack(np.broadcast_arrays(*(values[head] for head in lcc_engine.COST_HEADS)), axis=-2)
+    yearly = flows * values["discount_factors"][..., np.newaxis, :]
+    yearly = np.broadcast_to(yearly, (len(variants),) + yearly.shape[-2:])
+    yearly = np.concatenate([yearly, yearly.sum(axis=-2, keepdims=True)], axis=-2)
+    shared = [name for name in lcc_engine.NODES if name in values and np.ndim(values[name]) < 2]
+    return ComparisonResult(list(names), years, yearly, shared)
@@ -0,0 +1,116 @@
+"""
+One-at-a-time sensitivity of the cost heads to every life-cycle cost input.
+
+Each input is moved down and up by a step (10 % of its value by default) while the
+others keep theirs. Inputs counted in whole years (YEAR_INPUTS) move by one year
+instead: the engine places recurring events on whole years, so a 1-year inspection
+interval moved to 0.9 or 1.1 years would simply have no inspections at all. The base case and both moves of every input are stacked into
+one batch, so the whole study is a single lcc_engine.evaluate call of a few dozen
+rows and is quick enough to redo after every edit. Inputs are then ranked per cost
+head by the larger of their two changes from the base case, the order of a tornado
+chart.
+"""
+import numpy as np
+
+import lcc_engine
+
+# Move of each input, in percent of its value
+STEP = 10.0
+
+# Inputs moved by YEAR_STEP years instead, never below one year
+YEAR_INPUTS = ("study_duration", "design_life", "periodic_maintenance_interval", "routine_inspection_interval",
+               "repair_interval")
+YEAR_STEP = 1.0
+
+
+def input_label(name):
+    """Readable name of an engine input, e.g. "Discount rate"."""
+    label = name.replace("_", " ").capitalize()
+    return f"{label} (\u00b1{YEAR_STEP:g} year)" if name in YEAR_INPUTS else label
+
+
+def perturbations(base_inputs, names, step=STEP):
+    """
+    Batch of the base case followed by the low and high case of every input.
+
+    Args:
+        base_inputs (dict): Input name to float; missing inputs take their defaults.
+        names (list): Inputs to move.
+        step (float): Move in percent of each input's value, except for YEAR_INPUTS.
+
+    Returns:
+        dict: Input name to array of 1 + 2 * len(names) values. Row 0 is the base
+            case; rows 2i+1 and 2i+2 are the low and high case of names[i].
+    """
+    base_inputs = lcc_engine.resolve_inputs(base_inputs)
+    rows = 1 + 2 * len(names)
+    batch = {name: np.full(rows, float(value)) for name, value in base_inputs.items()}
+    for i, name in enumerate(names):
+        value = batch[name][0]
+        if name in YEAR_INPUTS:
+            batch[name][2 * i + 1] = max(value - YEAR_STEP, 1.0)
+            batch[name][2 * i + 2] = value + YEAR_STEP
+        else:
+            batch[name][2 * i + 1] = value * (1 - step / 100)
+            batch[name][2 * i + 2] = value * (1 + step / 100)
+    return batch
+
+
+def rank(base_inputs, names=None, step=STEP):
+    """
+    Rank inputs by their effect on every cost head.
+
+    Args:
+        base_inputs (dict): Input name to float, e.g. Project.engine_inputs().
+        names (iterable): Inputs to move; by default every input whose value is not
+            zero (a percentage of zero moves nothing).
+        step (float): Move in percent of each input's value, except for YEAR_INPUTS.
+
+    Returns:
+        dict: Cost head (and TOTAL_HEAD) -> list of (input name, present value with the
+            input low, present value with it high), largest change from the base case
+            first. Inputs that do not move the head are left out.
+    """
+    resolved = lcc_engine.resolve_inputs(base_inputs)
+    if names is None:
+        names = [name for name, value in resolved.items() if value]
+    names = list(names)
+    results = lcc_engine.evaluate(perturbations(resolved, names, step))
+    ranking = {}
+    for head in lcc_engine.COST_HEADS + (lcc_engine.TOTAL_HEAD,):
+        values = np.broadcast_to(results[head], (1 + 2 * len(names),))
+        low, high = values[1::2], values[2::2]
+        # Largest change either way; a low and high case that both lower the cost (e.g.
+        # moving a repair off the year of a reconstruction) must not look like a swing
+        change = np.maximum(np.abs(low - values[0]), np.abs(high - values[0]))
+        order = np.argsort(-change, kind="stable")
+        ranking[head] = [(names[i], float(low[i]), float(high[i])) for i in order if change[i] > 0]
+    return ranking
+
+
+def format_tornado(ranking, head=lcc_engine.TOTAL_HEAD, base=None, limit=8, step=STEP):
+    """
+    Rich-text tornado table of the inputs that move one cost head most.
+
+    Args:
+        ranking (dict): Output of rank().
+        head (str): Cost head to show.
+        base (float): Present value of the head in the base case, to show the swings
+            as a change from it; the low and high values are shown when not given.
+        limit (int): Number of inputs shown.
+        step (float): Step the ranking was made with, for the column headers; YEAR_INPUTS
+            say their own step in their label.
+
+    Returns:
+        str: HTML table, one row per input, largest swing first.
+    """
+    rows = []
+    for name, low, high in ranking[head][:limit]:
+        if base is None:
+            cells = f"<td align='right'>{low:,.0f}</td><td align='right'>{high:,.0f}</td>"
+        else:
+            cells = f"<td align='right'>{low - base:+,.0f}</td><td align='right'>{high - base:+,.0f}</td>"
+        rows.append(f"<tr><td>{input_label(name)}</td>{cells}</tr>")
+    if not rows:
+        rows.append("<tr><td>No input moves this cost yet.</td></tr>")
+    return f"<table cellspacing='4'><tr><th></th><th>-{step:g} %</th><th>+{step:g} %</th></tr>{''.join(rows)}</table>"
@@ -0,0 +1,117 @@
+"""
+Opt-in wall-clock tracing of start-up and interaction.
+
+Set the BICCA_TRACE environment variable to a file name (or call enable()) before
+starting the application. Every span is recorded and written on exit as Chrome
+trace-event JSON, which can be opened in chrome://tracing or https://ui.perfetto.dev.
+When tracing is off, spans cost a single check.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_path = None
+_events = []
+_lock = threading.Lock()
+
+
+def enable(path):
+    """
+    Start recording spans and write them to a file when the process exits.
+
+    Args:
+        path (str): Output file for the trace-event JSON.
+    """
+    global _path
+    if _path is None:
+        atexit.register(write)
+    _path = path
+
+
+def is_enabled():
+    return _path is not None
+
+
+def _record(name, start, end, args):
+    event = {
+        "name": name,
+        "cat": "bicca",
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": (end - start) * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = args
+    with _lock:
+        _events.append(event)
+
+
+@contextmanager
+def span(name, **args):
+    """
+    Record the wall-clock time spent inside a with block.
+
+    Args:
+        name (str): Name shown for the span in the trace viewer.
+        **args: Extra values attached to the span.
+    """
+    if _path is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start, time.perf_counter(), args)
+
+
+def traced(name=None):
+    """
+    Decorator recording a span for every call of a function.
+
+    Do not use it on methods connected to Qt signals that pass extra arguments
+    (such as clicked), since the wrapper hides the method's real signature from PyQt.
+
+    Args:
+        name (str): Span name; defaults to the function's qualified name.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _path is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(span_name, start, time.perf_counter(), None)
+        return wrapper
+    return decorator
+
+
+def write(path=None):
+    """
+    Write the recorded spans as Chrome trace-event JSON.
+
+    Args:
+        path (str): Output file; defaults to the one given to enable().
+    """
+    path = path or _path
+    if path is None:
+        return
+    with _lock:
+        events = list(_events)
+    with open(path, "w", encoding="utf-8") as trace_file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+
+
+if os.environ.get("BICCA_TRACE"):
+    enable(os.environ["BICCA_TRACE"])
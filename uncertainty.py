@@ -0,0 +1,234 @@
+"""
+Monte Carlo analysis of the life-cycle cost of one bridge.
+
+Usage:
+    python uncertainty.py PROJECT.bicca --vary NAME=KIND:P1,P2[,P3] [--vary ...]
+                          [--draws 50000] [--seed N] [--workers N]
+
+e.g. --vary financial.discount_rate=triangular:5,7,9 --vary carbon_price=normal:7,1.5
+
+Every input given a distribution is drawn independently; the others keep the
+project's value. No input may go below its lowest value (see lowest_value): uniform and
+triangular distributions must lie above it, and normal distributions are truncated
+there by drawing again. Inputs are named as in lcc_engine.DEFAULT_INPUTS or by their project
+model path. Draws are split into chunks, each evaluated as one lcc_engine batch,
+optionally in a process pool. Every chunk has its own random stream spawned from the
+seed, so a seeded run gives the same draws however many workers share it.
+"""
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+import lcc_engine
+
+DEFAULT_DRAWS = 50000
+
+# Draws per batch; a batch holds (draws x cost heads x years) cash flows in memory
+CHUNK_SIZE = 5000
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+
+def _normal(rng, size, mean, sd):
+    return rng.normal(mean, sd, size)
+
+
+def _lognormal(rng, size, mean, sd):
+    # Parameters of the distribution itself, not of the underlying normal
+    sigma2 = np.log1p((sd / mean) ** 2)
+    return rng.lognormal(np.log(mean) - sigma2 / 2, np.sqrt(sigma2), size)
+
+
+def _uniform(rng, size, low, high):
+    return rng.uniform(low, high, size)
+
+
+def _triangular(rng, size, low, mode, high):
+    return rng.triangular(low, mode, high, size)
+
+
+# Distribution kind -> (sampler, number of parameters)
+DISTRIBUTIONS = {
+    "normal": (_normal, 2),  # mean, standard deviation
+    "lognormal": (_lognormal, 2),  # mean, standard deviation
+    "uniform": (_uniform, 2),  # low, high
+    "triangular": (_triangular, 3),  # low, most likely, high
+}
+
+
+def lowest_value(name):
+    """
+    Lowest value an engine input can take: its lower limit in lcc_engine.INPUT_LIMITS,
+    or 0 for the rates, durations, quantities and prices without one.
+    """
+    return lcc_engine.INPUT_LIMITS.get(name, (0.0, None))[0]
+
+
+def _check_support(name, kind, parameters):
+    low = lowest_value(name)
+    if kind == "normal":
+        mean, sd = parameters
+        if sd < 0 or mean < low:
+            raise ValueError(f"The normal distribution of {name} needs a standard deviation of at least 0 "
+                             f"and a mean of at least {low:g}")
+    elif kind == "lognormal":
+        mean, sd = parameters
+        if mean <= 0 or sd < 0:
+            raise ValueError(f"The lognormal distribution of {name} needs a mean above 0 and a "
+                             f"standard deviation of at least 0")
+    elif not low <= parameters[0] <= parameters[-1] or kind == "triangular" and not (
+            parameters[0] <= parameters[1] <= parameters[2]):
+        raise ValueError(f"The {kind} distribution of {name} must have its parameters in increasing "
+                         f"order and not go below {low:g}")
+
+
+def check_distributions(distributions):
+    """
+    Validate distribution specs and resolve model paths to engine input names.
+
+    Args:
+        distributions (dict): Input name or model path -> (kind, *parameters).
+
+    Returns:
+        dict: Engine input name -> (kind, *parameters as floats).
+
+    Raises:
+        ValueError: For an unknown input or kind, a wrong number of parameters, or a
+            distribution reaching below the input's lowest value.
+    """
+    checked = {}
+    for name, (kind, *parameters) in distributions.items():
+        input_name = lcc_engine.input_name(name)
+        if input_name is None:
+            raise ValueError(f"{name} is not an input of the life-cycle cost")
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {kind!r}; use one of {', '.join(DISTRIBUTIONS)}")
+        if len(parameters) != DISTRIBUTIONS[kind][1]:
+            raise ValueError(f"A {kind} distribution takes {DISTRIBUTIONS[kind][1]} parameters")
+        parameters = tuple(float(parameter) for parameter in parameters)
+        _check_support(input_name, kind, parameters)
+        checked[input_name] = (kind,) + parameters
+    return checked
+
+
+def simulate_chunk(task):
+    """
+    Draw and evaluate one chunk.
+
+    Args:
+        task (tuple): (base inputs, checked distributions, numpy SeedSequence, draws).
+
+    Returns:
+        numpy.ndarray: Present values with shape (draws, cost heads + 1), the total last.
+    """
+    base_inputs, distributions, seed, size = task
+    rng = np.random.default_rng(seed)
+    inputs = dict(base_inputs)
+    for name, (kind, *parameters) in distributions.items():
+        sampler = DISTRIBUTIONS[kind][0]
+        values = sampler(rng, size, *parameters)
+        # Truncate at the lowest value by drawing again; only a normal distribution gets
+        # here, and with its mean above the lowest value at least half the draws are kept
+        below = values < lowest_value(name)
+        while below.any():
+            values[below] = sampler(rng, int(below.sum()), *parameters)
+            below = values < lowest_value(name)
+        inputs[name] = values
+    results = lcc_engine.evaluate(inputs)
+    heads = lcc_engine.COST_HEADS + (lcc_engine.TOTAL_HEAD,)
+    return np.column_stack([np.broadcast_to(results[head], (size,)) for head in heads])
+
+
+def simulate(base_inputs, distributions, draws=DEFAULT_DRAWS, seed=None, workers=1, chunk_size=CHUNK_SIZE):
+    """
+    Evaluate the life-cycle cost for many draws of the uncertain inputs.
+
+    Args:
+        base_inputs (dict): Inputs of the bridge, e.g. Project.engine_inputs().
+        distributions (dict): Input name or model path -> (kind, *parameters), see DISTRIBUTIONS.
+        draws (int): Number of draws.
+        seed (int): Seed for reproducible draws.
+        workers (int): Worker processes; 1 evaluates in this process.
+        chunk_size (int): Draws per batch.
+
+    Returns:
+        numpy.ndarray: Present values with shape (draws, cost heads + 1), columns in
+            lcc_engine.COST_HEADS order and the Total Life-Cycle Cost last.
+    """
+    base_inputs = lcc_engine.resolve_inputs(base_inputs)
+    distributions = check_distributions(distributions)
+    if draws <= 0:
+        return np.empty((0, len(lcc_engine.COST_HEADS) + 1))
+    sizes = [min(chunk_size, draws - start) for start in range(0, draws, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(base_inputs, distributions, chunk_seed, size) for chunk_seed, size in zip(seeds, sizes)]
+    if workers > 1 and len(tasks) > 1:
+        with Pool(min(workers, len(tasks))) as pool:
+            chunks = pool.map(simulate_chunk, tasks)
+    else:
+        chunks = [simulate_chunk(task) for task in tasks]
+    return np.concatenate(chunks)
+
+
+def percentile_bands(values, percentiles=PERCENTILES):
+    """
+    Percentiles of every cost head over the draws.
+
+    Args:
+        values (numpy.ndarray): Output of simulate().
+        percentiles (tuple): Percentiles to report.
+
+    Returns:
+        dict: Cost head (and TOTAL_HEAD) -> {percentile: present value}.
+    """
+    bands = np.percentile(values, percentiles, axis=0)
+    heads = lcc_engine.COST_HEADS + (lcc_engine.TOTAL_HEAD,)
+    return {head: dict(zip(percentiles, bands[:, index].tolist())) for index, head in enumerate(heads)}
+
+
+def _parse_vary(text):
+    name, _, spec = text.partition("=")
+    kind, _, parameters = spec.partition(":")
+    if not parameters:
+        raise argparse.ArgumentTypeError(f"expected NAME=KIND:P1,P2[,P3], got {text!r}")
+    try:
+        return name, (kind.strip().lower(),) + tuple(float(value) for value in parameters.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"parameters of {name} must be numbers") from None
+
+
+def main(argv=None):
+    import project_file  # only needed for the command line
+
+    parser = argparse.ArgumentParser(description="Monte Carlo analysis of a bridge's life-cycle cost")
+    parser.add_argument("project", help="project file (.bicca)")
+    parser.add_argument("--vary", type=_parse_vary, action="append", default=[], metavar="NAME=KIND:P1,P2[,P3]",
+                        help=f"distribution of an input; KIND is one of {', '.join(DISTRIBUTIONS)}")
+    parser.add_argument("-n", "--draws", type=int, default=DEFAULT_DRAWS)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    try:
+        base_inputs = project_file.load(args.project).engine_inputs()
+        start = time.perf_counter()
+        values = simulate(base_inputs, dict(args.vary), args.draws, args.seed, args.workers)
+    except (OSError, project_file.ProjectFileError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    bands = percentile_bands(values)
+    print(f"{'':34}" + "".join(f"{'P' + str(p):>16}" for p in PERCENTILES))
+    for head, band in bands.items():
+        print(f"{lcc_engine.COST_HEAD_LABELS[head]:34}" + "".join(f"{value:16,.0f}" for value in band.values()))
+    print(f"{len(values)} draws in {elapsed:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""
+Undo/redo history of edits to the project model.
+
+An edit is recorded as (model path, value before, value after), not as a copy of the
+project. Bills of quantities are replaced as whole lists rather than changed in place,
+so an edit of one - even a 5,000-row import - only keeps references to the old and the
+new list and undoes in one step. The lists share every row an edit did not touch, so
+an edit is charged only for the rows that differ between them. Consecutive keystrokes
+in the same field within COALESCE_SECONDS are merged into one edit. The oldest edits are dropped once the
+estimated memory of the history exceeds its budget.
+"""
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+DEFAULT_MEMORY_BUDGET = 16 * 1024 * 1024  # bytes
+COALESCE_SECONDS = 1.0
+
+# Rough size of one material row with its strings, used to estimate bills of quantities
+ROW_BYTES = 240
+
+
+def estimate_size(value):
+    """
+    Approximate memory held by a recorded value.
+
+    Args:
+        value: Float, string or component list.
+
+    Returns:
+        int: Estimated bytes.
+    """
+    if isinstance(value, list):
+        rows = sum(len(sub.materials) for component in value for sub in component.sub_components)
+        return sys.getsizeof(value) + rows * ROW_BYTES
+    return sys.getsizeof(value)
+
+
+def _pairs(before, after):
+    # Items of two lists side by side, None where one list is shorter
+    return ((before[i] if i < len(before) else None, after[i] if i < len(after) else None)
+            for i in range(max(len(before), len(after))))
+
+
+def edit_size(before, after):
+    """
+    Approximate memory an edit adds to the history.
+
+    Args:
+        before: Value before the edit.
+        after: Value after the edit.
+
+    Returns:
+        int: Estimated bytes. For component lists only the material rows that are not
+            the same objects in both lists are counted; the others are shared.
+    """
+    if not (isinstance(before, list) and isinstance(after, list)):
+        return estimate_size(before) + estimate_size(after)
+    rows = 0
+    for old, new in _pairs(before, after):
+        if old is new:
+            continue
+        for old_sub, new_sub in _pairs(old.sub_components if old else [], new.sub_components if new else []):
+            if old_sub is new_sub:
+                continue
+            old_rows = old_sub.materials if old_sub else []
+            new_rows = new_sub.materials if new_sub else []
+            shared = sum(1 for a, b in zip(old_rows, new_rows) if a is b)
+            rows += len(old_rows) + len(new_rows) - 2 * shared
+    return sys.getsizeof(before) + sys.getsizeof(after) + rows * ROW_BYTES
+
+
+@dataclass(slots=True)
+class Edit:
+    path: str
+    before: object
+    after: object
+    time: float
+    size: int
+    field: str = None  # widget the edit was typed into, for coalescing
+
+
+class UndoStack:
+    """
+    Undo and redo of model edits within a memory budget.
+
+    Args:
+        apply (callable): Called with (path, value) to put a value back into the model
+            and the widgets when an edit is undone or redone.
+        memory_budget (int): Estimated bytes the history may hold.
+        coalesce_seconds (float): Keystrokes in one field closer together than this are merged.
+    """
+
+    def __init__(self, apply, memory_budget=DEFAULT_MEMORY_BUDGET, coalesce_seconds=COALESCE_SECONDS):
+        self.apply = apply
+        self.memory_budget = memory_budget
+        self.coalesce_seconds = coalesce_seconds
+        self._undo = []  # each entry is a list of Edits undone together
+        self._redo = []
+        self._size = 0
+        self._group = None
+        self._applying = False
+
+    def push(self, path, before, after, field=None, coalesce=True):
+        """
+        Record an edit that has already been made to the model.
+
+        Args:
+            path (str): Model path that changed.
+            before: Value before the edit.
+            after: Value after the edit.
+            field (str): Widget the edit came from. Edits of a bill of quantities share
+                one path, so only edits from the same widget are coalesced.
+            coalesce (bool): Merge with the previous edit of the same field if it was recent.
+        """
+        if self._applying or before == after and not isinstance(after, list):
+            return
+        now = time.monotonic()
+        self._drop(self._redo)
+        if self._group is not None:
+            self._group.append(Edit(path, before, after, now, edit_size(before, after), field))
+            return
+
+        last = self._undo[-1] if self._undo else None
+        if (coalesce and last is not None and len(last) == 1 and last[0].path == path
+                and last[0].field == field and now - last[0].time < self.coalesce_seconds):
+            edit = last[0]
+            self._size -= edit.size
+            edit.after, edit.time = after, now
+            edit.size = edit_size(edit.before, after)
+            self._size += edit.size
+        else:
+            edit = Edit(path, before, after, now, edit_size(before, after), field)
+            self._undo.append([edit])
+            self._size += edit.size
+        self._trim()
+
+    @contextmanager
+    def group(self):
+        """
+        Record every edit pushed inside the with block as one undo step, e.g. a bulk import.
+        """
+        if self._group is not None:
+            yield
+            return
+        self._group = []
+        try:
+            yield
+        finally:
+            edits, self._group = self._group, None
+            if edits:
+                self._undo.append(edits)
+                self._size += sum(edit.size for edit in edits)
+                self._trim()
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """
+        Undo the latest step.
+
+        Returns:
+            bool: False if there was nothing to undo.
+        """
+        if not self._undo:
+            return False
+        edits = self._undo.pop()
+        self._replay(reversed(edits), "before")
+        self._redo.append(edits)
+        return True
+
+    def redo(self):
+        """
+        Redo the latest undone step.
+
+        Returns:
+            bool: False if there was nothing to redo.
+        """
+        if not self._redo:
+            return False
+        edits = self._redo.pop()
+        self._replay(edits, "after")
+        self._undo.append(edits)
+        return True
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
+
+    def memory_used(self):
+        """Estimated bytes held by the history."""
+        return self._size
+
+    def _replay(self, edits, side):
+        self._applying = True
+        try:
+            for edit in edits:
+                self.apply(edit.path, getattr(edit, side))
+        finally:
+            self._applying = False
+
+    def _drop(self, steps):
+        for edits in steps:
+            self._size -= sum(edit.size for edit in edits)
+        steps.clear()
+
+    def _trim(self):
+        # Always keep the latest step, even if it alone is over budget
+        while self._size > self.memory_budget and len(self._undo) > 1:
+            self._size -= sum(edit.size for edit in self._undo.pop(0))
@@ -0,0 +1,182 @@
+"""
+Content-addressed version history behind File -> Version History.
+
+A version is a manifest naming one chunk per section of the project, with every bill
+of quantities (project_model.BOQ_PATHS) in a chunk of its own. Chunks are stored
+zlib-compressed under the SHA-256 of their contents, so a section that did not change
+between versions is stored once however many versions refer to it, and saving a
+version only writes the chunks that changed. Versions are listed from a small
+append-only index, one JSON line per version:
+
+    <root>/versions.jsonl
+    <root>/objects/ab/cdef0123...
+"""
+import hashlib
+import json
+import os
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import asdict, fields
+
+from project_model import Project, SECTIONS, BOQ_PATHS, section_from_dict, section_key
+
+INDEX_NAME = "versions.jsonl"
+
+# Decoded chunks kept in memory, so restoring neighbouring versions rereads little
+CHUNK_CACHE_SIZE = 64
+
+
+def _encode(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def snapshot_chunks(project, names=None):
+    """
+    Serialise a project into chunks.
+
+    Args:
+        project (Project): Project to serialise.
+        names (set): Only build these chunks; all of them by default.
+
+    Returns:
+        dict: Chunk name to bytes.
+    """
+    chunks = {}
+    for section_name in SECTIONS:
+        section = getattr(project, section_name)
+        scalars = {}
+        for f in fields(section):
+            value = getattr(section, f.name)
+            path = f"{section_name}.{f.name}"
+            if path in BOQ_PATHS:
+                if names is None or path in names:
+                    chunks[path] = _encode([asdict(component) for component in value])
+            else:
+                scalars[f.name] = value
+        if scalars and (names is None or section_name in names):
+            chunks[section_name] = _encode(scalars)
+    return chunks
+
+
+class VersionStore:
+    """
+    Version history of one project.
+
+    Args:
+        root (str): Directory of the store; created on the first commit.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._versions = None
+        self._chunks = OrderedDict()
+
+    @staticmethod
+    def for_project(project_path):
+        """
+        The store kept next to a project file, "<file>.versions".
+        """
+        return VersionStore(project_path + ".versions")
+
+    def _object_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+    def _put(self, data):
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary_path = path + ".tmp"
+            with open(temporary_path, "wb") as object_file:
+                object_file.write(zlib.compress(data))
+            os.replace(temporary_path, path)
+        return digest
+
+    def _get(self, digest):
+        if digest in self._chunks:
+            self._chunks.move_to_end(digest)
+            return self._chunks[digest]
+        with open(self._object_path(digest), "rb") as object_file:
+            value = json.loads(zlib.decompress(object_file.read()))
+        self._chunks[digest] = value
+        if len(self._chunks) > CHUNK_CACHE_SIZE:
+            self._chunks.popitem(last=False)
+        return value
+
+    def versions(self):
+        """
+        Every saved version, oldest first.
+
+        Returns:
+            list: Dicts with "id", "time" (seconds since the epoch), "label" and "manifest".
+        """
+        if self._versions is None:
+            self._versions = []
+            try:
+                with open(os.path.join(self.root, INDEX_NAME), "rb") as index_file:
+                    for line in index_file:
+                        try:
+                            self._versions.append(json.loads(line))
+                        except ValueError:
+                            break  # torn write at the end of the index
+            except FileNotFoundError:
+                pass
+        return self._versions
+
+    def commit(self, project, label="", changed=None):
+        """
+        Save a version of a project.
+
+        Args:
+            project (Project): Project to save.
+            label (str): Description shown in the version list.
+            changed (iterable): Model paths edited since the previous version. Chunks no
+                path falls into are taken over from the previous version without being
+                serialised. By default every chunk is serialised and hashed.
+
+        Returns:
+            dict: The new version, or the latest one if nothing changed.
+        """
+        versions = self.versions()
+        previous = self._get(versions[-1]["manifest"]) if versions else {}
+        names = None
+        if changed is not None and previous:
+            names = {section_key(path) for path in changed}
+        manifest = dict(previous) if names is not None else {}
+        for name, data in snapshot_chunks(project, names).items():
+            manifest[name] = self._put(data)
+
+        manifest_digest = self._put(_encode(manifest))
+        if versions and versions[-1]["manifest"] == manifest_digest:
+            return versions[-1]
+
+        version = {"id": len(versions) + 1, "time": time.time(), "label": label, "manifest": manifest_digest}
+        with open(os.path.join(self.root, INDEX_NAME), "ab") as index_file:
+            index_file.write(_encode(version) + b"\n")
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        versions.append(version)
+        return version
+
+    def restore(self, version_id):
+        """
+        Rebuild the project as it was in a version.
+
+        Args:
+            version_id (int): "id" of a version from versions().
+
+        Returns:
+            Project: The project at that version.
+        """
+        version = self.versions()[version_id - 1]
+        manifest = self._get(version["manifest"])
+        project = Project()
+        for section_name, section_class in SECTIONS.items():
+            data = dict(self._get(manifest[section_name])) if section_name in manifest else {}
+            for path in BOQ_PATHS:
+                section, name = path.split(".")
+                if section == section_name and path in manifest:
+                    data[name] = self._get(manifest[path])
+            setattr(project, section_name, section_from_dict(section_class, data))
+        return project
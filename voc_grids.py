@@ -0,0 +1,145 @@
+"""
+Precomputed road user cost relations over road roughness x rise and fall.
+
+The vehicle operating cost and free speed of every vehicle class (road_user_cost)
+depend non-linearly on the roughness and rise and fall of the re-route. They are
+evaluated once on a dense grid of both and looked up by bilinear interpolation from
+then on, so the road user cost, sensitivity sweeps and Monte Carlo draws never
+evaluate the relations themselves. Values outside the grid are taken at its edge.
+
+The grids are saved to GRID_DIR under a name holding GRID_FORMAT and a hash of the
+relations' coefficients, source code and grid axes. Changing any of them gives a new
+hash, so stale grids are never read: the grids are rebuilt on the next use and replace
+the files of the same GRID_FORMAT. Files of other formats, which another installed
+version may still use, are left alone.
+"""
+import hashlib
+import inspect
+import os
+import re
+from functools import lru_cache
+
+import numpy as np
+
+import road_user_cost
+
+GRID_DIR = os.environ.get("BICCA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".bicca", "cache"))
+# Version of the file name and layout; raise it when either changes
+GRID_FORMAT = 1
+GRID_PREFIX = f"voc_grids_v{GRID_FORMAT}_"
+
+# Grid axes: road roughness in mm/km and rise and fall in m/km
+ROUGHNESS_AXIS = np.linspace(0.0, 15000.0, 151)
+RISE_AND_FALL_AXIS = np.linspace(0.0, 150.0, 76)
+
+# Relations tabulated on the grids: name -> function of (roughness, rise and fall)
+# returning values of shape (..., classes, 1)
+RELATIONS = {
+    "vehicle_operating_cost": road_user_cost.vehicle_operating_cost,
+    "free_speed": road_user_cost.free_speed,
+}
+
+
+def source_hash():
+    """
+    Hash of everything the grids are computed from.
+
+    Returns:
+        str: Hex digest of the coefficients, the source code of the relations and of
+            build_grids, and the grid axes.
+    """
+    digest = hashlib.sha256()
+    for name in ("VOC_COEFFICIENTS", "SPEED_AND_TIME_VALUES", "SMOOTH_ROUGHNESS",
+                 "SPEED_ROUGHNESS_LOSS", "SPEED_RISE_AND_FALL_LOSS"):
+        digest.update(np.asarray(getattr(road_user_cost, name), dtype="<f8").tobytes())
+    for name, function in dict(RELATIONS, build_grids=build_grids).items():
+        digest.update(name.encode())
+        try:
+            digest.update(inspect.getsource(function).encode())
+        except (OSError, TypeError):  # no source, e.g. in a frozen build; the coefficients still count
+            pass
+    digest.update(ROUGHNESS_AXIS.astype("<f8").tobytes())
+    digest.update(RISE_AND_FALL_AXIS.astype("<f8").tobytes())
+    return digest.hexdigest()
+
+
+def grid_path():
+    """File the grids of the current source_hash() are saved in."""
+    return os.path.join(GRID_DIR, f"{GRID_PREFIX}{source_hash()[:16]}.npz")
+
+
+def build_grids():
+    """
+    Evaluate every relation on the grid.
+
+    Returns:
+        dict: Relation name -> array of shape (roughness, rise and fall, classes).
+    """
+    roughness = ROUGHNESS_AXIS[:, np.newaxis, np.newaxis]
+    rise_and_fall = RISE_AND_FALL_AXIS[np.newaxis, :, np.newaxis]
+    roughness, rise_and_fall = np.broadcast_arrays(roughness, rise_and_fall)
+    # Classes last, so one lookup gathers the values of every class from adjacent memory
+    return {name: np.ascontiguousarray(relation(roughness, rise_and_fall)[..., 0])
+            for name, relation in RELATIONS.items()}
+
+
+@lru_cache(maxsize=1)
+def grids():
+    """
+    The grids, read from GRID_DIR or built and saved there on first use.
+
+    Returns:
+        dict: Relation name -> read-only array of shape (roughness, rise and fall, classes).
+    """
+    path = grid_path()
+    try:
+        with np.load(path) as saved:
+            tables = {name: saved[name] for name in RELATIONS}
+    except (OSError, KeyError, ValueError):
+        tables = build_grids()
+        try:
+            os.makedirs(GRID_DIR, exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                np.savez(file, **tables)
+            os.replace(temporary, path)
+            stale = re.compile(re.escape(GRID_PREFIX) + r"[0-9a-f]{16}\.npz")
+            for name in os.listdir(GRID_DIR):  # grids of older coefficients are never read again
+                if stale.fullmatch(name) and name != os.path.basename(path):
+                    os.remove(os.path.join(GRID_DIR, name))
+        except OSError:
+            pass  # a read-only cache directory only costs rebuilding the grids next time
+    for table in tables.values():
+        table.setflags(write=False)
+    return tables
+
+
+def _cell(values, axis):
+    # Index of the grid cell holding each value and the position inside it (0..1); the
+    # axes are evenly spaced, so this is arithmetic rather than a search
+    position = np.clip((values - axis[0]) / (axis[1] - axis[0]), 0, len(axis) - 1)
+    index = np.minimum(position.astype(int), len(axis) - 2)
+    return index, position - index
+
+
+def interpolate(name, roughness, rise_and_fall):
+    """
+    Bilinear interpolation of a tabulated relation.
+
+    Args:
+        name (str): Key of RELATIONS.
+        roughness (numpy.ndarray): Road roughness in mm/km, shape (..., 1).
+        rise_and_fall (numpy.ndarray): Rise and fall in m/km, shape (..., 1).
+
+    Returns:
+        numpy.ndarray: Values with shape (..., classes, 1), as the relation returns them.
+    """
+    table = grids()[name]
+    roughness, rise_and_fall = np.broadcast_arrays(roughness, rise_and_fall)
+    i, u = _cell(roughness, ROUGHNESS_AXIS)
+    j, v = _cell(rise_and_fall, RISE_AND_FALL_AXIS)
+    u, v = u[..., np.newaxis], v[..., np.newaxis]
+    # i, j, u and v have shape (..., 1) and the lookups (..., 1, classes)
+    values = ((1 - u) * (1 - v) * table[i, j] + u * (1 - v) * table[i + 1, j]
+              + (1 - u) * v * table[i, j + 1] + u * v * table[i + 1, j + 1])
+    return np.swapaxes(values, -1, -2)